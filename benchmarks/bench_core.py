@@ -0,0 +1,296 @@
+"""Benchmarks for the core hot paths on synthetic airline data.
+
+Generates airline route files of the requested sizes in a temporary
+directory (no network or rawdata needed), times each operation and writes a
+JSON report. With --baseline the report is compared against an earlier one
+and the script exits with 1 if any benchmark got slower than --threshold.
+
+    python benchmarks/bench_core.py --sizes 1000 10000 100000 --output bench.json
+    python benchmarks/bench_core.py --baseline bench.json
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import logic, route_index, route_loader
+from core.logic import filter_routes, verify_route, genFlightNum
+from core.route_loader import load_routes, build_airport_index, get_airport_choices
+from core.route_index import build_route_index, save_route_index, load_route_index, find_airlines_for_pair
+from core.route_store import convert_route_file
+from core.route_table import get_aircraft_bits
+
+REPORT_VERSION = 1
+DEFAULT_SIZES = [1000, 10000, 100000]
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 1.25
+# Per-call operations are timed over this many calls so timer resolution doesn't dominate
+CALLS_PER_RUN = 1000
+BENCH_AIRCRAFT = "A320"
+
+
+def synthetic_airline(size, seed=0):
+    """Return airline data with `size` random routes over a network scaled to match."""
+    rng = random.Random(seed)
+    airport_count = min(4000, max(40, int(size ** 0.5 * 2)))
+    airports = []
+    for i in range(airport_count):
+        iata = "".join(chr(65 + (i // 26 ** k) % 26) for k in (2, 1, 0))
+        airports.append((iata, f"Synthetic {iata} International", "Z" + iata))
+
+    aircraft_count = len(get_aircraft_bits())
+    routes = []
+    for _ in range(size):
+        origin, dest = rng.sample(airports, 2)
+        minutes = rng.randint(35, 900)
+        support_mask = 0
+        for bit in rng.sample(range(aircraft_count), min(4, aircraft_count)):
+            support_mask |= 1 << bit
+        route = {
+            "from": origin[0],
+            "from_name": origin[1],
+            "from_icao": origin[2],
+            "to": dest[0],
+            "to_name": dest[1],
+            "to_icao": dest[2],
+            "distance_km": minutes * 13,
+            "estimated_time_min": minutes,
+            "support_mask": support_mask
+        }
+        if minutes >= 60:
+            route["estimated_time"] = {"hours": minutes // 60, "minutes": minutes % 60}
+        routes.append(route)
+
+    return {
+        "airline": f"Bench {size}",
+        "iata": "ZZ",
+        "icao": "ZZZ",
+        "callsign": "BENCH",
+        "routes": routes
+    }
+
+
+def write_airline_files(workdir, sizes):
+    """Write JSON and binary copies of each synthetic airline; return {name: route file}."""
+    airline_files = {}
+    for size in sizes:
+        airline_data = synthetic_airline(size)
+        for variant in ("json", "binary"):
+            variant_dir = os.path.join(workdir, variant)
+            os.makedirs(variant_dir, exist_ok=True)
+            route_file = os.path.join(variant_dir, f"bench_{size}_routes.json")
+            with open(route_file, "w", encoding="utf-8") as f:
+                json.dump(airline_data, f)
+            if variant == "binary":
+                convert_route_file(route_file)
+            airline_files[f"Bench {size} {variant}"] = route_file
+    return airline_files
+
+
+def timed(fn, repeat, calls=1):
+    # Like timeit, keep the collector out of the timed region: how much it runs
+    # depends on what else is alive (e.g. larger sizes) and makes runs incomparable
+    times = []
+    gc.collect()
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(calls):
+                fn()
+            times.append((time.perf_counter() - start) / calls)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return {
+        "min_s": min(times),
+        "median_s": statistics.median(times),
+        "runs": repeat,
+        "calls_per_run": calls
+    }
+
+
+def cycle(values):
+    """Return a callable yielding values round-robin, so per-call benchmarks vary their inputs."""
+    state = {"i": -1}
+
+    def next_value():
+        state["i"] = (state["i"] + 1) % len(values)
+        return values[state["i"]]
+    return next_value
+
+
+def bench_size(size, repeat, workdir):
+    results = {}
+    json_airline = f"Bench {size} json"
+    binary_airline = f"Bench {size} binary"
+    load_repeat = repeat if size < 1000000 else min(repeat, 2)
+
+    results["load_routes.json"] = timed(lambda: load_routes(json_airline, use_cache=False), load_repeat)
+    results["load_routes.binary"] = timed(lambda: load_routes(binary_airline, use_cache=False), load_repeat)
+    load_routes(json_airline)
+    results["load_routes.cached"] = timed(lambda: load_routes(json_airline), repeat, CALLS_PER_RUN)
+
+    routes = load_routes(json_airline)
+    results["build_airport_index"] = timed(lambda: build_airport_index(routes), repeat)
+    airport_index = build_airport_index(routes)
+    results["get_airport_choices"] = timed(lambda: get_airport_choices(airport_index), repeat)
+
+    rng = random.Random(1)
+    origins = rng.sample(sorted(routes.by_origin), min(100, len(routes.by_origin)))
+    # Build the column arrays outside the timed region, as the GUI does on airline load
+    filter_routes(routes, origins[0], BENCH_AIRCRAFT, json_airline)
+    next_origin = cycle(origins)
+    results["filter_routes"] = timed(
+        lambda: filter_routes(routes, next_origin(), BENCH_AIRCRAFT, json_airline, max_time=300),
+        repeat, CALLS_PER_RUN
+    )
+
+    sample = [routes[i] for i in rng.sample(range(len(routes)), min(100, len(routes)))]
+    pairs = [(route["from"], route["to"]) for route in sample]
+    pairs += [(route["from"], "QQQ") for route in sample[:20]]
+    verify_route(routes, *pairs[-1], BENCH_AIRCRAFT, json_airline)  # builds by_pair and by_destination
+    next_pair = cycle(pairs)
+    results["verify_route"] = timed(
+        lambda: verify_route(routes, *next_pair(), BENCH_AIRCRAFT, json_airline),
+        repeat, CALLS_PER_RUN
+    )
+
+    next_icao = cycle([route["from_icao"] for route in sample])
+    results["genFlightNum"] = timed(lambda: genFlightNum(json_airline, next_icao()), repeat, CALLS_PER_RUN)
+
+    icao_pairs = [(route["from_icao"], route["to_icao"]) for route in sample]
+    next_icao_pair = cycle(icao_pairs)
+    results["find_matching_airlines"] = timed(
+        lambda: find_airlines_for_pair(*next_icao_pair(), BENCH_AIRCRAFT),
+        repeat, CALLS_PER_RUN
+    )
+
+    return {f"{name}[{size}]": result for name, result in results.items()}
+
+
+def run_benchmarks(sizes, repeat=DEFAULT_REPEAT, workdir=None):
+    """Run every benchmark for each size and return the report dict."""
+    saved = (route_loader._airline_files, logic._flight_number_config, logic._flight_number_tables,
+             route_index._route_index, route_index._route_index_path)
+
+    with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+        try:
+            airline_files = write_airline_files(tmp, sizes)
+            route_loader._airline_files = airline_files
+            route_loader.get_route_cache().clear()
+
+            logic._flight_number_tables = None
+            logic._flight_number_config = {
+                name.lower(): {
+                    "prefix": "ZZZ",
+                    "icao_ranges": {"ZAAA": [[1, 99], [500, 599]], "ZAAB": [1000, 1999]},
+                    "default_range": [2000, 9999]
+                }
+                for name in airline_files
+            }
+
+            # find_airlines_for_pair reads the prebuilt index; point it at one covering the JSON airlines
+            index_path = os.path.join(tmp, "route_index.json")
+            save_route_index(build_route_index({
+                name: load_routes(name, use_cache=False)
+                for name in airline_files if name.endswith(" json")
+            }), index_path)
+            route_index._route_index = None
+            route_index._route_index_path = lambda: index_path
+            load_route_index()
+
+            results = {}
+            for size in sizes:
+                results.update(bench_size(size, repeat, tmp))
+                route_loader.get_route_cache().clear()
+        finally:
+            (route_loader._airline_files, logic._flight_number_config, logic._flight_number_tables,
+             route_index._route_index, route_index._route_index_path) = saved
+            route_loader.get_route_cache().clear()
+
+    return {
+        "version": REPORT_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sizes": list(sizes),
+        "repeat": repeat,
+        "results": results
+    }
+
+
+def compare_reports(report, baseline, threshold=DEFAULT_THRESHOLD):
+    """Return (name, baseline_s, current_s, ratio, regressed) for benchmarks present in both."""
+    rows = []
+    for name, result in report["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            continue
+        ratio = result["min_s"] / base["min_s"] if base["min_s"] else 1.0
+        rows.append((name, base["min_s"], result["min_s"], ratio, ratio > threshold))
+    return rows
+
+
+def format_seconds(seconds):
+    if seconds >= 1:
+        return f"{seconds:.2f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds * 1e6:.1f} us"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark core route operations on synthetic data")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="Routes per synthetic airline (default: 1000 10000 100000; up to 1000000)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed runs per benchmark")
+    parser.add_argument("--output", help="Write the JSON report here")
+    parser.add_argument("--baseline", help="Compare against this earlier report")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Slowdown ratio that counts as a regression (default: 1.25)")
+    parser.add_argument("--workdir", help="Directory for the temporary synthetic files")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.sizes, args.repeat, args.workdir)
+
+    print(f"{'benchmark':<40} {'min':>12} {'median':>12}")
+    for name, result in report["results"].items():
+        print(f"{name:<40} {format_seconds(result['min_s']):>12} {format_seconds(result['median_s']):>12}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.output}")
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    rows = compare_reports(report, baseline, args.threshold)
+
+    print(f"\n{'benchmark':<40} {'baseline':>12} {'current':>12} {'ratio':>7}")
+    for name, base_s, current_s, ratio, regressed in rows:
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{name:<40} {format_seconds(base_s):>12} {format_seconds(current_s):>12} {ratio:>6.2f}x{flag}")
+
+    regressions = [row for row in rows if row[4]]
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) slower than {args.threshold:.2f}x the baseline")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+"""Compare full and streaming parses of the VATSIM v3 feed.
+
+Times json.loads of the whole document against read_vatsim_feed, which only
+builds the general and controllers sections, and records the peak memory of
+each with tracemalloc. Pass --feed to use a recorded vatsim-data.json;
+otherwise a synthetic feed of a busy evening's size is generated.
+
+    python benchmarks/bench_vatsim_feed.py --feed vatsim-data.json --output feed_bench.json
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.json_stream import ChunkReader
+from core.vatsim import VatsimSnapshot, read_vatsim_feed, FEED_CHUNK_SIZE
+
+DEFAULT_PILOTS = 2500
+DEFAULT_CONTROLLERS = 250
+DEFAULT_REPEAT = 5
+FACILITIES = ["DEL", "GND", "TWR", "APP", "DEP", "CTR", "ATIS"]
+
+
+def synthetic_feed(pilots=DEFAULT_PILOTS, controllers=DEFAULT_CONTROLLERS, seed=0):
+    """Return a feed dict shaped like vatsim-data.json v3."""
+    rng = random.Random(seed)
+    airports = ["".join(rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ") for _ in range(4)) for _ in range(600)]
+
+    def flight_plan():
+        return {
+            "flight_rules": "I",
+            "aircraft": "A20N/M-SDE2E3FGHIJ1RWXY/LB1",
+            "aircraft_faa": "H/A20N/L",
+            "aircraft_short": "A20N",
+            "departure": rng.choice(airports),
+            "arrival": rng.choice(airports),
+            "alternate": rng.choice(airports),
+            "cruise_tas": "450",
+            "altitude": str(rng.randrange(240, 410, 10) * 100),
+            "deptime": "1200",
+            "enroute_time": "0215",
+            "fuel_time": "0400",
+            "remarks": "PBN/A1B1C1D1O1S2 DOF/250101 REG/GABCD EET/EGTT0015 OPR/TEST PER/C RMK/TCAS /V/",
+            "route": " ".join(rng.choice(airports) + str(rng.randint(1, 9)) for _ in range(rng.randint(5, 30))),
+            "revision_id": rng.randint(1, 5),
+            "assigned_transponder": f"{rng.randint(0, 7777):04d}"
+        }
+
+    return {
+        "general": {
+            "version": 3,
+            "update_timestamp": "2025-01-01T12:00:00.0000000Z",
+            "connected_clients": pilots + controllers,
+            "unique_users": pilots + controllers
+        },
+        "pilots": [
+            {
+                "cid": 1000000 + i,
+                "name": f"Pilot {i}",
+                "callsign": f"TST{i}",
+                "server": "GERMANY",
+                "pilot_rating": 0,
+                "military_rating": 0,
+                "latitude": rng.uniform(-60, 70),
+                "longitude": rng.uniform(-180, 180),
+                "altitude": rng.randint(0, 41000),
+                "groundspeed": rng.randint(0, 520),
+                "transponder": f"{rng.randint(0, 7777):04d}",
+                "heading": rng.randint(0, 359),
+                "qnh_i_hg": 29.92,
+                "qnh_mb": 1013,
+                "flight_plan": flight_plan() if rng.random() < 0.85 else None,
+                "logon_time": "2025-01-01T10:00:00.0000000Z",
+                "last_updated": "2025-01-01T12:00:00.0000000Z"
+            }
+            for i in range(pilots)
+        ],
+        "controllers": [
+            {
+                "cid": 2000000 + i,
+                "name": f"Controller {i}",
+                "callsign": f"{rng.choice(airports)}_{rng.choice(FACILITIES)}",
+                "frequency": f"1{rng.randint(18, 36)}.{rng.randint(0, 999):03d}",
+                "facility": rng.randint(1, 6),
+                "rating": rng.randint(2, 12),
+                "server": "UK",
+                "visual_range": 50,
+                "text_atis": ["Welcome to the position", "Charts at example.com"],
+                "last_updated": "2025-01-01T12:00:00.0000000Z",
+                "logon_time": "2025-01-01T11:00:00.0000000Z"
+            }
+            for i in range(controllers)
+        ],
+        "atis": [],
+        "servers": [{"ident": "UK", "hostname_or_ip": "uk.example", "location": "London", "name": "UK"}],
+        "prefiles": [{"cid": 3000000 + i, "callsign": f"PRE{i}", "flight_plan": flight_plan()} for i in range(pilots // 10)],
+        "facilities": [{"id": i, "short": name} for i, name in enumerate(FACILITIES)]
+    }
+
+
+def parse_full(body):
+    return VatsimSnapshot.from_feed(json.loads(body))
+
+
+def parse_streaming(body):
+    chunks = (body[i:i + FEED_CHUNK_SIZE] for i in range(0, len(body), FEED_CHUNK_SIZE))
+    return VatsimSnapshot.from_feed(read_vatsim_feed(ChunkReader(chunks)))
+
+
+def measure(parse, body, repeat):
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        parse(body)
+        times.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    parse(body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"min_s": min(times), "median_s": statistics.median(times), "peak_bytes": peak}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark full vs streaming VATSIM feed parsing")
+    parser.add_argument("--feed", help="Recorded vatsim-data.json to parse (default: synthetic feed)")
+    parser.add_argument("--pilots", type=int, default=DEFAULT_PILOTS, help="Pilots in the synthetic feed")
+    parser.add_argument("--controllers", type=int, default=DEFAULT_CONTROLLERS, help="Controllers in the synthetic feed")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed runs per parser")
+    parser.add_argument("--output", help="Write the JSON report here")
+    args = parser.parse_args(argv)
+
+    if args.feed:
+        with open(args.feed, "rb") as f:
+            body = f.read()
+    else:
+        body = json.dumps(synthetic_feed(args.pilots, args.controllers)).encode("utf-8")
+
+    full = parse_full(body)
+    streaming = parse_streaming(body)
+    if full.controllers != streaming.controllers or full.update_timestamp != streaming.update_timestamp:
+        print("Streaming parse does not match the full parse", file=sys.stderr)
+        return 1
+
+    results = {
+        "full": measure(parse_full, body, args.repeat),
+        "streaming": measure(parse_streaming, body, args.repeat)
+    }
+    print(f"Feed: {len(body) / 1e6:.1f} MB, {len(full.controllers)} controllers")
+    print(f"{'parser':<12} {'min':>10} {'median':>10} {'peak memory':>12}")
+    for name, result in results.items():
+        print(f"{name:<12} {result['min_s'] * 1e3:>8.1f}ms {result['median_s'] * 1e3:>8.1f}ms "
+              f"{result['peak_bytes'] / 1e6:>10.1f}MB")
+    print(f"Speed-up {results['full']['min_s'] / results['streaming']['min_s']:.2f}x, "
+          f"peak memory {results['streaming']['peak_bytes'] / results['full']['peak_bytes']:.0%} of the full parse")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"feed_bytes": len(body), "controllers": len(full.controllers), "results": results}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,35 +1,27 @@
 import json
 import csv
 import os
+import hashlib
 import requests
+from requests.adapters import HTTPAdapter
 import re
+import unicodedata
 import logging
 import argparse
+import time
+import threading
+import difflib
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from math import ceil
 from datetime import datetime
 from pathlib import Path
-
-parser = argparse.ArgumentParser(description='Build airline route data and configurations')
-parser.add_argument('-nomedia', '--no-media', action='store_true',
-                    help='Skip downloading logos from GitHub')
-parser.add_argument('-verify', '--verify', action='store_true',
-                    help='Verify route coverage and exit')
-parser.add_argument('-fixmedia', '--fix-media', action='store_true',
-                    help='Attempts to find missing media for present routes.')
-args = parser.parse_args()
-
-
-os.makedirs("logs", exist_ok=True)
-log_filename = f"logs/buildData_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_filename, encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
+from core.json_stream import iter_json_object, write_json_atomic
+from core.route_index import build_route_index, save_route_index
+from core.lookups import build_airline_lookup, build_airport_catalog, save_lookup
+from core.route_store import convert_route_file, route_store_path
 
 logger = logging.getLogger(__name__)
 
@@ -39,10 +31,24 @@ INPUT_FILE = "rawdata/airline_routes.json"
 AIRPORTS_CSV = "rawdata/airports.csv"
 VALID_AIRLINES_FILE = "rawdata/ValidAirlines.json"
 AIRLINES_DATABASE_FILE = "rawdata/airlines.json"
+AIRCRAFT_SUPPORT_FILE = "rawdata/aircraft_support.json"
 
 CONFIG_FLIGHT_NUMBERS = "config/flight_numbers.json"
 CONFIG_AIRLINE_FILES = "config/airline_files.json"
 CONFIG_AIRLINE_LOGOS = "config/airline_logos.json"
+CONFIG_AIRCRAFT_BITS = "config/aircraft_bits.json"
+
+BUILD_MANIFEST = "data/build_manifest.json"
+BUILD_MANIFEST_VERSION = 2
+
+CONFIG_ROUTE_INDEX = "config/route_index.json"
+CONFIG_AIRLINE_LOOKUP = "config/airline_lookup.json"
+CONFIG_AIRPORT_CATALOG = "config/airport_catalog.json"
+# Built from every airline's routes at the end of a build rather than per airline
+SHARED_OUTPUTS = (CONFIG_ROUTE_INDEX, CONFIG_AIRLINE_LOOKUP, CONFIG_AIRPORT_CATALOG)
+
+ORIGINS_PER_BATCH = 64
+ROUTE_FLUSH_EVERY = 500
 
 DEFAULT_FLIGHT_NUMBER_RANGE = [1000, 9999]
 
@@ -108,6 +114,12 @@ MAJOR_AIRPORTS = {
 
 LOGO_REPO_URL = "https://raw.githubusercontent.com/Jxck-S/airline-logos/refs/heads/main/avcodes_banners/{icao}.png"
 HEADERS = {"User-Agent": "MSFSRouteCreator/1.0 (contact: @hexif)"}
+
+LOGO_VALIDATORS_FILE = "assets/logo_validators.json"
+LOGO_DOWNLOAD_WORKERS = 8
+LOGO_RETRIES = 3
+LOGO_BACKOFF_SECONDS = 0.5
+LOGO_RETRY_STATUSES = {429, 500, 502, 503, 504}
 #endregion
 
 #region Logo Fetching
@@ -127,31 +139,135 @@ def check_existing_logo(airline_name):
         return None
 
 
-def download_logo(url, airline_name):
-    try:
-        os.makedirs("assets", exist_ok=True)
+class LogoDownloader:
+    """Downloads airline logos concurrently over one pooled HTTP session.
+
+    Connection errors, timeouts and 429/5xx responses are retried with
+    exponential backoff. The ETag and Last-Modified headers of every logo
+    are kept in LOGO_VALIDATORS_FILE, so a logo that is downloaded again is
+    revalidated with a conditional request and only transferred if it changed.
+    """
+
+    def __init__(self, url_template=LOGO_REPO_URL, assets_dir="assets", validators_file=LOGO_VALIDATORS_FILE,
+                 max_workers=LOGO_DOWNLOAD_WORKERS, retries=LOGO_RETRIES, backoff=LOGO_BACKOFF_SECONDS, timeout=30):
+        self.url_template = url_template
+        self.assets_dir = assets_dir
+        self.max_workers = max_workers
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS)
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
+        self.validators = ConfigAccumulator(validators_file)
+        self.stats = {"downloaded": 0, "not_modified": 0, "failed": 0, "bytes": 0, "requests": 0}
+        self.elapsed = 0.0
+        self._lock = threading.Lock()
+    
+    def has_validators(self, airline_name):
+        return airline_name in self.validators.data
+    
+    def _count(self, key, amount=1):
+        with self._lock:
+            self.stats[key] += amount
+    
+    def fetch(self, airline_name, airline_icao):
+        """Fetch one logo and return (filename or None, validators or None)."""
+        if not airline_icao or airline_icao == '-' or airline_icao == 'N/A':
+            return None, None
         
+        url = self.url_template.format(icao=airline_icao)
         filename = f"{airline_name}.png"
-        filepath = os.path.join("assets", filename)
+        filepath = os.path.join(self.assets_dir, filename)
+        
+        headers = {}
+        validators = self.validators.data.get(airline_name)
+        if validators and validators.get("url") == url and os.path.exists(filepath):
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
         
-        r = requests.get(url, headers=HEADERS, timeout=30)
-        r.raise_for_status()
+        for attempt in range(self.retries + 1):
+            try:
+                self._count("requests")
+                r = self.session.get(url, headers=headers, timeout=self.timeout)
+                if r.status_code in LOGO_RETRY_STATUSES and attempt < self.retries:
+                    time.sleep(self.backoff * 2 ** attempt)
+                    continue
+                if r.status_code == 304:
+                    self._count("not_modified")
+                    return filename, validators
+                r.raise_for_status()
+                
+                os.makedirs(self.assets_dir, exist_ok=True)
+                temp_path = f"{filepath}.tmp"
+                with open(temp_path, 'wb') as f:
+                    f.write(r.content)
+                os.replace(temp_path, filepath)
+                
+                self._count("downloaded")
+                self._count("bytes", len(r.content))
+                return filename, {
+                    "url": url,
+                    "etag": r.headers.get("ETag"),
+                    "last_modified": r.headers.get("Last-Modified")
+                }
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt < self.retries:
+                    time.sleep(self.backoff * 2 ** attempt)
+                    continue
+                error = e
+            except Exception as e:
+                error = e
+            
+            logger.error(f"Error downloading logo for {airline_name}: {error}")
+            break
         
-        with open(filepath, 'wb') as f:
-            f.write(r.content)
+        self._count("failed")
+        return None, None
+    
+    def download_all(self, jobs):
+        """Fetch logos for (airline name, ICAO) jobs and return {airline name: filename}."""
+        started = time.perf_counter()
+        logos = {}
         
-        return filename
-    except Exception as e:
-        logger.error(f"Error downloading logo for {airline_name}: {e}")
-        return None
-
-
-def fetch_airline_logo(airline_name, airline_icao):
-    if not airline_icao or airline_icao == '-' or airline_icao == 'N/A':
-        return None
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self.fetch, airline_name, airline_icao): airline_name
+                for airline_name, airline_icao in jobs
+            }
+            for done, future in enumerate(futures, 1):
+                airline_name = futures[future]
+                filename, validators = future.result()
+                if filename:
+                    logos[airline_name] = filename
+                    self.validators.set(airline_name, validators)
+                if done % 10 == 0:
+                    logger.info(f"Assets processed: {done}/{len(jobs)}")
+        
+        self.validators.commit()
+        self.elapsed += time.perf_counter() - started
+        return logos
+    
+    def log_summary(self):
+        kilobytes = self.stats["bytes"] / 1024
+        elapsed = max(self.elapsed, 1e-6)
+        logger.info(
+            f" Logos: {self.stats['downloaded']} downloaded, {self.stats['not_modified']} unchanged, "
+            f"{self.stats['failed']} failed ({self.stats['requests']} requests)"
+        )
+        logger.info(
+            f" Logo throughput: {kilobytes:.1f} KB in {self.elapsed:.2f}s "
+            f"({self.stats['requests'] / elapsed:.1f} requests/s, {kilobytes / elapsed:.1f} KB/s)"
+        )
     
-    url = LOGO_REPO_URL.format(icao=airline_icao)
-    return download_logo(url, airline_name)
+    def close(self):
+        self.session.close()
 #endregion
 
 #region Helpers
@@ -195,12 +311,11 @@ def supports_large(origin: str, dest: str, distance_km: float, aircraft: str) ->
 
 
 def load_aircraft_support():
-    support_path = "rawdata/aircraft_support.json"
-    if not os.path.exists(support_path):
+    if not os.path.exists(AIRCRAFT_SUPPORT_FILE):
         logger.warning("aircraft_support.json not found, using minimal aircraft set")
         return ["A320", "A388"]
     
-    with open(support_path, 'r', encoding='utf-8') as f:
+    with open(AIRCRAFT_SUPPORT_FILE, 'r', encoding='utf-8') as f:
         support_data = json.load(f)
     
     all_aircraft = set()
@@ -210,40 +325,34 @@ def load_aircraft_support():
     return sorted(list(all_aircraft))
 
 
+def update_aircraft_bits_config(aircraft_codes):
+    # Bit positions are append-only so masks in existing route files stay valid
+    bit_order = []
+    if os.path.exists(CONFIG_AIRCRAFT_BITS):
+        with open(CONFIG_AIRCRAFT_BITS, 'r', encoding='utf-8') as f:
+            bit_order = json.load(f)
+    
+    new_codes = [code for code in aircraft_codes if code not in bit_order]
+    if new_codes:
+        bit_order.extend(new_codes)
+        write_json_atomic(CONFIG_AIRCRAFT_BITS, bit_order)
+        logger.info(f" Assigned support bits to {len(new_codes)} new aircraft types")
+    
+    return {code: bit for bit, code in enumerate(bit_order)}
+
+
 def load_airlines_database():
     logger.info("Loading airlines database...")
     with open(AIRLINES_DATABASE_FILE, 'r', encoding='utf-8') as f:
         airlines_db = json.load(f)
     
-    name_to_airline = {}
-    for airline in airlines_db:
-        if airline.get('name'):
-            normalized_name = airline['name'].lower().strip()
-            name_to_airline[normalized_name] = airline
+    airline_index = AirlineNameIndex(airlines_db)
     
     logger.info(f"Loaded {len(airlines_db)} airlines from database")
-    return name_to_airline
-
-
-def find_airline_icao(airline_name, name_to_airline):
-    normalized = airline_name.lower().strip()
+    return airline_index
 
-    if normalized in name_to_airline:
-        airline = name_to_airline[normalized]
-        icao = airline.get('icao')
-        if icao and icao != 'N/A' and icao:
-            return icao
-    
-    for db_name, airline in name_to_airline.items():
-        if normalized in db_name or db_name in normalized:
-            icao = airline.get('icao')
-            if icao and icao != 'N/A' and icao:
-                return icao
-    
-    return None
 
-
-def build_flight_numbers_config(valid_airlines, name_to_airline):
+def build_flight_numbers_config(valid_airlines, airline_matches):
     logger.info("Building flight numbers configuration...")
     
     existing_config = {}
@@ -270,7 +379,8 @@ def build_flight_numbers_config(valid_airlines, name_to_airline):
                 found_count += 1
                 continue
         
-        icao = find_airline_icao(airline_name, name_to_airline)
+        airline = airline_matches.get(airline_name.strip())
+        icao = airline['icao'] if airline and has_airline_code(airline.get('icao')) else None
         
         if icao:
             flight_numbers[normalized_key] = {
@@ -286,338 +396,966 @@ def build_flight_numbers_config(valid_airlines, name_to_airline):
     logger.info(f" Preserved {preserved_count} manually configured airlines")
     logger.info(f" Missing ICAO codes for {len(not_found)} airlines")
     
-    os.makedirs("config", exist_ok=True)
-    with open(CONFIG_FLIGHT_NUMBERS, 'w', encoding='utf-8') as f:
-        json.dump(flight_numbers, f, indent=2)
+    write_json_atomic(CONFIG_FLIGHT_NUMBERS, flight_numbers)
     
     logger.info(f" Saved flight numbers configuration to {CONFIG_FLIGHT_NUMBERS}")
     return flight_numbers
 
 
-def update_airline_files_config(airline_name, route_file):
-    if os.path.exists(CONFIG_AIRLINE_FILES):
-        with open(CONFIG_AIRLINE_FILES, 'r', encoding='utf-8') as f:
-            airline_files = json.load(f)
-    else:
-        airline_files = {}
-    
-    airline_files[airline_name] = route_file
-    
-    with open(CONFIG_AIRLINE_FILES, 'w', encoding='utf-8') as f:
-        json.dump(airline_files, f, indent=2)
+class ConfigAccumulator:
+    """Collects updates to a {key: value} JSON config and writes them once.
 
+    The existing config is read on creation, so entries that are not
+    updated this run are kept. Nothing reaches disk until commit().
+    """
 
-def update_airline_logos_config(airline_name, logo_filename):
-    if os.path.exists(CONFIG_AIRLINE_LOGOS):
-        with open(CONFIG_AIRLINE_LOGOS, 'r', encoding='utf-8') as f:
-            airline_logos = json.load(f)
-    else:
-        airline_logos = {}
+    def __init__(self, path):
+        self.path = path
+        self.data = {}
+        self.dirty = False
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                self.data = json.load(f)
     
-    airline_logos[airline_name] = logo_filename
+    def set(self, key, value):
+        if self.data.get(key) != value:
+            self.data[key] = value
+            self.dirty = True
     
-    with open(CONFIG_AIRLINE_LOGOS, 'w', encoding='utf-8') as f:
-        json.dump(airline_logos, f, indent=2)
+    def commit(self):
+        if self.dirty:
+            write_json_atomic(self.path, self.data)
+            self.dirty = False
 
 
-def save_airline_routes(airline_name, iata, icao, callsign, routes, output_file, skip_media=False):
-    os.makedirs("data", exist_ok=True)
-    
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump({
-            "airline": airline_name,
-            "iata": iata,
-            "icao": icao,
-            "callsign": callsign,
-            "routes": routes
-        }, f, indent=2)
+def register_airline_routes(airline_name, output_file, airline_files, airline_logos,
+                            skip_media=False, write_binary=False):
+    """Record the airline's route file and logo; returns True if its logo still needs downloading."""
+    if write_binary:
+        convert_route_file(output_file)
     
-    update_airline_files_config(airline_name, output_file)
+    airline_files.set(airline_name, output_file)
     
     if skip_media:
-        return
+        return False
     
     existing_logo = check_existing_logo(airline_name)
     if existing_logo:
-        update_airline_logos_config(airline_name, existing_logo)
-    else:
-        logo_filename = fetch_airline_logo(airline_name, icao)
-        if logo_filename:
-            update_airline_logos_config(airline_name, logo_filename)
+        airline_logos.set(airline_name, existing_logo)
+        return False
+    return True
 
 #endregion
 
-#region main
 
-logger.info("=" * 60)
-logger.info("Starting MSFS Route Creator Data Build")
-logger.info("=" * 60)
+#region Airline Matching
 
-logger.info("Loading valid airlines list...")
-with open(VALID_AIRLINES_FILE, 'r', encoding='utf-8') as f:
-    valid_airlines = json.load(f)
-logger.info(f"Loaded {len(valid_airlines)} valid airlines")
+AIRLINE_NAME_SUFFIXES = {"airline", "airlines", "airways", "limited", "ltd", "inc"}
 
-name_to_airline = load_airlines_database()
-flight_numbers_config = build_flight_numbers_config(valid_airlines, name_to_airline)
 
-logger.info("Building airline routes structure...")
-airline_routes = {}
-iata_to_airline_name = {}
+def normalize_airline_name(name):
+    ascii_name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode('ascii')
+    return " ".join(re.findall(r"[a-z0-9]+", ascii_name.lower()))
 
-for airline_name in valid_airlines:
-    airline_name = airline_name.strip()
 
-    airline_data = None
-    normalized_name = airline_name.lower().strip()
-    
-    if normalized_name in name_to_airline:
-        airline_data = name_to_airline[normalized_name]
-    else:
-        for db_name, data in name_to_airline.items():
-            if normalized_name in db_name or db_name in normalized_name:
-                airline_data = data
-                break
-    
-    if airline_data and airline_data.get('iata') and airline_data.get('icao'):
-        iata = airline_data['iata']
-        icao = airline_data['icao']
-        callsign = airline_data.get('callsign', '')
-        
-        if iata and iata != '-' and iata != 'N/A':
-            airline_routes[airline_name] = {
-                "iata": iata,
-                "icao": icao,
-                "callsign": callsign if callsign else '',
-                "routes": []
-            }
-            iata_to_airline_name[iata] = airline_name
+def core_airline_name(normalized_name):
+    return " ".join(token for token in normalized_name.split() if token not in AIRLINE_NAME_SUFFIXES)
 
-logger.info(f"Built route structure for {len(airline_routes)} airlines with valid IATA codes")
-#endregion
 
-#region --verify argument
+def has_airline_code(code):
+    return bool(code) and code not in ('-', 'N/A')
 
-if args.verify:
-    logger.info("=" * 60)
-    logger.info("VERIFY MODE - Checking route coverage")
-    logger.info("=" * 60)
-    
-    # Check which airlines have route files
-    present_airlines = []
-    missing_airlines = []
-    
-    for airline_name in airline_routes.keys():
-        safe_name = airline_name.strip().lower().replace(' ', '_').replace('\r', '').replace('\n', '')
-        filename = f"data/{safe_name}_routes.json"
+
+class AirlineNameIndex:
+    """Resolves airline names against airlines.json without scanning every entry.
+
+    Each name goes through these stages in order and stops at the first match:
+    1. An exact normalised match.
+    2. A match with suffixes such as "Airlines" dropped.
+    3. A database name containing it as whole words, found through a token index.
+    4. The longest database name it contains.
+    5. A prefix of a database name.
+    6. If enabled, a fuzzy match against names sharing a word with it.
+    Every stage only accepts entries with an ICAO code. When several entries
+    match, ones with both IATA and ICAO codes win, then active airlines.
+    Remaining ties go to the earliest entry in airlines.json, which is
+    usually the mainline carrier, except for exact name matches, where the
+    latest entry wins as it did with the old name dict.
+    """
+
+    def __init__(self, airlines):
+        self.by_name = {}
+        self.by_core = {}
+        self.by_token = {}
         
-        if os.path.exists(filename):
-            present_airlines.append(airline_name)
-        else:
-            missing_airlines.append(airline_name)
-    
-    logger.info(f"\n Routes Present: {len(present_airlines)}")
-    logger.info(f" Routes Missing: {len(missing_airlines)}")
+        for position, airline in enumerate(airlines):
+            key = normalize_airline_name(airline.get('name') or '')
+            if key:
+                self.by_name.setdefault(key, []).append((position, airline))
+        
+        for key in self.by_name:
+            self.by_core.setdefault(core_airline_name(key), []).append(key)
+            for token in set(key.split()):
+                self.by_token.setdefault(token, set()).add(key)
+        
+        self.sorted_names = sorted(self.by_name)
     
-    if missing_airlines:
-        logger.info(f"\nMissing airlines:")
-        for airline in missing_airlines[:10]:
-            logger.info(f"  - {airline}")
-        if len(missing_airlines) > 10:
-            logger.info(f"  ... and {len(missing_airlines) - 10} more")
+    def _best(self, keys, require_icao=True, prefer_latest=False, key_score=None):
+        best = None
+        for key in keys:
+            for position, airline in self.by_name.get(key, ()):
+                if require_icao and not has_airline_code(airline.get('icao')):
+                    continue
+                rank = (
+                    key_score(key) if key_score else 0,
+                    has_airline_code(airline.get('icao')) and has_airline_code(airline.get('iata')),
+                    bool(airline.get('active')),
+                    position if prefer_latest else -position
+                )
+                if best is None or rank > best[0]:
+                    best = (rank, airline)
+        return best[1] if best else None
     
-    coverage_pct = (len(present_airlines) / len(airline_routes)) * 100 if airline_routes else 0
-    logger.info(f"\nCoverage: {coverage_pct:.1f}%")
-    logger.info("=" * 60)
-    logger.info("Verify complete - exiting without building routes")
-    logger.info("=" * 60)
-    exit(0)
-#endregion
-
-#region --fix-media argument
-
-if args.fix_media:
-    logger.info("=" * 60)
-    logger.info("FIX MEDIA MODE - Checking for missing airline logos")
-    logger.info("=" * 60)
+    def _suffix_matches(self, query):
+        core = core_airline_name(query)
+        return [key for key in self.by_core.get(core, []) if key != query] if core else []
     
-    data_dir = Path("data")
-    if not data_dir.exists():
-        logger.error("data/ folder does not exist!")
-        exit(1)
+    def _containing_matches(self, query):
+        rarest = min((self.by_token.get(token, set()) for token in query.split()), key=len)
+        padded = f" {query} "
+        return [key for key in rarest if key != query and padded in f" {key} "]
     
-    route_files = list(data_dir.glob("*_routes.json"))
-    logger.info(f"Found {len(route_files)} route files in data/")
+    def _contained_matches(self, query):
+        tokens = query.split()
+        runs = {
+            " ".join(tokens[start:end])
+            for start in range(len(tokens))
+            for end in range(start + 1, len(tokens) + 1)
+        }
+        return [key for key in runs if key in self.by_name and key != query]
     
-    airlines_with_routes = []
-    airlines_missing_logos = []
-    airlines_with_logos = []
+    def _prefix_matches(self, query):
+        keys = []
+        for key in self.sorted_names[bisect_left(self.sorted_names, query):]:
+            if not key.startswith(query):
+                break
+            if key != query:
+                keys.append(key)
+        return keys
     
-    airlines_data = {}
+    def _fuzzy_scores(self, query, cutoff):
+        # Scored on names without their "Airlines"-style suffixes, which would otherwise dominate short names
+        core = core_airline_name(query)
+        pool = set()
+        for token in core.split():
+            pool.update(self.by_token.get(token, ()))
+        
+        matcher = difflib.SequenceMatcher(b=core)
+        scores = {}
+        for key in pool:
+            matcher.set_seq1(core_airline_name(key))
+            if matcher.real_quick_ratio() >= cutoff and matcher.quick_ratio() >= cutoff:
+                score = matcher.ratio()
+                if score >= cutoff:
+                    scores[key] = score
+        return scores
     
-    for route_file in route_files:
-        try:
-            with open(route_file, 'r', encoding='utf-8') as f:
-                route_data = json.load(f)
-                airline_name = route_data.get("airline")
-                airline_icao = route_data.get("icao")
-                
-                if airline_name:
-                    airlines_with_routes.append(airline_name)
-                    airlines_data[airline_name] = airline_icao
-                    
-                    existing_logo = check_existing_logo(airline_name)
-                    if existing_logo:
-                        airlines_with_logos.append(airline_name)
-                    else:
-                        airlines_missing_logos.append(airline_name)
-        except Exception as e:
-            logger.warning(f"Error reading {route_file.name}: {e}")
+    def resolve(self, airline_name, fuzzy=False, fuzzy_cutoff=0.9):
+        """Return (airline entry, match method), or (None, None) if nothing matched."""
+        query = normalize_airline_name(airline_name)
+        if not query:
+            return None, None
+        
+        stages = [
+            ("exact", [query], {"prefer_latest": True}),
+            ("suffix", self._suffix_matches(query), {}),
+            ("containing", self._containing_matches(query), {}),
+            ("contained", self._contained_matches(query), {"key_score": len}),
+            ("prefix", self._prefix_matches(query), {})
+        ]
+        for method, keys, options in stages:
+            airline = self._best(keys, **options)
+            if airline:
+                return airline, method
+        
+        if fuzzy:
+            scores = self._fuzzy_scores(query, fuzzy_cutoff)
+            airline = self._best(scores, key_score=scores.get)
+            if airline:
+                return airline, "fuzzy"
+        
+        # An exact name without an ICAO code still beats no match at all
+        airline = self._best([query], require_icao=False, prefer_latest=True)
+        return (airline, "exact") if airline else (None, None)
     
-    logger.info(f"\n Airlines with routes: {len(airlines_with_routes)}")
-    logger.info(f" Airlines with logos: {len(airlines_with_logos)}")
-    logger.info(f" Airlines missing logos: {len(airlines_missing_logos)}")
-
-    if airlines_missing_logos:
-        logger.info(f"\nAttempting to fetch {len(airlines_missing_logos)} missing logos from GitHub repository...")
+    def resolve_all(self, airline_names, fuzzy=False):
+        """Resolve every name once, logging each non-exact decision for auditing."""
+        matches = {}
+        methods = {}
+        for airline_name in airline_names:
+            airline_name = airline_name.strip()
+            if airline_name in matches:
+                continue
+            airline, method = self.resolve(airline_name, fuzzy=fuzzy)
+            matches[airline_name] = airline
+            methods[method or "unmatched"] = methods.get(method or "unmatched", 0) + 1
+            
+            if airline is None:
+                logger.info(f" No airlines database match for '{airline_name}'")
+            elif method != "exact":
+                logger.info(f" Matched '{airline_name}' to '{airline['name']}' ({airline.get('icao')}) by {method}")
         
-        successful_downloads = 0
-        failed_downloads = 0
-        total_to_download = len(airlines_missing_logos)
+        summary = ", ".join(f"{count} {method}" for method, count in sorted(methods.items()))
+        logger.info(f"Resolved {len(matches)} airline names: {summary}")
+        return matches
+
+#endregion
+
+#region Routing Stage
+
+_routing_context = None
+
+
+def route_file_for_airline(airline_name):
+    safe_name = airline_name.strip().lower().replace(' ', '_').replace('\r', '').replace('\n', '')
+    return f"data/{safe_name}_routes.json"
+
+
+def build_support_rules(aircraft_codes, aircraft_bits):
+    return [
+        (aircraft_code, 1 << aircraft_bits[aircraft_code],
+         aircraft_code in MIN_RANGE_KM or aircraft_code in MAJOR_AIRPORTS)
+        for aircraft_code in aircraft_codes
+    ]
+
+
+def compute_support_mask(origin_icao, dest_icao, distance_km, support_rules):
+    support_mask = 0
+    for aircraft_code, bit, check_large in support_rules:
+        if check_large:
+            supported = supports_large(origin_icao, dest_icao, distance_km, aircraft_code)
+        else:
+            supported = supports_dist(distance_km, aircraft_code)
+        if supported:
+            support_mask |= bit
+    return support_mask
+
+
+def format_route_entry(route_entry):
+    # Matches the layout json.dump(indent=2) gives a route inside the "routes" list
+    return json.dumps(route_entry, indent=2).replace('\n', '\n    ')
+
+
+def init_routing_worker(context):
+    global _routing_context
+    _routing_context = context
+
+
+def route_origin_batch(origins):
+    """Route a batch of (origin IATA, origin data) items.
+
+    Runs in a worker process and returns (airline name, formatted route entry)
+    pairs in input order, so the parent only has to write them out.
+    """
+    iata_to_icao = _routing_context["iata_to_icao"]
+    airport_names = _routing_context["airport_names"]
+    iata_to_airline_name = _routing_context["iata_to_airline_name"]
+    support_rules = _routing_context["support_rules"]
+    
+    routed = []
+    for origin_iata, origin_data in origins:
+        origin_name = origin_data.get("name", origin_iata)
+        origin_icao = iata_to_icao.get(origin_iata, "")
         
-        for idx, airline_name in enumerate(airlines_missing_logos, 1):
-            existing = check_existing_logo(airline_name)
-            if existing:
+        for route in origin_data.get("routes", []):
+            carriers = dict.fromkeys(c["iata"] for c in route.get("carriers", []))
+            airline_names = [iata_to_airline_name[c] for c in carriers if c in iata_to_airline_name]
+            if not airline_names:
                 continue
             
-            airline_icao = airlines_data.get(airline_name)
+            dest_iata = route["iata"]
+            dest_icao = iata_to_icao.get(dest_iata, "")
+            distance_km = route["km"]
             
-            logo_filename = fetch_airline_logo(airline_name, airline_icao)
+            time_min = estimate_time_minutes(distance_km)
+            time_split = split_time(time_min)
             
-            if logo_filename:
-                update_airline_logos_config(airline_name, logo_filename)
-                successful_downloads += 1
-                
-                if successful_downloads % 10 == 0:
-                    logger.info(f"Assets downloaded: {successful_downloads}/{total_to_download}")
+            route_entry = {
+                "from": origin_iata,
+                "from_name": origin_name,
+                "from_icao": origin_icao,
+                "to": dest_iata,
+                "to_name": airport_names.get(dest_iata, dest_iata),
+                "to_icao": dest_icao,
+                "distance_km": distance_km,
+                "estimated_time_min": time_min
+            }
+            
+            if time_split:
+                route_entry["estimated_time"] = time_split
+            
+            # Support only depends on the route, so it is computed once for all carriers
+            route_entry["support_mask"] = compute_support_mask(origin_icao, dest_icao, distance_km, support_rules)
+            
+            route_text = format_route_entry(route_entry)
+            for airline_name in airline_names:
+                routed.append((airline_name, route_text))
+    
+    return routed
+
+
+def iter_origin_batches(input_file, batch_size=ORIGINS_PER_BATCH):
+    batch = []
+    for origin_iata, origin_data in iter_json_object(input_file):
+        batch.append((origin_iata, origin_data))
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def run_routing_stage(input_file, context, workers):
+    """Yield routed batches in input order, using a process pool when workers > 1.
+
+    At most a few batches per worker are in flight, so memory stays bounded
+    no matter how large the input file is.
+    """
+    batches = iter_origin_batches(input_file)
+    
+    if workers <= 1:
+        init_routing_worker(context)
+        for batch in batches:
+            yield route_origin_batch(batch)
+        return
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_routing_worker, initargs=(context,)) as executor:
+        pending = deque()
+        for batch in batches:
+            pending.append(executor.submit(route_origin_batch, batch))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+class AirlineRouteWriter:
+    """Writes one airline's route file incrementally.
+
+    Routes are buffered and appended in batches of flush_every, so only a
+    small tail of each airline's routes is held in memory and no file handle
+    stays open between flushes. The file is written under a temporary name
+    and moved into place on close, unless its content hash shows it is
+    identical to the file already on disk.
+    """
+
+    def __init__(self, output_file, airline_name, iata, icao, callsign, flush_every=ROUTE_FLUSH_EVERY):
+        self.output_file = output_file
+        self.temp_file = f"{output_file}.tmp"
+        self.header = {
+            "airline": airline_name,
+            "iata": iata,
+            "icao": icao,
+            "callsign": callsign
+        }
+        self.flush_every = flush_every
+        self.route_count = 0
+        self.changed = False
+        self._digest = hashlib.sha256(json.dumps(self.header).encode('utf-8'))
+        self._pending = []
+        self._started = False
+    
+    def write(self, route_text):
+        self._pending.append(route_text)
+        self._digest.update(route_text.encode('utf-8'))
+        self._digest.update(b'\0')
+        self.route_count += 1
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+    
+    def flush(self):
+        if not self._pending:
+            return
+        
+        with open(self.temp_file, 'a' if self._started else 'w', encoding='utf-8') as f:
+            if self._started:
+                f.write(',')
             else:
-                failed_downloads += 1
-                logger.error(f" Failed to download logo for: {airline_name}")
+                f.write('{\n')
+                for key, value in self.header.items():
+                    f.write(f'  {json.dumps(key)}: {json.dumps(value)},\n')
+                f.write('  "routes": [')
+                self._started = True
+            f.write('\n    ' + ',\n    '.join(self._pending))
         
-        logger.info("\n" + "=" * 60)
-        logger.info(f"Download Summary:")
-        logger.info(f"   Successful: {successful_downloads}")
-        logger.info(f"   Failed: {failed_downloads}")
-        logger.info("=" * 60)
-    else:
-        logger.info("\nAll airlines with routes already have logos!")
+        self._pending = []
     
-    logger.info("Fix media mode complete - exiting")
-    logger.info("=" * 60)
-    exit(0)
+    def close(self, previous_hash=None):
+        """Finish the file and return its content hash, or None if no routes were written."""
+        self.flush()
+        if not self._started:
+            return None
+        with open(self.temp_file, 'a', encoding='utf-8') as f:
+            f.write('\n  ]\n}')
+        
+        content_hash = self._digest.hexdigest()
+        if content_hash == previous_hash and os.path.exists(self.output_file):
+            os.remove(self.temp_file)
+        else:
+            os.replace(self.temp_file, self.output_file)
+            self.changed = True
+        return content_hash
+
+
+class SavedAirlineRoutes(Mapping):
+    """Read-only {airline: routes} view over the route files written this run.
+
+    Each airline's routes are read from disk when accessed, so the index and
+    lookup builders only hold one airline in memory at a time.
+    """
+
+    def __init__(self, route_files):
+        self.route_files = route_files
+    
+    def __getitem__(self, airline_name):
+        with open(self.route_files[airline_name], 'r', encoding='utf-8') as f:
+            return json.load(f)["routes"]
+    
+    def __iter__(self):
+        return iter(self.route_files)
+    
+    def __len__(self):
+        return len(self.route_files)
 
 #endregion
 
-#region routing
-
-logger.info("Loading airport mappings...")
-iata_to_icao = {}
-with open(AIRPORTS_CSV, newline="", encoding="utf-8") as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        iata = row.get("iata_code")
-        icao = row.get("icao_code")
-        if iata and icao:
-            iata_to_icao[iata] = icao
-logger.info(f" Loaded {len(iata_to_icao)} airport mappings")
-
-
-logger.info("Loading airline routes...")
-with open(INPUT_FILE, "r", encoding="utf-8") as f:
-    data = json.load(f)
-logger.info(f" Loaded routes for {len(data)} airports")
-
-logger.info("Processing routes...")
-route_count = 0
-
-all_aircraft_codes = load_aircraft_support()
-logger.info(f"Generating support fields for {len(all_aircraft_codes)} aircraft types")
-
-for origin_iata, origin_data in data.items():
-    origin_name = origin_data.get("name", origin_iata)
-    origin_icao = iata_to_icao.get(origin_iata, "")
-
-    for route in origin_data.get("routes", []):
-        dest_iata = route["iata"]
-        dest_data = data.get(dest_iata, {})
-        dest_name = dest_data.get("name", dest_iata)
-        dest_icao = iata_to_icao.get(dest_iata, "")
-
-        distance_km = route["km"]
-        carriers = {c["iata"] for c in route.get("carriers", [])}
-
-        time_min = estimate_time_minutes(distance_km)
-        time_split = split_time(time_min)
-
-        base_entry = {
-            "from": origin_iata,
-            "from_name": origin_name,
-            "from_icao": origin_icao,
-            "to": dest_iata,
-            "to_name": dest_name,
-            "to_icao": dest_icao,
-            "distance_km": distance_km,
-            "estimated_time_min": time_min
-        }
+#region Build Manifest
 
-        if time_split:
-            base_entry["estimated_time"] = time_split
+def hash_file(path):
+    if not os.path.exists(path):
+        return None
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_build_inputs(airline_routes):
+    """Hash every input that affects the generated route files.
+
+    This includes the script itself and the speed/range tables above, so
+    changing the routing rules also invalidates the previous build. The
+    resolved airline codes are hashed too: --fuzzy-airlines changes which
+    airlines get routes without touching any input file.
+    """
+    inputs = {
+        path: hash_file(path)
+        for path in (INPUT_FILE, AIRPORTS_CSV, AIRCRAFT_SUPPORT_FILE, VALID_AIRLINES_FILE,
+                     AIRLINES_DATABASE_FILE, CONFIG_AIRCRAFT_BITS)
+    }
+    inputs["buildData.py"] = hash_file(os.path.abspath(__file__))
+    
+    tables = {
+        "cruise_speed_kts": CRUISE_SPEED_KTS,
+        "max_range_km": MAX_RANGE_KM,
+        "min_range_km": MIN_RANGE_KM,
+        "major_airports": {code: sorted(airports) for code, airports in MAJOR_AIRPORTS.items()}
+    }
+    inputs["aircraft_tables"] = hashlib.sha256(json.dumps(tables, sort_keys=True).encode('utf-8')).hexdigest()
+    inputs["airline_matches"] = hashlib.sha256(json.dumps(airline_routes, sort_keys=True).encode('utf-8')).hexdigest()
+    return inputs
 
-        for carrier_iata in carriers:
-            if carrier_iata in iata_to_airline_name:
-                airline_name = iata_to_airline_name[carrier_iata]
-                
-                route_entry = {**base_entry}
 
-                for aircraft_code in all_aircraft_codes:
-                    support_key = f"supports_{aircraft_code.lower()}"
+# Inputs every airline's routes depend on; the route file and airline lists are hashed per airline instead
+SHARED_BUILD_INPUTS = (AIRPORTS_CSV, AIRCRAFT_SUPPORT_FILE, CONFIG_AIRCRAFT_BITS, "buildData.py", "aircraft_tables")
 
-                    if aircraft_code in MIN_RANGE_KM or aircraft_code in MAJOR_AIRPORTS:
-                        route_entry[support_key] = supports_large(origin_icao, dest_icao, distance_km, aircraft_code)
-                    else:
-                        route_entry[support_key] = supports_dist(distance_km, aircraft_code)
-                
-                airline_routes[airline_name]["routes"].append(route_entry)
-                route_count += 1
 
-logger.info(f" Processed {route_count} total routes across all airlines")
-#endregion
+def hash_shared_inputs(input_hashes):
+    shared = {name: input_hashes.get(name) for name in SHARED_BUILD_INPUTS}
+    return hashlib.sha256(json.dumps(shared, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def hash_airline_inputs(input_file, airport_names, iata_to_airline_name, airline_routes, shared_hash):
+    """Hash each airline's slice of the raw routes together with its codes and the shared inputs.
+
+    Only airlines with at least one route get a hash. An airline whose hash
+    matches the previous build would produce the same route file, so it
+    doesn't need routing again.
+    """
+    digests = {}
+    for origin_iata, origin_data in iter_json_object(input_file):
+        origin_name = origin_data.get("name", origin_iata)
+        for route in origin_data.get("routes", []):
+            carriers = dict.fromkeys(c["iata"] for c in route.get("carriers", []))
+            airline_names = [iata_to_airline_name[c] for c in carriers if c in iata_to_airline_name]
+            if not airline_names:
+                continue
+            
+            dest_iata = route["iata"]
+            route_key = json.dumps([
+                origin_iata, origin_name, dest_iata, airport_names.get(dest_iata, dest_iata), route["km"]
+            ]).encode('utf-8')
+            for airline_name in airline_names:
+                digest = digests.get(airline_name)
+                if digest is None:
+                    header = json.dumps([shared_hash, airline_routes[airline_name]], sort_keys=True)
+                    digest = digests[airline_name] = hashlib.sha256(header.encode('utf-8'))
+                digest.update(route_key)
+                digest.update(b'\0')
+    return {airline_name: digest.hexdigest() for airline_name, digest in digests.items()}
+
+
+def airlines_to_route(previous_airlines, airline_input_hashes):
+    """Airlines whose inputs changed since the last build or whose route file has gone missing."""
+    to_route = set()
+    for airline_name, input_hash in airline_input_hashes.items():
+        previous = previous_airlines.get(airline_name)
+        if previous is None or previous.get("inputs") != input_hash or not os.path.exists(previous["file"]):
+            to_route.add(airline_name)
+    return to_route
+
+
+def reuse_airline_outputs(previous_airlines, airline_names):
+    """Route files and manifest entries carried over from the last build for airline_names.
+
+    Airlines the last build had but that are no longer matched are dropped,
+    so nothing later looks up their codes in airline_routes.
+    """
+    route_files = {}
+    airline_hashes = {}
+    for airline_name in airline_names:
+        entry = previous_airlines.get(airline_name)
+        if entry is not None:
+            route_files[airline_name] = entry["file"]
+            airline_hashes[airline_name] = entry
+    return route_files, airline_hashes
+
+
+def hash_shared_outputs():
+    return {path: hash_file(path) for path in SHARED_OUTPUTS}
+
+
+def load_build_manifest():
+    if not os.path.exists(BUILD_MANIFEST):
+        return {}
+    try:
+        with open(BUILD_MANIFEST, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except Exception as e:
+        logger.warning(f"Could not read build manifest, rebuilding everything: {e}")
+        return {}
+    if manifest.get("version") != BUILD_MANIFEST_VERSION:
+        return {}
+    return manifest
+
+
+def save_build_manifest(input_hashes, airlines, shared_outputs):
+    write_json_atomic(BUILD_MANIFEST, {
+        "version": BUILD_MANIFEST_VERSION,
+        "inputs": input_hashes,
+        "airlines": airlines,
+        "shared_outputs": shared_outputs
+    })
 
-#region savedata
 
-logger.info("Saving airline route files and fetching logos...")
+def changed_build_inputs(manifest, input_hashes):
+    previous = manifest.get("inputs", {})
+    return [path for path, input_hash in input_hashes.items() if previous.get(path) != input_hash]
 
-if args.no_media:
-    logger.info("--no-media flag set: Skipping GitHub logo downloads")
 
-for airline_name, airline_data in airline_routes.items():
-    if airline_data["routes"]:
-        safe_name = airline_name.strip().lower().replace(' ', '_').replace('\r', '').replace('\n', '')
-        filename = f"data/{safe_name}_routes.json"
+def outputs_present(manifest, write_binary):
+    for entry in manifest.get("airlines", {}).values():
+        if not os.path.exists(entry["file"]):
+            return False
+        if write_binary and not os.path.exists(route_store_path(entry["file"])):
+            return False
+    return shared_outputs_current(manifest)
+
+
+def shared_outputs_current(manifest):
+    """True if the route index and lookup files are exactly as the last build left them."""
+    previous = manifest.get("shared_outputs", {})
+    return all(
+        previous.get(path) is not None and previous.get(path) == hash_file(path)
+        for path in SHARED_OUTPUTS
+    )
+
+#endregion
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Build airline route data and configurations')
+    parser.add_argument('-nomedia', '--no-media', action='store_true',
+                        help='Skip downloading logos from GitHub')
+    parser.add_argument('-verify', '--verify', action='store_true',
+                        help='Verify route coverage and exit')
+    parser.add_argument('-fixmedia', '--fix-media', action='store_true',
+                        help='Attempts to find missing media for present routes.')
+    parser.add_argument('-refreshmedia', '--refresh-media', action='store_true',
+                        help='With --fix-media, also revalidate previously downloaded logos')
+    parser.add_argument('-binary', '--binary', action='store_true',
+                        help='Also write memory-mapped binary route files next to the JSON ones')
+    parser.add_argument('-fuzzy', '--fuzzy-airlines', action='store_true',
+                        help='Fall back to fuzzy name matching for airlines not found in airlines.json')
+    parser.add_argument('-force', '--force', action='store_true',
+                        help='Ignore the build manifest and rebuild every airline')
+    parser.add_argument('-workers', '--workers', type=int, default=os.cpu_count() or 1,
+                        help='Number of processes used to route airports (default: all cores)')
+    return parser.parse_args()
+
+
+def setup_logging():
+    os.makedirs("logs", exist_ok=True)
+    log_filename = f"logs/buildData_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+    
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(log_filename, encoding='utf-8'),
+            logging.StreamHandler()
+        ]
+    )
+    return log_filename
+
+
+def main():
+    args = parse_args()
+    log_filename = setup_logging()
+    
+    #region main
+    
+    logger.info("=" * 60)
+    logger.info("Starting MSFS Route Creator Data Build")
+    logger.info("=" * 60)
+    
+    logger.info("Loading valid airlines list...")
+    with open(VALID_AIRLINES_FILE, 'r', encoding='utf-8') as f:
+        valid_airlines = json.load(f)
+    logger.info(f"Loaded {len(valid_airlines)} valid airlines")
+    
+    airline_index = load_airlines_database()
+    airline_matches = airline_index.resolve_all(valid_airlines, fuzzy=args.fuzzy_airlines)
+    flight_numbers_config = build_flight_numbers_config(valid_airlines, airline_matches)
+    
+    logger.info("Building airline routes structure...")
+    airline_routes = {}
+    iata_to_airline_name = {}
+    
+    for airline_name in valid_airlines:
+        airline_name = airline_name.strip()
+    
+        airline_data = airline_matches.get(airline_name)
         
-        save_airline_routes(
+        if airline_data and airline_data.get('iata') and airline_data.get('icao'):
+            iata = airline_data['iata']
+            icao = airline_data['icao']
+            callsign = airline_data.get('callsign', '')
+            
+            if iata and iata != '-' and iata != 'N/A':
+                airline_routes[airline_name] = {
+                    "iata": iata,
+                    "icao": icao,
+                    "callsign": callsign if callsign else ''
+                }
+                iata_to_airline_name[iata] = airline_name
+    
+    logger.info(f"Built route structure for {len(airline_routes)} airlines with valid IATA codes")
+    #endregion
+
+    #region --verify argument
+    
+    if args.verify:
+        logger.info("=" * 60)
+        logger.info("VERIFY MODE - Checking route coverage")
+        logger.info("=" * 60)
+    
+        # Check which airlines have route files
+        present_airlines = []
+        missing_airlines = []
+    
+        for airline_name in airline_routes.keys():
+            if os.path.exists(route_file_for_airline(airline_name)):
+                present_airlines.append(airline_name)
+            else:
+                missing_airlines.append(airline_name)
+    
+        logger.info(f"\n Routes Present: {len(present_airlines)}")
+        logger.info(f" Routes Missing: {len(missing_airlines)}")
+    
+        if missing_airlines:
+            logger.info(f"\nMissing airlines:")
+            for airline in missing_airlines[:10]:
+                logger.info(f"  - {airline}")
+            if len(missing_airlines) > 10:
+                logger.info(f"  ... and {len(missing_airlines) - 10} more")
+    
+        coverage_pct = (len(present_airlines) / len(airline_routes)) * 100 if airline_routes else 0
+        logger.info(f"\nCoverage: {coverage_pct:.1f}%")
+        logger.info("=" * 60)
+        logger.info("Verify complete - exiting without building routes")
+        logger.info("=" * 60)
+        return
+    #endregion
+    
+    #region --fix-media argument
+    
+    if args.fix_media:
+        logger.info("=" * 60)
+        logger.info("FIX MEDIA MODE - Checking for missing airline logos")
+        logger.info("=" * 60)
+    
+        data_dir = Path("data")
+        if not data_dir.exists():
+            logger.error("data/ folder does not exist!")
+            exit(1)
+    
+        route_files = list(data_dir.glob("*_routes.json"))
+        logger.info(f"Found {len(route_files)} route files in data/")
+    
+        airlines_with_routes = []
+        airlines_missing_logos = []
+        airlines_with_logos = []
+    
+        airlines_data = {}
+    
+        for route_file in route_files:
+            try:
+                with open(route_file, 'r', encoding='utf-8') as f:
+                    route_data = json.load(f)
+                    airline_name = route_data.get("airline")
+                    airline_icao = route_data.get("icao")
+                
+                    if airline_name:
+                        airlines_with_routes.append(airline_name)
+                        airlines_data[airline_name] = airline_icao
+                    
+                        existing_logo = check_existing_logo(airline_name)
+                        if existing_logo:
+                            airlines_with_logos.append(airline_name)
+                        else:
+                            airlines_missing_logos.append(airline_name)
+            except Exception as e:
+                logger.warning(f"Error reading {route_file.name}: {e}")
+    
+        logger.info(f"\n Airlines with routes: {len(airlines_with_routes)}")
+        logger.info(f" Airlines with logos: {len(airlines_with_logos)}")
+        logger.info(f" Airlines missing logos: {len(airlines_missing_logos)}")
+    
+        downloader = LogoDownloader()
+        jobs = [(airline_name, airlines_data.get(airline_name)) for airline_name in airlines_missing_logos]
+        
+        if args.refresh_media:
+            # Only logos this script downloaded have validators; hand-added assets are left alone
+            refresh = [
+                (airline_name, airlines_data.get(airline_name))
+                for airline_name in airlines_with_logos
+                if downloader.has_validators(airline_name)
+            ]
+            logger.info(f"Revalidating {len(refresh)} previously downloaded logos")
+            jobs.extend(refresh)
+    
+        if jobs:
+            airline_logos = ConfigAccumulator(CONFIG_AIRLINE_LOGOS)
+            logger.info(f"\nAttempting to fetch {len(jobs)} logos from GitHub repository...")
+        
+            logos = downloader.download_all(jobs)
+            for airline_name, logo_filename in logos.items():
+                airline_logos.set(airline_name, logo_filename)
+            for airline_name, _ in jobs:
+                if airline_name not in logos:
+                    logger.error(f" Failed to download logo for: {airline_name}")
+        
+            airline_logos.commit()
+        
+            logger.info("\n" + "=" * 60)
+            logger.info(f"Download Summary:")
+            logger.info(f"   Successful: {len(logos)}")
+            logger.info(f"   Failed: {len(jobs) - len(logos)}")
+            downloader.log_summary()
+            logger.info("=" * 60)
+        else:
+            logger.info("\nAll airlines with routes already have logos!")
+        downloader.close()
+    
+        logger.info("Fix media mode complete - exiting")
+        logger.info("=" * 60)
+        return
+    
+    #endregion
+    
+    #region routing
+    
+    all_aircraft_codes = load_aircraft_support()
+    logger.info(f"Generating support masks for {len(all_aircraft_codes)} aircraft types")
+    aircraft_bits = update_aircraft_bits_config(all_aircraft_codes)
+    
+    manifest = {} if args.force else load_build_manifest()
+    previous_airlines = manifest.get("airlines", {})
+    input_hashes = hash_build_inputs(airline_routes)
+    changed_inputs = changed_build_inputs(manifest, input_hashes)
+    
+    changed_airlines = set()
+    
+    if not changed_inputs and outputs_present(manifest, args.binary):
+        logger.info("Build inputs unchanged since the last build, skipping routing")
+        route_files, airline_hashes = reuse_airline_outputs(previous_airlines, airline_routes)
+    else:
+        if manifest:
+            logger.info(f"Changed build inputs: {', '.join(changed_inputs) or 'missing outputs'}")
+        
+        logger.info("Loading airport mappings...")
+        iata_to_icao = {}
+        with open(AIRPORTS_CSV, newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                iata = row.get("iata_code")
+                icao = row.get("icao_code")
+                if iata and icao:
+                    iata_to_icao[iata] = icao
+        logger.info(f" Loaded {len(iata_to_icao)} airport mappings")
+        
+        # First pass only keeps airport names, which destinations need before their own entry is reached
+        logger.info("Scanning airline routes for airport names...")
+        airport_names = {
+            origin_iata: origin_data.get("name", origin_iata)
+            for origin_iata, origin_data in iter_json_object(INPUT_FILE)
+        }
+        logger.info(f" Found {len(airport_names)} airports")
+        
+        logger.info("Hashing each airline's route inputs...")
+        airline_input_hashes = hash_airline_inputs(
+            INPUT_FILE, airport_names, iata_to_airline_name, airline_routes, hash_shared_inputs(input_hashes)
+        )
+        to_route = airlines_to_route(previous_airlines, airline_input_hashes)
+        route_files, airline_hashes = reuse_airline_outputs(previous_airlines, airline_input_hashes.keys() - to_route)
+        logger.info(f" {len(to_route)} of {len(airline_input_hashes)} airlines have changed inputs")
+        
+        if to_route:
+            routing_context = {
+                "iata_to_icao": iata_to_icao,
+                "airport_names": airport_names,
+                # Carriers of unchanged airlines are left out, so their routes are never formatted
+                "iata_to_airline_name": {
+                    iata: airline_name for iata, airline_name in iata_to_airline_name.items()
+                    if airline_name in to_route
+                },
+                "support_rules": build_support_rules(all_aircraft_codes, aircraft_bits)
+            }
+            
+            os.makedirs("data", exist_ok=True)
+            workers = max(1, args.workers)
+            logger.info(f"Processing routes with {workers} worker process(es)...")
+            route_count = 0
+            writers = {}
+            
+            for routed in run_routing_stage(INPUT_FILE, routing_context, workers):
+                for airline_name, route_text in routed:
+                    writer = writers.get(airline_name)
+                    if writer is None:
+                        airline_data = airline_routes[airline_name]
+                        writer = AirlineRouteWriter(
+                            route_file_for_airline(airline_name),
+                            airline_name,
+                            airline_data["iata"],
+                            airline_data["icao"],
+                            airline_data["callsign"]
+                        )
+                        writers[airline_name] = writer
+                    writer.write(route_text)
+                route_count += len(routed)
+            
+            for airline_name in airline_routes:
+                writer = writers.get(airline_name)
+                if writer is None:
+                    continue
+                previous_hash = previous_airlines.get(airline_name, {}).get("hash")
+                content_hash = writer.close(previous_hash)
+                if content_hash is None:
+                    continue
+                route_files[airline_name] = writer.output_file
+                airline_hashes[airline_name] = {
+                    "file": writer.output_file,
+                    "hash": content_hash,
+                    "routes": writer.route_count,
+                    "inputs": airline_input_hashes[airline_name]
+                }
+                if writer.changed:
+                    changed_airlines.add(airline_name)
+            
+            logger.info(f" Processed {route_count} routes for the changed airlines")
+    
+    logger.info(f" Rebuilt {len(changed_airlines)} airline route files, skipped {len(route_files) - len(changed_airlines)} unchanged")
+    #endregion
+    
+    #region savedata
+    
+    save_started = time.perf_counter()
+    logger.info("Registering airline route files and fetching logos...")
+    
+    if args.no_media:
+        logger.info("--no-media flag set: Skipping GitHub logo downloads")
+    
+    airline_files = ConfigAccumulator(CONFIG_AIRLINE_FILES)
+    airline_logos = ConfigAccumulator(CONFIG_AIRLINE_LOGOS)
+    missing_logos = []
+    
+    for airline_name, route_file in route_files.items():
+        needs_logo = register_airline_routes(
             airline_name,
-            airline_data["iata"],
-            airline_data["icao"],
-            airline_data["callsign"],
-            airline_data["routes"],
-            filename,
-            skip_media=args.no_media
+            route_file,
+            airline_files,
+            airline_logos,
+            skip_media=args.no_media,
+            write_binary=args.binary and (
+                airline_name in changed_airlines or not os.path.exists(route_store_path(route_file))
+            )
+        )
+        if needs_logo:
+            missing_logos.append((airline_name, airline_routes[airline_name]["icao"]))
+    
+    if missing_logos:
+        logger.info(f"Downloading {len(missing_logos)} missing logos...")
+        downloader = LogoDownloader()
+        for airline_name, logo_filename in downloader.download_all(missing_logos).items():
+            airline_logos.set(airline_name, logo_filename)
+        downloader.log_summary()
+        downloader.close()
+    
+    airline_files.commit()
+    airline_logos.commit()
+    
+    if changed_airlines or set(route_files) != set(previous_airlines) or not shared_outputs_current(manifest):
+        routes_by_airline = SavedAirlineRoutes(route_files)
+        
+        logger.info("Building cross-airline route index...")
+        route_index = build_route_index(routes_by_airline)
+        save_route_index(route_index, CONFIG_ROUTE_INDEX)
+        logger.info(f" Indexed {sum(len(d) for d in route_index['pairs'].values())} airport pairs across {len(route_index['airlines'])} airlines")
+        
+        logger.info("Building airline and airport lookup tables...")
+        airline_lookup = build_airline_lookup(
+            (airline_name, airline_routes[airline_name]["icao"], airline_routes[airline_name]["callsign"])
+            for airline_name in routes_by_airline
         )
+        save_lookup(airline_lookup, "airline_lookup.json")
+        airport_catalog = build_airport_catalog(routes_by_airline)
+        save_lookup(airport_catalog, "airport_catalog.json")
+        logger.info(f" Saved {len(airline_lookup)} airline and {len(airport_catalog)} airport lookups")
+    else:
+        logger.info("No airline routes changed, skipping route index and lookup tables")
+    
+    save_build_manifest(input_hashes, airline_hashes, hash_shared_outputs())
+    logger.info(f" Save phase took {time.perf_counter() - save_started:.2f}s")
+    
+    #endregion
+    
+    logger.info("=" * 60)
+    logger.info("Build complete!")
+    logger.info(f"Log file saved to: {log_filename}")
+    logger.info("=" * 60)
 
-#endregion
 
-logger.info("=" * 60)
-logger.info("Build complete!")
-logger.info(f"Log file saved to: {log_filename}")
-logger.info("=" * 60)
+if __name__ == "__main__":
+    main()
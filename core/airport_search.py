@@ -0,0 +1,127 @@
+import re
+
+# Results per rank: exact code, code prefix, name word prefix, anywhere else
+RANK_EXACT_CODE = 0
+RANK_CODE_PREFIX = 1
+RANK_WORD_PREFIX = 2
+RANK_SUBSTRING = 3
+
+_CHOICE = re.compile(r'^(?P<iata>\S*) — (?P<name>.*?)(?: \((?P<icao>[^()]*)\))?$')
+_WORD = re.compile(r'\w+')
+
+
+def parse_airport_choice(choice):
+    """Split a get_airport_choices() entry, "LHR — London Heathrow (EGLL)", into (iata, icao, name)."""
+    match = _CHOICE.match(choice)
+    if match is None:
+        return choice, '', ''
+    return match.group('iata'), match.group('icao') or '', match.group('name')
+
+
+class AirportSearchIndex:
+    """Ranked substring search over airports by IATA, ICAO and name.
+
+    Built once per airport list: each airport's lower-cased search text is
+    split into bigrams and trigrams, so a query is answered from the posting
+    lists of its own n-grams instead of scanning every airport. Matches are
+    the same as a case-insensitive contains filter (a single character
+    matches the start of a code or name word) and are returned best first.
+
+    entries is a list of (value, display, iata, icao, name); value is what
+    gets typed into the field, display what is shown in the list.
+    """
+
+    def __init__(self, entries):
+        self.entries = sorted(entries, key=lambda entry: entry[1].lower())
+        self.texts = []
+        self.codes = []
+        self.words = []
+        grams = {}
+        initials = {}
+        for i, (value, display, iata, icao, name) in enumerate(self.entries):
+            codes = tuple(code.lower() for code in (iata, icao) if code)
+            words = tuple(word.lower() for word in _WORD.findall(name))
+            text = display.lower()
+            if value.lower() not in text:
+                text += '\n' + value.lower()
+            self.texts.append(text)
+            self.codes.append(codes)
+            self.words.append(words)
+
+            for token in codes + words:
+                initials.setdefault(token[0], []).append(i)
+            seen = set()
+            for n in (2, 3):
+                for start in range(len(text) - n + 1):
+                    gram = text[start:start + n]
+                    if gram not in seen:
+                        seen.add(gram)
+                        grams.setdefault(gram, []).append(i)
+
+        self._grams = grams
+        # A token list can repeat an airport; keep the first, in display order
+        self._initials = {char: list(dict.fromkeys(ids)) for char, ids in initials.items()}
+
+    @classmethod
+    def from_choices(cls, choices):
+        """Index get_airport_choices() strings; each choice is both value and display."""
+        return cls([(choice, choice, *parse_airport_choice(choice)) for choice in choices])
+
+    @classmethod
+    def from_catalog(cls, catalog):
+        """Index an {ICAO: {"iata", "name"}} airport catalog; the ICAO code is the value."""
+        entries = []
+        for icao, info in catalog.items():
+            name = info.get('name', '')
+            iata = info.get('iata', '')
+            display = f"{icao} — {name} ({iata})" if iata else f"{icao} — {name}" if name else icao
+            entries.append((icao, display, iata, icao, name))
+        return cls(entries)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def candidates(self, query):
+        """Ids of the airports whose search text contains query, in display order."""
+        if len(query) == 1:
+            return self._initials.get(query, [])
+        if len(query) <= 3:
+            return self._grams.get(query, [])
+
+        postings = sorted(
+            (self._grams.get(query[start:start + 3], ()) for start in range(len(query) - 2)),
+            key=len
+        )
+        if not postings[0]:
+            return []
+        ids = set(postings[0])
+        for posting in postings[1:]:
+            ids.intersection_update(posting)
+            if not ids:
+                return []
+        texts = self.texts
+        return sorted(i for i in ids if query in texts[i])
+
+    def rank(self, i, query):
+        codes = self.codes[i]
+        if query in codes:
+            return RANK_EXACT_CODE
+        if any(code.startswith(query) for code in codes):
+            return RANK_CODE_PREFIX
+        if any(word.startswith(query) for word in self.words[i]):
+            return RANK_WORD_PREFIX
+        return RANK_SUBSTRING
+
+    def search(self, query):
+        """Return matching entry ids, best match first; an empty query returns every airport."""
+        query = query.strip().lower()
+        if not query:
+            return list(range(len(self.entries)))
+        # Candidates are already in display order and sort is stable, so ties stay alphabetical
+        return sorted(self.candidates(query), key=lambda i: self.rank(i, query))
+
+    def value(self, i):
+        return self.entries[i][0]
+
+    def display(self, i):
+        return self.entries[i][1]
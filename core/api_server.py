@@ -0,0 +1,223 @@
+import argparse
+import json
+import logging
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+from core.route_loader import load_routes, get_airline_files, build_airport_index, get_airport_choices
+from core.logic import generate_random_route, verify_route, build_simbrief_url, format_route_details, genFlightNum
+from core.lookups import get_airport_catalog
+from core.route_index import find_airlines_for_pair
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8750
+
+logger = logging.getLogger(__name__)
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class RouteApi:
+    """Endpoint logic for the local JSON API, independent of the HTTP layer.
+
+    Airline data comes from the shared route cache, so each airline's JSON is
+    parsed once and stays in memory while the server runs. Airport indexes
+    are kept alongside and rebuilt only when the cached routes change.
+    """
+
+    def __init__(self):
+        self._airport_indexes = {}
+        self._lock = threading.Lock()
+        self.endpoints = {
+            '/health': self.health,
+            '/airlines': self.airlines,
+            '/airports': self.airports,
+            '/route': self.random_route,
+            '/verify': self.verify,
+            '/airlines-for-pair': self.airlines_for_pair,
+            '/simbrief-url': self.simbrief_url
+        }
+
+    def handle(self, path, params):
+        endpoint = self.endpoints.get(path.rstrip('/') or '/')
+        if endpoint is None:
+            raise ApiError(404, f"Unknown endpoint {path}")
+        return endpoint(params)
+
+    def _routes(self, airline):
+        if airline not in get_airline_files():
+            raise ApiError(404, f"Unknown airline: {airline}")
+        try:
+            return load_routes(airline)
+        except FileNotFoundError:
+            raise ApiError(503, f"Route file missing for {airline}, run buildData.py first")
+
+    def _airport_index(self, airline):
+        routes = self._routes(airline)
+        with self._lock:
+            cached = self._airport_indexes.get(airline)
+            if cached is not None and cached[0] is routes:
+                return cached[1]
+        index = build_airport_index(routes)
+        with self._lock:
+            self._airport_indexes[airline] = (routes, index)
+        return index
+
+    def preload(self, airlines):
+        for airline in airlines:
+            self._airport_index(airline)
+
+    def health(self, params):
+        return {'status': 'ok'}
+
+    def airlines(self, params):
+        return {'airlines': list(get_airline_files())}
+
+    def airports(self, params):
+        airline = _optional(params, 'airline')
+        if airline is None:
+            catalog = get_airport_catalog()
+            return {'airports': [{'icao': icao, **info} for icao, info in catalog.items()]}
+        return {'airline': airline, 'airports': get_airport_choices(self._airport_index(airline))}
+
+    def random_route(self, params):
+        airline = _required(params, 'airline')
+        aircraft = _required(params, 'aircraft')
+        origin = _optional(params, 'origin')
+        max_time = _optional_int(params, 'max_time')
+        routes = self._routes(airline)
+
+        if origin is None:
+            departures = routes.departures(aircraft)
+            if not departures:
+                raise ApiError(404, f"No routes available for {airline} with {aircraft} support")
+            origin = random.choice(departures)
+
+        route = generate_random_route(routes, origin.upper(), aircraft, airline, max_time)
+        if route is None:
+            raise ApiError(404, "No valid routes found with current filters")
+
+        details = format_route_details(airline, aircraft, route)
+        details['distance_km'] = route['distance_km']
+        details['estimated_time_min'] = route['estimated_time_min']
+        details['simbrief_url'] = build_simbrief_url(airline, aircraft, route)
+        return details
+
+    def verify(self, params):
+        airline = _required(params, 'airline')
+        return verify_route(
+            self._routes(airline),
+            _required(params, 'from'),
+            _required(params, 'to'),
+            _optional(params, 'aircraft') or '',
+            airline
+        )
+
+    def airlines_for_pair(self, params):
+        departure = _required(params, 'from')
+        arrival = _required(params, 'to')
+        aircraft = _optional(params, 'aircraft')
+        return {
+            'from': departure.upper(),
+            'to': arrival.upper(),
+            'airlines': find_airlines_for_pair(departure, arrival, aircraft)
+        }
+
+    def simbrief_url(self, params):
+        airline = _required(params, 'airline')
+        aircraft = _required(params, 'aircraft')
+        route = {'from_icao': _required(params, 'from').upper(), 'to_icao': _required(params, 'to').upper()}
+        flight_ident = genFlightNum(airline, route['from_icao'])
+        if isinstance(flight_ident, str):
+            raise ApiError(404, f"No flight number data for {airline}")
+        return {
+            'flight_number': f"{flight_ident[0]} {flight_ident[1]}",
+            'url': build_simbrief_url(airline, aircraft, route, flight_ident)
+        }
+
+
+def _optional(params, name):
+    values = params.get(name)
+    if not values or not values[0].strip():
+        return None
+    return values[0].strip()
+
+
+def _required(params, name):
+    value = _optional(params, name)
+    if value is None:
+        raise ApiError(400, f"Missing parameter: {name}")
+    return value
+
+
+def _optional_int(params, name):
+    value = _optional(params, name)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise ApiError(400, f"Parameter {name} must be a whole number")
+
+
+class RouteApiHandler(BaseHTTPRequestHandler):
+    # Keep-alive lets clients reuse one connection for many queries; without
+    # TCP_NODELAY the separate header and body writes stall on delayed ACKs
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    server_version = 'MSFSRouteCreator'
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        try:
+            status, payload = 200, self.server.api.handle(url.path, parse_qs(url.query))
+        except ApiError as e:
+            status, payload = e.status, {'error': str(e)}
+        except Exception as e:
+            logger.exception(f"Error handling {self.path}")
+            status, payload = 500, {'error': str(e)}
+
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+def make_api_server(host=DEFAULT_HOST, port=DEFAULT_PORT, api=None):
+    server = ThreadingHTTPServer((host, port), RouteApiHandler)
+    server.daemon_threads = True
+    server.api = api or RouteApi()
+    return server
+
+
+def run_api_cli(argv=None):
+    parser = argparse.ArgumentParser(prog="main.py -serve", description="Serve route generation as a local JSON API")
+    parser.add_argument('--host', default=DEFAULT_HOST, help=f'Interface to listen on (default: {DEFAULT_HOST})')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'Port to listen on (default: {DEFAULT_PORT})')
+    parser.add_argument('--preload', nargs='*', default=[], metavar='AIRLINE',
+                        help='Airlines to load before accepting requests')
+    args = parser.parse_args(argv)
+
+    api = RouteApi()
+    try:
+        api.preload(args.preload)
+    except ApiError as e:
+        parser.error(str(e))
+    server = make_api_server(args.host, args.port, api)
+    logger.info(f"Serving route API on http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,72 @@
+# Non-interactive CLI: keep imports to core modules so it starts fast in shell loops
+import argparse
+import json
+import sys
+from core.route_loader import load_routes, get_airline_files
+from core.logic import build_simbrief_url, format_route_details
+from core.schedule import generate_schedule_routes, resolve_origin
+
+
+def build_batch_records(routes, airline, aircraft, count, origin_iata=None, max_time=None, seed=None):
+    """Return count random routes as flat dicts with a SimBrief dispatch URL each.
+
+    Every route is drawn independently with the filter_routes semantics, from
+    origin_iata or from a random departure the aircraft can fly.
+    """
+    legs = generate_schedule_routes(
+        routes, airline, aircraft, count,
+        origin_iata=origin_iata,
+        chain=False,
+        max_time=max_time,
+        seed=seed
+    )
+
+    records = []
+    for route, leg in legs:
+        flight_ident = leg['flight_number'].split() or None
+        # The table row, not the leg: only it has estimated_time for the "Xh Ym" format
+        record = format_route_details(airline, aircraft, route)
+        record['flight_number'] = leg['flight_number']
+        record['distance_km'] = leg['distance_km']
+        record['estimated_time_min'] = leg['estimated_time_min']
+        record['simbrief_url'] = build_simbrief_url(airline, aircraft, leg, flight_ident)
+        records.append(record)
+    return records
+
+
+def run_batch_cli(argv=None):
+    parser = argparse.ArgumentParser(prog="main.py -batch", description="Print random routes without prompts")
+    parser.add_argument('--airline', required=True, help='Airline name as listed in airline_files.json')
+    parser.add_argument('--aircraft', required=True, help='Aircraft ICAO type, e.g. A320')
+    parser.add_argument('--origin', help='Departure airport (IATA or ICAO); random per route if omitted')
+    parser.add_argument('--max-time', type=int, help='Maximum flight time in minutes')
+    parser.add_argument('--count', type=int, default=1, help='Number of routes to print (default: 1)')
+    parser.add_argument('--format', choices=['jsonl', 'json'], default='jsonl',
+                        help='One JSON object per line, or a single JSON array (default: jsonl)')
+    parser.add_argument('--seed', type=int, help='Seed for reproducible output')
+    args = parser.parse_args(argv)
+
+    if args.airline not in get_airline_files():
+        parser.error(f"Unknown airline: {args.airline}")
+    try:
+        routes = load_routes(args.airline)
+    except FileNotFoundError as e:
+        parser.error(f"Route file missing for {args.airline} ({e.filename}), run buildData.py first")
+
+    origin = None
+    if args.origin:
+        origin = resolve_origin(routes, args.origin)
+        if origin is None:
+            parser.error(f"{args.origin} is not a departure airport for {args.airline}")
+
+    records = build_batch_records(routes, args.airline, args.aircraft, args.count, origin, args.max_time, args.seed)
+    if not records:
+        print("No valid routes found with current filters.", file=sys.stderr)
+        return 1
+
+    if args.format == 'json':
+        json.dump(records, sys.stdout, ensure_ascii=False)
+        sys.stdout.write("\n")
+    else:
+        sys.stdout.writelines(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+    return 0
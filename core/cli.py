@@ -1,15 +1,22 @@
 # CLI version
-from InquirerPy import inquirer
-import webbrowser
 from core.route_loader import load_routes, build_airport_index, get_airport_choices, extract_iata, get_airline_files, get_all_aircraft, get_airline_aircraft
 from core.logic import generate_random_route, build_simbrief_url
 
 
-def run_cli():
+def run_cli(on_ready=None):
+    # InquirerPy is the slowest import in the CLI path, so load it only when prompting
+    from InquirerPy import inquirer
+    import webbrowser
+
     while True:
+        airline_choices = list(get_airline_files().keys())
+        if on_ready is not None:
+            on_ready()
+            on_ready = None
+
         airline = inquirer.fuzzy(
             message="Select airline:",
-            choices=list(get_airline_files().keys())
+            choices=airline_choices
         ).execute()
 
         routes = load_routes(airline)
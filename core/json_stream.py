@@ -0,0 +1,159 @@
+import codecs
+import json
+import os
+import re
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_NUMBER_TAIL = re.compile(r'[0-9.eE+\-]*')
+
+
+class JsonStream:
+    """Incrementally decodes JSON values from a text file object.
+
+    Only the value currently being decoded (plus one read chunk) is held in
+    memory, so a large top-level container can be walked item by item.
+    """
+
+    def __init__(self, f, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def _read_more(self):
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._read_more():
+                return ''
+
+    def expect(self, chars):
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(f"Expected one of {chars!r} in JSON stream, got {char or 'end of file'!r}")
+        self.pos += 1
+        return char
+
+    def decode(self):
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            else:
+                # A number running up to the buffer edge may continue in the next chunk,
+                # including a cut like "12." or "1e" that raw_decode reads as a shorter number
+                if self.eof or not isinstance(value, (int, float)) or \
+                        _NUMBER_TAIL.match(self.buffer, end).end() < len(self.buffer):
+                    self.pos = end
+                    return value
+            self._read_more()
+
+    def skip(self):
+        """Advance past the next value, holding at most one of its elements in memory."""
+        char = self.peek()
+        if char not in ('{', '['):
+            self.decode()
+            return
+
+        # Decoding each element with the C scanner and dropping it is far quicker
+        # than tokenising in Python, and peak memory stays at one element
+        close = '}' if char == '{' else ']'
+        self.expect(char)
+        if self.peek() == close:
+            self.pos += 1
+            return
+        while True:
+            if close == '}':
+                self.decode()
+                self.expect(':')
+            self.decode()
+            if self.expect(',' + close) == close:
+                return
+
+
+def read_json_members(f, keys, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Decode only the given members of the top-level JSON object read from f.
+
+    Other members are stepped over without being built, and reading stops as
+    soon as every requested key has been seen. Returns {key: value} for the
+    keys that were present.
+    """
+    wanted = set(keys)
+    found = {}
+    stream = JsonStream(f, chunk_size)
+    stream.expect('{')
+    if stream.peek() == '}':
+        return found
+    while wanted:
+        key = stream.decode()
+        stream.expect(':')
+        if key in wanted:
+            found[key] = stream.decode()
+            wanted.discard(key)
+        else:
+            stream.skip()
+        if stream.expect(',}') == '}':
+            break
+    return found
+
+
+class ChunkReader:
+    """File-like text reader over an iterable of byte chunks, e.g. an HTTP response body."""
+
+    def __init__(self, chunks, encoding='utf-8'):
+        self.chunks = iter(chunks)
+        self.decoder = codecs.getincrementaldecoder(encoding)()
+
+    def read(self, size=-1):
+        # Returns one decoded chunk per call whatever the size; JsonStream only needs progress
+        for chunk in self.chunks:
+            text = self.decoder.decode(chunk)
+            if text:
+                return text
+        return self.decoder.decode(b'', final=True)
+
+
+def iter_json_object(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield (key, value) for each member of the top-level JSON object in path."""
+    with open(path, 'r', encoding='utf-8') as f:
+        stream = JsonStream(f, chunk_size)
+        stream.expect('{')
+        if stream.peek() == '}':
+            return
+        while True:
+            key = stream.decode()
+            stream.expect(':')
+            yield key, stream.decode()
+            if stream.expect(',}') == '}':
+                return
+
+
+def write_json_atomic(path, data, **dump_kwargs):
+    """json.dump data to path through a temporary file renamed over it.
+
+    An interrupted write never leaves a half-written file behind; readers see
+    either the old content or the new.
+    """
+    dump_kwargs.setdefault('indent', 2)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, **dump_kwargs)
+    os.replace(temp_path, path)
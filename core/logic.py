@@ -2,8 +2,10 @@ import random
 import json
 import os
 from core.route_loader import airline_supports_aircraft
+from core.route_table import as_route_table, route_supports
 
 _flight_number_config = None
+_flight_number_tables = None
 
 def _load_flight_number_config():
     global _flight_number_config
@@ -14,63 +16,106 @@ def _load_flight_number_config():
     return _flight_number_config
 
 
+def _compile_range_table(range_data):
+    # A table is ((low, span), ...) plus cumulative weights; every range is equally likely
+    ranges = range_data if isinstance(range_data[0], list) else [range_data]
+    ranges = tuple((low, high - low + 1) for low, high in ranges)
+    return ranges, tuple(range(1, len(ranges) + 1))
+
+
+def _load_flight_number_tables():
+    global _flight_number_tables
+    if _flight_number_tables is None:
+        tables = {}
+        for airline, airline_config in _load_flight_number_config().items():
+            tables[airline] = (
+                airline_config["prefix"],
+                _compile_range_table(airline_config["default_range"]),
+                {
+                    icao: _compile_range_table(range_data)
+                    for icao, range_data in airline_config.get("icao_ranges", {}).items()
+                }
+            )
+        _flight_number_tables = tables
+    return _flight_number_tables
+
+
+def _draw_flight_numbers(table, count, rng):
+    ranges, cum_weights = table
+    if len(ranges) == 1:
+        low, span = ranges[0]
+        return rng.choices(range(low, low + span), k=count)
+    
+    random_value = rng.random
+    return [
+        low + int(random_value() * span)
+        for low, span in rng.choices(ranges, cum_weights=cum_weights, k=count)
+    ]
+
+
 def genFlightNum(airline, departure_icao):
-    airline = airline.strip().lower()
-    departure_icao = departure_icao.strip().upper()
+    tables = _load_flight_number_tables()
+    airline_table = tables.get(airline.strip().lower())
+    if airline_table is None:
+        return "Unknown Airline"
     
-    config = _load_flight_number_config()
+    prefix, default_table, icao_tables = airline_table
+    table = icao_tables.get(departure_icao.strip().upper(), default_table)
+    return [prefix, _draw_flight_numbers(table, 1, random)[0]]
+
 
-    if airline not in config:
+def genFlightNums(airline, icaos, n=None, rng=None):
+    """Draw many flight numbers in one call.
+
+    icaos is either one departure ICAO, giving n (default 1) numbers from it,
+    or a sequence of departure ICAOs, giving one number per entry in order.
+    Pass a random.Random as rng for reproducible results.
+    """
+    tables = _load_flight_number_tables()
+    airline_table = tables.get(airline.strip().lower())
+    if airline_table is None:
         return "Unknown Airline"
     
-    airline_config = config[airline]
-    prefix = airline_config["prefix"]
+    prefix, default_table, icao_tables = airline_table
+    rng = rng or random
     
-    if departure_icao in airline_config["icao_ranges"]:
-        range_data = airline_config["icao_ranges"][departure_icao]
-        
-        if isinstance(range_data[0], list):
-            selected_range = random.choice(range_data)
-            flight_no = random.randint(selected_range[0], selected_range[1])
-        else:
-            flight_no = random.randint(range_data[0], range_data[1])
-    else:
-        default_range = airline_config["default_range"]
-        flight_no = random.randint(default_range[0], default_range[1])
+    if isinstance(icaos, str):
+        table = icao_tables.get(icaos.strip().upper(), default_table)
+        return [[prefix, flight_no] for flight_no in _draw_flight_numbers(table, 1 if n is None else n, rng)]
+    
+    icaos = list(icaos)
+    if n is not None and n != len(icaos):
+        raise ValueError(f"Expected {n} departure ICAOs, got {len(icaos)}")
     
-    return [prefix, flight_no]
+    # Draw per range table in bulk, then put the numbers back in leg order
+    positions = {}
+    for position, icao in enumerate(icaos):
+        positions.setdefault(icao_tables.get(icao.strip().upper(), default_table), []).append(position)
+    
+    flight_numbers = [None] * len(icaos)
+    for table, table_positions in positions.items():
+        for position, flight_no in zip(table_positions, _draw_flight_numbers(table, len(table_positions), rng)):
+            flight_numbers[position] = [prefix, flight_no]
+    return flight_numbers
 
 
 def filter_routes(routes, origin_iata, aircraft, airline_name, max_time=None):
-    filtered = []
-
-    for r in routes:
-        if r["from"] != origin_iata:
-            continue
-
-        support_key = f"supports_{aircraft.lower()}"
-        if support_key in r and not r[support_key]:
-            continue
-
-        if max_time and r["estimated_time_min"] > max_time:
-            continue
-
-        filtered.append(r)
-
-    return filtered
+    table = as_route_table(routes)
+    return [table[i] for i in table.select(origin_iata, aircraft, max_time)]
 
 
 def generate_random_route(routes, origin_iata, aircraft, airline_name, max_time=None):
-    filtered = filter_routes(routes, origin_iata, aircraft, airline_name, max_time)
+    table = as_route_table(routes)
+    matches = table.select(origin_iata, aircraft, max_time)
     
-    if not filtered:
+    if not matches:
         return None
     
-    return random.choice(filtered)
+    return table[random.choice(matches)]
 
 
-def build_simbrief_url(airline, aircraft, route):
-    flight_ident_details = genFlightNum(airline, route.get('from_icao'))
+def build_simbrief_url(airline, aircraft, route, flight_ident=None):
+    flight_ident_details = flight_ident or genFlightNum(airline, route.get('from_icao'))
     
     url = (
         "https://dispatch.simbrief.com/options/custom?"
@@ -117,59 +162,60 @@ def verify_route(routes, departure_iata, arrival_iata, aircraft, airline_name):
         'suggestions': []
     }
     
+    table = as_route_table(routes)
+    departure_iata = departure_iata.upper()
+    arrival_iata = arrival_iata.upper()
+    
     matching_route = None
     departure_icao = None
     arrival_icao = None
     
-    for route in routes:
-        if route['from'] == departure_iata.upper() and route['to'] == arrival_iata.upper():
-            matching_route = route
-            departure_icao = route.get('from_icao', departure_iata.upper())
-            arrival_icao = route.get('to_icao', arrival_iata.upper())
-            break
-        if route['from'] == departure_iata.upper() and not departure_icao:
-            departure_icao = route.get('from_icao', departure_iata.upper())
+    pair_rows = table.by_pair.get((departure_iata, arrival_iata))
+    origin_rows = table.by_origin.get(departure_iata, [])
+    
+    if pair_rows:
+        matching_route = table[pair_rows[0]]
+        departure_icao = matching_route.get('from_icao', departure_iata)
+        arrival_icao = matching_route.get('to_icao', arrival_iata)
+    elif origin_rows:
+        departure_icao = table[origin_rows[0]].get('from_icao', departure_iata)
     
     if not departure_icao:
-        departure_icao = departure_iata.upper()
+        departure_icao = departure_iata
     if not arrival_icao:
-        arrival_icao = arrival_iata.upper()
+        arrival_icao = arrival_iata
     
     if not matching_route:
         result['reason'] = f"No route found from {departure_icao} to {arrival_icao} for {airline_name}"
         
-        departure_exists = any(r['from'] == departure_iata.upper() for r in routes)
-        arrival_exists = any(r['to'] == arrival_iata.upper() for r in routes)
+        departure_exists = bool(origin_rows)
+        arrival_exists = arrival_iata in table.by_destination
         
         if not departure_exists:
             result['suggestions'].append(f"{departure_icao} is not a departure airport for {airline_name}")
         else:
-            possible_routes = [r for r in routes if r['from'] == departure_iata.upper()]
-            if possible_routes:
-                sample_size = min(5, len(possible_routes))
-                sampled_routes = random.sample(possible_routes, sample_size)
-                dest_details = []
-                for route in sampled_routes:
-                    to_icao = route.get('to_icao', route['to'])
-                    time = route['estimated_time_min']
-                    dest_details.append(f"{to_icao} (~{time}min)")
-                
-                dest_sample = ', '.join(dest_details)
-                result['suggestions'].append(f"Possible destinations from {departure_icao}: {dest_sample}")
+            sample_size = min(5, len(origin_rows))
+            sampled_routes = [table[i] for i in random.sample(origin_rows, sample_size)]
+            dest_details = []
+            for route in sampled_routes:
+                to_icao = route.get('to_icao', route['to'])
+                time = route['estimated_time_min']
+                dest_details.append(f"{to_icao} (~{time}min)")
+            
+            dest_sample = ', '.join(dest_details)
+            result['suggestions'].append(f"Possible destinations from {departure_icao}: {dest_sample}")
         
         if not arrival_exists:
             result['suggestions'].append(f"{arrival_icao} is not an arrival airport for {airline_name}")
         
         return result
     
-    support_key = f"supports_{aircraft.lower()}"
     aircraft_supported = True
     aircraft_note = None
     
-    if support_key in matching_route:
-        if not matching_route[support_key]:
-            aircraft_supported = False
-            aircraft_note = f"{aircraft} may not be typically used on this route"
+    if not route_supports(matching_route, aircraft):
+        aircraft_supported = False
+        aircraft_note = f"{aircraft} may not be typically used on this route"
     
     result['valid'] = True
     result['route_info'] = {
@@ -0,0 +1,103 @@
+import json
+import os
+from core.json_stream import write_json_atomic
+from core.route_loader import get_airline_files, load_airline_data
+
+_airline_lookup = None
+_airport_catalog = None
+
+
+def _config_path(filename):
+    return os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config', filename)
+
+
+def build_airline_lookup(airlines):
+    """Build {airline ICAO: {"name", "callsign"}} from (name, icao, callsign) tuples."""
+    lookup = {}
+    for airline_name, icao, callsign in airlines:
+        if icao:
+            lookup.setdefault(icao.upper(), {
+                "name": airline_name,
+                "callsign": callsign or ''
+            })
+    return lookup
+
+
+def build_airport_catalog(routes_by_airline):
+    """Build {airport ICAO: {"iata", "name"}} for every airport in the given routes."""
+    catalog = {}
+    for routes in routes_by_airline.values():
+        for route in routes:
+            for side in ("from", "to"):
+                icao = route.get(f"{side}_icao")
+                if icao and icao not in catalog:
+                    catalog[icao] = {
+                        "iata": route[side],
+                        "name": route.get(f"{side}_name", '')
+                    }
+    return dict(sorted(catalog.items()))
+
+
+def save_lookup(data, filename):
+    write_json_atomic(_config_path(filename), data, ensure_ascii=False)
+
+
+def _read_lookup(filename):
+    path = _config_path(filename)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _scan_airline_files():
+    # Fallback for data built before the lookup tables existed; runs once per session
+    airlines = []
+    routes_by_airline = {}
+    for airline_name in get_airline_files().keys():
+        try:
+            airline_data = load_airline_data(airline_name, use_cache=False)
+        except Exception:
+            continue
+        airlines.append((airline_name, airline_data.get('icao', ''), airline_data.get('callsign', '')))
+        routes_by_airline[airline_name] = airline_data.get('routes', [])
+    return airlines, routes_by_airline
+
+
+def _load_airline_lookup():
+    global _airline_lookup
+    if _airline_lookup is None:
+        lookup = _read_lookup('airline_lookup.json')
+        if lookup is None:
+            airlines, _ = _scan_airline_files()
+            lookup = build_airline_lookup(airlines)
+        _airline_lookup = lookup
+    return _airline_lookup
+
+
+def _load_airport_catalog():
+    global _airport_catalog
+    if _airport_catalog is None:
+        catalog = _read_lookup('airport_catalog.json')
+        if catalog is None:
+            _, routes_by_airline = _scan_airline_files()
+            catalog = build_airport_catalog(routes_by_airline)
+        _airport_catalog = catalog
+    return _airport_catalog
+
+
+def get_airline_for_icao(airline_icao):
+    if not airline_icao:
+        return None
+    return _load_airline_lookup().get(airline_icao.upper())
+
+
+def get_airport_catalog():
+    return _load_airport_catalog()
+
+
+def get_iata_for_airport(airport_icao):
+    if not airport_icao:
+        return None
+    airport = _load_airport_catalog().get(airport_icao.upper())
+    return airport["iata"] if airport else None
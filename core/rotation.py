@@ -0,0 +1,131 @@
+import heapq
+import random
+from core.route_table import as_route_table
+
+DEFAULT_MAX_EXPANSIONS = 200000
+
+
+class RouteGraph:
+    """An airline's network for one aircraft as a directed graph.
+
+    Nodes are airport IATA codes and edges are the routes the aircraft can
+    fly, weighted by estimated_time_min. Adjacency lists are built once;
+    shortest times back to a hub are computed on demand and cached.
+    """
+
+    def __init__(self, routes, aircraft=None):
+        self.table = as_route_table(routes)
+        self.aircraft = aircraft
+        columns = self.table.columns
+        origins = columns['from']
+        destinations = columns['to']
+        times = columns['estimated_time_min']
+
+        self.adjacency = {}
+        reverse = {}
+        for row in self.table.select(aircraft=aircraft):
+            origin, destination, minutes = origins[row], destinations[row], times[row]
+            self.adjacency.setdefault(origin, []).append((destination, minutes, row))
+            # Only the quickest edge per pair matters for the return-time bound
+            into = reverse.setdefault(destination, {})
+            if minutes < into.get(origin, float('inf')):
+                into[origin] = minutes
+        for edges in self.adjacency.values():
+            edges.sort(key=lambda edge: edge[1])
+
+        self._reverse = reverse
+        self._return_times = {}
+
+    def return_times(self, hub):
+        """Shortest flying time from every airport back to hub (Dijkstra on reversed edges)."""
+        best = self._return_times.get(hub)
+        if best is not None:
+            return best
+
+        best = {hub: 0}
+        heap = [(0, hub)]
+        while heap:
+            elapsed, airport = heapq.heappop(heap)
+            if elapsed > best[airport]:
+                continue
+            for origin, minutes in self._reverse.get(airport, {}).items():
+                total = elapsed + minutes
+                if total < best.get(origin, float('inf')):
+                    best[origin] = total
+                    heapq.heappush(heap, (total, origin))
+
+        self._return_times[hub] = best
+        return best
+
+
+def plan_rotation(routes, hub, aircraft, max_duty_min, min_legs=2, max_legs=6,
+                  turnaround_min=0, seed=None, max_expansions=DEFAULT_MAX_EXPANSIONS):
+    """Find a rotation that leaves hub, returns to it and fits within max_duty_min.
+
+    Only legs the aircraft can fly are used and no airport other than the hub
+    is visited twice. Duty time is the sum of leg times plus turnaround_min
+    between consecutive legs. Edges are tried in a seeded random order, and any
+    leg after which the hub can no longer be reached in time is pruned using
+    the precomputed shortest return times. Returns None if no rotation with
+    min_legs..max_legs legs exists or the search exceeds max_expansions.
+    A prebuilt RouteGraph must have been built for the same aircraft.
+    """
+    if isinstance(routes, RouteGraph):
+        graph = routes
+        if graph.aircraft != aircraft:
+            raise ValueError(f"Route graph was built for {graph.aircraft or 'any aircraft'}, not {aircraft}")
+    else:
+        graph = RouteGraph(routes, aircraft)
+    hub = hub.strip().upper()
+    if hub not in graph.adjacency:
+        return None
+
+    rng = random.Random(seed)
+    to_hub = graph.return_times(hub)
+    table = graph.table
+    path = []
+    visited = {hub}
+    expansions = 0
+
+    def search(airport, elapsed):
+        nonlocal expansions
+        edges = [edge for edge in graph.adjacency.get(airport, ()) if edge[0] in to_hub]
+        rng.shuffle(edges)
+        for destination, minutes, row in edges:
+            expansions += 1
+            if expansions > max_expansions:
+                return None
+
+            total = elapsed + minutes
+            if destination == hub:
+                if len(path) + 1 >= min_legs and total <= max_duty_min:
+                    return path + [row], total
+                continue
+            if destination in visited or len(path) + 2 > max_legs:
+                continue
+            # Lower bound on finishing: this leg, a turnaround, then the quickest way home
+            if total + turnaround_min + to_hub[destination] > max_duty_min:
+                continue
+
+            path.append(row)
+            visited.add(destination)
+            found = search(destination, total + turnaround_min)
+            path.pop()
+            visited.discard(destination)
+            if found is not None or expansions > max_expansions:
+                return found
+        return None
+
+    found = search(hub, 0)
+    if found is None:
+        return None
+
+    rows, duty_time = found
+    legs = [table[row] for row in rows]
+    return {
+        "hub": hub,
+        "aircraft": aircraft,
+        "legs": legs,
+        "flight_time_min": sum(leg['estimated_time_min'] for leg in legs),
+        "duty_time_min": duty_time
+    }
@@ -0,0 +1,112 @@
+import os
+import threading
+from collections import OrderedDict
+
+DEFAULT_MAX_ENTRIES = 16
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def _file_stamp(paths):
+    stamp = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+            stamp.append((path, st.st_mtime_ns, st.st_size))
+        except OSError:
+            stamp.append((path, None, 0))
+    return tuple(stamp)
+
+
+class RouteCache:
+    """LRU cache of parsed airline data, invalidated when the source files change.
+
+    Entries are weighed by the size of their files on disk, which tracks the
+    parsed size closely enough to keep memory bounded by max_bytes.
+    on_evict, if given, is called with each value that is evicted or cleared,
+    so it can release files the value holds open.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES, on_evict=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.on_evict = on_evict
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, paths, loader):
+        stamp = _file_stamp(paths)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stamp:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        value = loader()
+        size = sum(file_size for _, _, file_size in stamp)
+
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = (stamp, value, size)
+            self._bytes += size
+            evicted = self._evict()
+        self._release(evicted)
+        return value
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+    def _evict(self):
+        # Always keep the most recent entry, even if it alone exceeds the budget
+        evicted = []
+        while len(self._entries) > 1 and (
+            (self.max_entries and len(self._entries) > self.max_entries) or
+            (self.max_bytes and self._bytes > self.max_bytes)
+        ):
+            _, (_, value, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+            evicted.append(value)
+        return evicted
+
+    def _release(self, values):
+        # Called outside the lock; on_evict may close files
+        if self.on_evict is not None:
+            for value in values:
+                self.on_evict(value)
+
+    def configure(self, max_entries=None, max_bytes=None):
+        with self._lock:
+            if max_entries is not None:
+                self.max_entries = max_entries
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            evicted = self._evict()
+        self._release(evicted)
+
+    def clear(self):
+        with self._lock:
+            cleared = [value for _, value, _ in self._entries.values()]
+            self._entries.clear()
+            self._bytes = 0
+        self._release(cleared)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
@@ -0,0 +1,133 @@
+import json
+import os
+from core.json_stream import write_json_atomic
+from core.route_loader import get_airline_files, load_routes
+from core.route_table import get_aircraft_bits, route_support_mask, route_supports
+
+ROUTE_INDEX_VERSION = 1
+
+_route_index = None
+
+
+def _route_index_path():
+    return os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config', 'route_index.json')
+
+
+def build_route_index(routes_by_airline):
+    """Build the cross-airline (from_icao, to_icao) index from {airline: routes}."""
+    airlines = []
+    airports = {}
+    pairs = {}
+
+    for airline_name, routes in routes_by_airline.items():
+        airline_idx = None
+        for route in routes:
+            from_icao = route.get('from_icao')
+            to_icao = route.get('to_icao')
+            if not from_icao or not to_icao:
+                continue
+
+            if airline_idx is None:
+                airline_idx = len(airlines)
+                airlines.append(airline_name)
+
+            airports.setdefault(from_icao, route.get('from_name', from_icao))
+            airports.setdefault(to_icao, route.get('to_name', to_icao))
+
+            destinations = pairs.setdefault(from_icao, {})
+            destinations.setdefault(to_icao, []).append([
+                airline_idx,
+                route['distance_km'],
+                route['estimated_time_min'],
+                route_support_mask(route)
+            ])
+
+    return {
+        "version": ROUTE_INDEX_VERSION,
+        "aircraft": list(get_aircraft_bits()),
+        "airlines": airlines,
+        "airports": airports,
+        "pairs": pairs
+    }
+
+
+def save_route_index(index, path=None):
+    # Atomic, so an interrupted build can't leave the Airline Finder a truncated index
+    write_json_atomic(path or _route_index_path(), index, indent=None, separators=(',', ':'))
+
+
+def load_route_index():
+    global _route_index
+    if _route_index is None:
+        path = _route_index_path()
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        if index.get('version') != ROUTE_INDEX_VERSION:
+            return None
+        index['aircraft_bits'] = {code: 1 << bit for bit, code in enumerate(index['aircraft'])}
+        _route_index = index
+    return _route_index
+
+
+def _route_details(index, from_icao, to_icao, entry):
+    airports = index['airports']
+    return {
+        'from_icao': from_icao,
+        'from_name': airports.get(from_icao, from_icao),
+        'to_icao': to_icao,
+        'to_name': airports.get(to_icao, to_icao),
+        'distance_km': entry[1],
+        'estimated_time_min': entry[2]
+    }
+
+
+def find_airlines_for_pair(departure_icao, arrival_icao, aircraft_code=None):
+    departure_icao = departure_icao.strip().upper()
+    arrival_icao = arrival_icao.strip().upper()
+
+    index = load_route_index()
+    if index is None:
+        return _scan_airlines_for_pair(departure_icao, arrival_icao, aircraft_code)
+
+    entries = index['pairs'].get(departure_icao, {}).get(arrival_icao, [])
+    if aircraft_code:
+        bit = index['aircraft_bits'].get(aircraft_code.upper(), 0)
+        entries = [entry for entry in entries if entry[3] & bit]
+
+    matching_airlines = []
+    seen = set()
+    for entry in entries:
+        if entry[0] in seen:
+            continue
+        seen.add(entry[0])
+        matching_airlines.append({
+            'airline': index['airlines'][entry[0]],
+            'route_details': _route_details(index, departure_icao, arrival_icao, entry)
+        })
+
+    return matching_airlines
+
+
+def _scan_airlines_for_pair(departure_icao, arrival_icao, aircraft_code=None):
+    # Fallback for data built before config/route_index.json existed
+    matching_airlines = []
+
+    for airline_name in get_airline_files().keys():
+        try:
+            routes = load_routes(airline_name, use_cache=False)
+        except Exception:
+            continue
+
+        for route in routes:
+            if (route.get('from_icao') == departure_icao and
+                route.get('to_icao') == arrival_icao):
+                if not aircraft_code or route_supports(route, aircraft_code, default=False):
+                    matching_airlines.append({
+                        'airline': airline_name,
+                        'route_details': route
+                    })
+                    break
+
+    return matching_airlines
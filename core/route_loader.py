@@ -1,11 +1,23 @@
 import json
 import os
 import csv
+from core.route_cache import RouteCache
+from core.route_store import open_route_store, route_store_path
+from core.route_table import RouteTable
 
 _airline_files = None
 _aircraft_support = None
 _aircraft_data = None
 
+
+def _close_airline_data(airline_data):
+    routes = airline_data["routes"].routes
+    if hasattr(routes, "close"):
+        routes.close()
+
+
+_route_cache = RouteCache(on_evict=_close_airline_data)
+
 def _load_airline_files():
     global _airline_files
     if _airline_files is None:
@@ -64,16 +76,44 @@ def airline_supports_aircraft(airline_name, aircraft_code):
     return aircraft_code in valid_aircraft
 
 
-def load_routes(airline_name):
-    airline_files = _load_airline_files()
-    with open(airline_files[airline_name], "r", encoding="utf-8") as f:
-        return json.load(f)["routes"]
+def get_route_cache():
+    return _route_cache
+
+
+def configure_route_cache(max_entries=None, max_bytes=None):
+    _route_cache.configure(max_entries=max_entries, max_bytes=max_bytes)
+
+
+def load_routes(airline_name, use_cache=True):
+    return load_airline_data(airline_name, use_cache)["routes"]
 
 
-def load_airline_data(airline_name):
+def load_airline_data(airline_name, use_cache=True):
     airline_files = _load_airline_files()
-    with open(airline_files[airline_name], "r", encoding="utf-8") as f:
-        return json.load(f)
+    route_file = airline_files[airline_name]
+
+    if not use_cache:
+        return _read_airline_data(route_file)
+
+    airline_data = _route_cache.get(
+        airline_name,
+        (route_file, route_store_path(route_file)),
+        lambda: _read_airline_data(route_file)
+    )
+    # Shallow copy so callers can't change the cached entry; the route table is shared
+    return dict(airline_data)
+
+
+def _read_airline_data(route_file):
+    store = open_route_store(route_file)
+    if store is not None:
+        airline_data = store.airline_data()
+    else:
+        with open(route_file, "r", encoding="utf-8") as f:
+            airline_data = json.load(f)
+
+    airline_data["routes"] = RouteTable(airline_data["routes"])
+    return airline_data
 
 
 def build_airport_index(routes):
@@ -0,0 +1,293 @@
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from collections.abc import Sequence
+from core.route_table import get_aircraft_bits, route_support_mask
+
+# Columnar binary route files (data/{airline}_routes.bin).
+#
+# Layout: MAGIC, uint16 version, uint16 reserved, uint32 header length, JSON header,
+# then 8-byte aligned blocks. Airport names and codes live once in a shared string
+# table and route columns refer to them by index. Aircraft support masks use the
+# fixed bit order of config/aircraft_bits.json, split into 64-bit words.
+
+MAGIC = b"MSRC"
+ROUTE_STORE_VERSION = 2
+_PREAMBLE = struct.Struct("<4sHHI")
+
+_STRING_COLUMNS = ("from", "from_name", "from_icao", "to", "to_name", "to_icao")
+
+
+def route_store_path(route_file):
+    return os.path.splitext(route_file)[0] + ".bin"
+
+
+def _align(offset):
+    return (offset + 7) & ~7
+
+
+def write_route_store(path, airline_data):
+    routes = airline_data["routes"]
+
+    aircraft = list(get_aircraft_bits())
+    words = max(1, (len(aircraft) + 63) // 64)
+
+    strings = []
+    string_ids = {}
+
+    def intern(value):
+        value = value or ""
+        if value not in string_ids:
+            string_ids[value] = len(strings)
+            strings.append(value)
+        return string_ids[value]
+
+    columns = {name: array("I") for name in _STRING_COLUMNS}
+    distance_int = all(isinstance(r["distance_km"], int) for r in routes)
+    columns["distance_km"] = array("q" if distance_int else "d")
+    columns["estimated_time_min"] = array("I")
+    columns["support"] = array("Q")
+
+    for route in routes:
+        for name in _STRING_COLUMNS:
+            columns[name].append(intern(route.get(name, "")))
+        columns["distance_km"].append(route["distance_km"])
+        columns["estimated_time_min"].append(route["estimated_time_min"])
+
+        # Same default as route_supports: a legacy route without supports_* keys flies anything
+        mask = route_support_mask(route, default=True)
+        for word in range(words):
+            columns["support"].append((mask >> (64 * word)) & 0xFFFFFFFFFFFFFFFF)
+
+    encoded = [s.encode("utf-8") for s in strings]
+    string_offsets = array("I", [0])
+    for data in encoded:
+        string_offsets.append(string_offsets[-1] + len(data))
+    blocks = {
+        "string_offsets": string_offsets.tobytes(),
+        "string_data": b"".join(encoded),
+    }
+    for name, column in columns.items():
+        blocks[name] = column.tobytes()
+
+    header = {
+        "airline": airline_data.get("airline", ""),
+        "iata": airline_data.get("iata", ""),
+        "icao": airline_data.get("icao", ""),
+        "callsign": airline_data.get("callsign", ""),
+        "count": len(routes),
+        "aircraft": aircraft,
+        "support_words": words,
+        "byteorder": sys.byteorder,
+        "types": {name: column.typecode for name, column in columns.items()},
+        "blocks": {},
+    }
+
+    # Block offsets depend on the header length, so size the header with
+    # placeholder offsets first and then fill them in.
+    for name in blocks:
+        header["blocks"][name] = [0, 0]
+    header_len = len(json.dumps(header).encode("utf-8")) + 24 * len(blocks)
+    offset = _align(_PREAMBLE.size + header_len)
+    for name, data in blocks.items():
+        header["blocks"][name] = [offset, len(data)]
+        offset = _align(offset + len(data))
+    header_bytes = json.dumps(header).encode("utf-8").ljust(header_len)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_PREAMBLE.pack(MAGIC, ROUTE_STORE_VERSION, 0, header_len))
+        f.write(header_bytes)
+        for name, data in blocks.items():
+            f.seek(header["blocks"][name][0])
+            f.write(data)
+    os.replace(tmp_path, path)
+
+
+class _MappedRouteStore:
+    """One mapping of a route store file and the column views over it.
+
+    RouteStore swaps these in and out as a whole, so a reader holds either a
+    complete mapping or none; a mapping still in use can't be unmapped
+    because its views are exported.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, header_len = _PREAMBLE.unpack_from(self.mmap, 0)
+        if magic != MAGIC or version != ROUTE_STORE_VERSION:
+            self.mmap.close()
+            raise ValueError(f"{path} is not a version {ROUTE_STORE_VERSION} route store")
+
+        start = _PREAMBLE.size
+        self.header = json.loads(bytes(self.mmap[start:start + header_len]))
+        if self.header["byteorder"] != sys.byteorder:
+            self.mmap.close()
+            raise ValueError(f"{path} was built on a {self.header['byteorder']}-endian machine")
+
+        view = memoryview(self.mmap)
+        blocks = {}
+        for name, (offset, length) in self.header["blocks"].items():
+            blocks[name] = view[offset:offset + length]
+
+        self.string_offsets = blocks["string_offsets"].cast("I")
+        self.string_data = blocks["string_data"]
+        self.columns = {
+            name: blocks[name].cast(typecode)
+            for name, typecode in self.header["types"].items()
+        }
+
+
+def _close_mmap(mapping):
+    # Callers drop their own _MappedRouteStore first; only readers' views can still pin the map
+    try:
+        mapping.close()
+    except BufferError:
+        # A reader still holds a column view; the map is released with it
+        pass
+
+
+class RouteStore(Sequence):
+    """Read-only, memory-mapped view of a binary route file.
+
+    Behaves like the "routes" list of the JSON file; route dicts are only
+    built when an item is accessed. close() releases the mapping; a store
+    that is used again afterwards maps the file again, as long as it has
+    not been replaced in the meantime. close() is safe to call while other
+    threads are reading.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._mapped = None
+        self._strings = {}
+        self.header = self._map().header
+
+        self.aircraft = self.header["aircraft"]
+        self._words = self.header["support_words"]
+        self._count = self.header["count"]
+
+    def _map(self):
+        with self._lock:
+            mapped = self._mapped
+            if mapped is None:
+                mapped = _MappedRouteStore(self.path)
+                if getattr(self, "header", mapped.header) != mapped.header:
+                    mapping = mapped.mmap
+                    del mapped
+                    _close_mmap(mapping)
+                    raise ValueError(f"{self.path} was replaced after this route store was closed")
+                self._mapped = mapped
+            return mapped
+
+    @property
+    def columns(self):
+        return (self._mapped or self._map()).columns
+
+    @property
+    def closed(self):
+        return self._mapped is None
+
+    def close(self):
+        with self._lock:
+            mapped, self._mapped = self._mapped, None
+        if mapped is None:
+            return
+        mapping = mapped.mmap
+        del mapped
+        _close_mmap(mapping)
+
+    def string(self, string_id):
+        value = self._strings.get(string_id)
+        if value is None:
+            mapped = self._mapped or self._map()
+            start = mapped.string_offsets[string_id]
+            end = mapped.string_offsets[string_id + 1]
+            value = str(mapped.string_data[start:end], "utf-8")
+            self._strings[string_id] = value
+        return value
+
+    def support_mask(self, i):
+        support = self.columns["support"]
+        base = i * self._words
+        mask = 0
+        for word in range(self._words):
+            mask |= support[base + word] << (64 * word)
+        return mask
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._count))]
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("route index out of range")
+
+        columns = self.columns
+        route = {name: self.string(columns[name][i]) for name in _STRING_COLUMNS}
+        route["distance_km"] = columns["distance_km"][i]
+        minutes = columns["estimated_time_min"][i]
+        route["estimated_time_min"] = minutes
+        if minutes >= 60:
+            route["estimated_time"] = {"hours": minutes // 60, "minutes": minutes % 60}
+
+        route["support_mask"] = self.support_mask(i)
+        return route
+
+    def route_columns(self):
+        columns = self.columns
+        if self._words == 1:
+            masks = columns["support"]
+        else:
+            masks = [self.support_mask(i) for i in range(self._count)]
+        return {
+            "from": [self.string(string_id) for string_id in columns["from"]],
+            "to": [self.string(string_id) for string_id in columns["to"]],
+            "estimated_time_min": columns["estimated_time_min"],
+            "support_mask": masks
+        }
+
+    def airline_data(self):
+        return {
+            "airline": self.header["airline"],
+            "iata": self.header["iata"],
+            "icao": self.header["icao"],
+            "callsign": self.header["callsign"],
+            "routes": self
+        }
+
+
+def open_route_store(route_file):
+    """Open the binary store for a JSON route file if one exists and is up to date."""
+    store_path = route_store_path(route_file)
+    if not os.path.exists(store_path):
+        return None
+    if os.path.exists(route_file) and os.path.getmtime(route_file) > os.path.getmtime(store_path):
+        return None
+    try:
+        return RouteStore(store_path)
+    except (ValueError, OSError, struct.error):
+        return None
+
+
+def convert_route_file(route_file):
+    with open(route_file, "r", encoding="utf-8") as f:
+        airline_data = json.load(f)
+    store_path = route_store_path(route_file)
+    write_route_store(store_path, airline_data)
+    return store_path
+
+
+if __name__ == "__main__":
+    for route_file in sys.argv[1:]:
+        print(f"{route_file} -> {convert_route_file(route_file)}")
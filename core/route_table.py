@@ -0,0 +1,164 @@
+import json
+import os
+from array import array
+from collections.abc import Sequence
+from functools import cached_property
+
+_aircraft_bits = None
+
+
+def _load_aircraft_bits():
+    global _aircraft_bits
+    if _aircraft_bits is None:
+        bits_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config', 'aircraft_bits.json')
+        bit_order = []
+        if os.path.exists(bits_path):
+            with open(bits_path, 'r', encoding='utf-8') as f:
+                bit_order = json.load(f)
+        _aircraft_bits = {code: bit for bit, code in enumerate(bit_order)}
+    return _aircraft_bits
+
+
+def get_aircraft_bits():
+    return _load_aircraft_bits()
+
+
+def route_support_mask(route, default=False):
+    mask = route.get('support_mask')
+    if mask is not None:
+        return mask
+
+    # Legacy route files carry one supports_<icao> key per aircraft
+    mask = 0
+    for code, bit in _load_aircraft_bits().items():
+        if route.get(f"supports_{code.lower()}", default):
+            mask |= 1 << bit
+    return mask
+
+
+def route_supports(route, aircraft_code, default=True):
+    mask = route.get('support_mask')
+    if mask is None:
+        return route.get(f"supports_{aircraft_code.lower()}", default)
+
+    bit = _load_aircraft_bits().get(aircraft_code.upper())
+    if bit is None:
+        return default
+    return bool(mask >> bit & 1)
+
+
+class RouteTable(Sequence):
+    """An airline's routes plus flat column arrays used for filtering.
+
+    Indexing and iteration return the original route dicts, so a RouteTable can
+    be used anywhere the "routes" list was. Columns and the by_origin,
+    by_destination and by_pair indexes (IATA code or (from, to) pair -> row
+    indices) are built once, on first use.
+    """
+
+    def __init__(self, routes):
+        self.routes = routes
+        self._departures = {}
+
+    def __len__(self):
+        return len(self.routes)
+
+    def __getitem__(self, i):
+        return self.routes[i]
+
+    def __iter__(self):
+        return iter(self.routes)
+
+    @cached_property
+    def columns(self):
+        # Binary route stores already hold these columns
+        route_columns = getattr(self.routes, 'route_columns', None)
+        if route_columns is not None:
+            return route_columns()
+
+        return {
+            'from': [r['from'] for r in self.routes],
+            'to': [r['to'] for r in self.routes],
+            'estimated_time_min': array('I', (r['estimated_time_min'] for r in self.routes)),
+            'support_mask': [route_support_mask(r, default=True) for r in self.routes]
+        }
+
+    @cached_property
+    def by_origin(self):
+        return self._group_rows(self.columns['from'])
+
+    @cached_property
+    def by_destination(self):
+        return self._group_rows(self.columns['to'])
+
+    @cached_property
+    def by_pair(self):
+        return self._group_rows(zip(self.columns['from'], self.columns['to']))
+
+    def build_origin_index(self):
+        """Build the columns and by_origin index now, e.g. on a worker thread, instead of on first use."""
+        return self.by_origin
+
+    @staticmethod
+    def _group_rows(keys):
+        index = {}
+        for row, key in enumerate(keys):
+            rows = index.get(key)
+            if rows is None:
+                index[key] = [row]
+            else:
+                rows.append(row)
+        return index
+
+    def routes_from(self, origin_iata):
+        return [self.routes[i] for i in self.by_origin.get(origin_iata, ())]
+
+    def routes_to(self, destination_iata):
+        return [self.routes[i] for i in self.by_destination.get(destination_iata, ())]
+
+    def routes_between(self, origin_iata, destination_iata):
+        return [self.routes[i] for i in self.by_pair.get((origin_iata, destination_iata), ())]
+
+    def aircraft_bit(self, aircraft):
+        if not aircraft:
+            return 0
+        bit = _load_aircraft_bits().get(aircraft.upper())
+        return 0 if bit is None else 1 << bit
+
+    def select(self, origin_iata=None, aircraft=None, max_time=None):
+        """Return the indices of routes matching the same filters as filter_routes."""
+        columns = self.columns
+        times = columns['estimated_time_min']
+        masks = columns['support_mask']
+        bit = self.aircraft_bit(aircraft)
+
+        if origin_iata is not None:
+            indices = self.by_origin.get(origin_iata, [])
+        else:
+            indices = range(len(self))
+
+        if bit:
+            indices = [i for i in indices if masks[i] & bit]
+        if max_time:
+            indices = [i for i in indices if times[i] <= max_time]
+
+        return list(indices)
+
+    def departures(self, aircraft=None):
+        """Origins with at least one route the aircraft can fly, cached per aircraft."""
+        departures = self._departures.get(aircraft)
+        if departures is None:
+            bit = self.aircraft_bit(aircraft)
+            masks = self.columns['support_mask']
+            departures = [
+                origin for origin, rows in self.by_origin.items()
+                if not bit or any(masks[i] & bit for i in rows)
+            ]
+            self._departures[aircraft] = departures
+        return departures
+
+
+def as_route_table(routes):
+    if isinstance(routes, RouteTable):
+        return routes
+    return RouteTable(routes)
@@ -0,0 +1,181 @@
+import argparse
+import csv
+import json
+import random
+import sys
+from core.route_loader import load_routes, get_airline_files
+from core.route_table import as_route_table
+from core.logic import genFlightNums
+
+SCHEDULE_FIELDS = [
+    "leg", "flight_number", "from", "from_icao", "from_name",
+    "to", "to_icao", "to_name", "distance_km", "estimated_time_min"
+]
+
+
+class _CandidateCache:
+    """Memoises RouteTable.select per origin, so long chains only filter each airport once."""
+
+    def __init__(self, table, aircraft, max_time):
+        self.table = table
+        self.aircraft = aircraft
+        self.max_time = max_time
+        self._by_origin = {}
+
+    def get(self, origin_iata):
+        candidates = self._by_origin.get(origin_iata)
+        if candidates is None:
+            candidates = self.table.select(origin_iata, self.aircraft, self.max_time)
+            self._by_origin[origin_iata] = candidates
+        return candidates
+
+
+def _pick(rng, table, candidates, visited):
+    if visited:
+        candidates = [i for i in candidates if table.columns['to'][i] not in visited]
+    if not candidates:
+        return None
+    return rng.choice(candidates)
+
+
+def _random_origin_leg(rng, table, cache, aircraft, visited):
+    # Not every departure has a route under max_time, so draw origins until one does
+    origins = list(table.departures(aircraft))
+    while origins:
+        origin = origins.pop(rng.randrange(len(origins)))
+        row = _pick(rng, table, cache.get(origin), visited)
+        if row is not None:
+            return row
+    return None
+
+
+def generate_schedule(routes, airline, aircraft, legs, origin_iata=None, chain=True,
+                      max_time=None, unique_destinations=False, seed=None):
+    """Generate up to `legs` random legs for an airline and aircraft.
+
+    Legs use the same filters as filter_routes. With chain=True each leg
+    departs from the previous leg's destination, starting at origin_iata
+    (or a random departure). Otherwise every leg departs from origin_iata,
+    or from a random departure when none is given. unique_destinations
+    never revisits an arrival airport. Fewer legs are returned if the
+    network runs out of matching routes.
+    """
+    return [leg for _, leg in generate_schedule_routes(
+        routes, airline, aircraft, legs, origin_iata, chain, max_time, unique_destinations, seed
+    )]
+
+
+def generate_schedule_routes(routes, airline, aircraft, legs, origin_iata=None, chain=True,
+                             max_time=None, unique_destinations=False, seed=None):
+    """Like generate_schedule, but return (route, leg) pairs with each leg's full route dict."""
+    rng = random.Random(seed)
+    table = as_route_table(routes)
+    cache = _CandidateCache(table, aircraft, max_time)
+    columns = table.columns
+    visited = set() if unique_destinations else None
+
+    rows = []
+    origin = origin_iata
+    for _ in range(legs):
+        if origin is None:
+            row = _random_origin_leg(rng, table, cache, aircraft, visited)
+        else:
+            row = _pick(rng, table, cache.get(origin), visited)
+        if row is None:
+            break
+
+        rows.append(row)
+        if visited is not None:
+            visited.add(columns['to'][row])
+        if chain:
+            origin = columns['to'][row]
+
+    schedule = []
+    flight_numbers = genFlightNums(airline, [table[row].get('from_icao', '') for row in rows], rng=rng) if rows else []
+    for leg, row in enumerate(rows, 1):
+        route = table[row]
+        flight_ident = flight_numbers[leg - 1] if isinstance(flight_numbers, list) else None
+        schedule.append((route, {
+            "leg": leg,
+            "flight_number": f"{flight_ident[0]} {flight_ident[1]}" if flight_ident else "",
+            "from": route['from'],
+            "from_icao": route.get('from_icao', ''),
+            "from_name": route.get('from_name', ''),
+            "to": route['to'],
+            "to_icao": route.get('to_icao', ''),
+            "to_name": route.get('to_name', ''),
+            "distance_km": route['distance_km'],
+            "estimated_time_min": route['estimated_time_min']
+        }))
+    return schedule
+
+
+def resolve_origin(routes, code):
+    """Accept an origin as IATA or ICAO and return its IATA code, or None if unknown."""
+    table = as_route_table(routes)
+    code = code.strip().upper()
+    if code in table.by_origin:
+        return code
+    for rows in table.by_origin.values():
+        route = table[rows[0]]
+        if route.get('from_icao', '').upper() == code:
+            return route['from']
+    return None
+
+
+def write_schedule_csv(schedule, f):
+    writer = csv.DictWriter(f, fieldnames=SCHEDULE_FIELDS)
+    writer.writeheader()
+    writer.writerows(schedule)
+
+
+def write_schedule_json(schedule, f):
+    json.dump(schedule, f, indent=2, ensure_ascii=False)
+    f.write("\n")
+
+
+def run_schedule_cli(argv=None):
+    parser = argparse.ArgumentParser(prog="main.py -schedule", description="Generate a batch of random legs")
+    parser.add_argument('--airline', required=True, help='Airline name as listed in airline_files.json')
+    parser.add_argument('--aircraft', required=True, help='Aircraft ICAO type, e.g. A320')
+    parser.add_argument('--legs', type=int, default=10, help='Number of legs to generate (default: 10)')
+    parser.add_argument('--origin', help='First departure airport (IATA or ICAO); random if omitted')
+    parser.add_argument('--no-chain', action='store_true',
+                        help='Pick each leg independently instead of departing from the previous arrival')
+    parser.add_argument('--max-time', type=int, help='Maximum flight time per leg in minutes')
+    parser.add_argument('--unique', action='store_true', help='Never repeat a destination')
+    parser.add_argument('--seed', type=int, help='Seed for reproducible schedules')
+    parser.add_argument('--format', choices=['csv', 'json'], default='csv', help='Output format (default: csv)')
+    parser.add_argument('--output', help='Write to this file instead of stdout')
+    args = parser.parse_args(argv)
+
+    if args.airline not in get_airline_files():
+        parser.error(f"Unknown airline: {args.airline}")
+    try:
+        routes = load_routes(args.airline)
+    except FileNotFoundError as e:
+        parser.error(f"Route file missing for {args.airline} ({e.filename}), run buildData.py first")
+
+    origin = None
+    if args.origin:
+        origin = resolve_origin(routes, args.origin)
+        if origin is None:
+            parser.error(f"{args.origin} is not a departure airport for {args.airline}")
+
+    schedule = generate_schedule(
+        routes, args.airline, args.aircraft, args.legs,
+        origin_iata=origin,
+        chain=not args.no_chain,
+        max_time=args.max_time,
+        unique_destinations=args.unique,
+        seed=args.seed
+    )
+    if len(schedule) < args.legs:
+        print(f"Only {len(schedule)} of {args.legs} legs could be generated with these filters", file=sys.stderr)
+
+    write = write_schedule_json if args.format == 'json' else write_schedule_csv
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8', newline='') as f:
+            write(schedule, f)
+    else:
+        write(schedule, sys.stdout)
@@ -0,0 +1,173 @@
+import json
+import os
+import threading
+from core.json_stream import JsonStream, read_json_members, ChunkReader
+
+SIMBRIEF_FETCH_URL = "https://www.simbrief.com/api/xml.fetcher.php"
+# The only parts of the OFP the flight summary reads; navlog, weather, NOTAMs and text are skipped
+OFP_SECTIONS = ("origin", "destination", "general", "aircraft", "atc", "times")
+OFP_CHUNK_SIZE = 64 * 1024
+SIMBRIEF_CACHE_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'simbrief_ofp_cache.json')
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+class SimbriefError(Exception):
+    pass
+
+
+def ofp_id(params):
+    """Identify one generated OFP from its params section (request ID and sequence)."""
+    request_id = str(params.get("request_id") or '')
+    sequence_id = str(params.get("sequence_id") or '')
+    if not request_id and not sequence_id:
+        return None
+    return f"{request_id}:{sequence_id}"
+
+
+def read_ofp(f, known_id=None, chunk_size=OFP_CHUNK_SIZE):
+    """Read the summary sections of a JSON OFP from a text file object.
+
+    Returns (ofp_id, sections). params comes near the top of the document, so
+    when it identifies known_id reading stops there and sections is None.
+    Otherwise only OFP_SECTIONS are decoded and reading stops once they have
+    all been seen.
+    """
+    wanted = set(OFP_SECTIONS)
+    sections = {}
+    current_id = None
+    stream = JsonStream(f, chunk_size)
+    stream.expect('{')
+    if stream.peek() == '}':
+        return None, sections
+    while wanted:
+        key = stream.decode()
+        stream.expect(':')
+        if key == 'fetch':
+            status = (stream.decode() or {}).get('status', '')
+            if status and not status.startswith('Success'):
+                raise SimbriefError(status)
+        elif key == 'params':
+            current_id = ofp_id(stream.decode() or {})
+            if known_id is not None and current_id == known_id:
+                return current_id, None
+        elif key in wanted:
+            sections[key] = stream.decode()
+            wanted.discard(key)
+        else:
+            stream.skip()
+        if stream.expect(',}') == '}':
+            break
+    return current_id, sections
+
+
+class SimbriefClient:
+    """Fetches a user's latest OFP, caching the summary sections per user.
+
+    Each user's entry remembers the OFP ID it came from plus the response's
+    validators. A re-fetch is sent as a conditional request; if the server
+    doesn't answer 304, the download is still abandoned as soon as params
+    shows the same OFP, so an unchanged plan is neither downloaded in full nor
+    parsed again. Entries are written to cache_path so they survive restarts.
+    """
+
+    def __init__(self, url=SIMBRIEF_FETCH_URL, cache_path=None, timeout=15):
+        self.url = url
+        self.cache_path = cache_path
+        self.timeout = timeout
+        self._entries = None
+        self._session = None
+        self._lock = threading.Lock()
+
+    def latest_ofp(self, user_id):
+        """Return the summary sections of user_id's latest OFP as {section: value}."""
+        user_id = str(user_id).strip()
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._load_cache()
+            entry = self._entries.get(user_id)
+            fetched = self._fetch(user_id, entry)
+            if fetched is not entry:
+                self._entries[user_id] = fetched
+                self._save_cache()
+            return fetched["sections"]
+
+    def _fetch(self, user_id, entry):
+        import requests
+
+        headers = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        if self._session is None:
+            self._session = requests.Session()
+        with self._session.get(self.url, params={"userid": user_id, "json": 1}, headers=headers,
+                               timeout=self.timeout, stream=True) as response:
+            if response.status_code == 304 and entry is not None:
+                return entry
+            body = ChunkReader(response.iter_content(OFP_CHUNK_SIZE))
+            if not response.ok:
+                raise SimbriefError(_error_status(body) or f"HTTP {response.status_code} from SimBrief")
+
+            known_id = entry["ofp_id"] if entry is not None else None
+            current_id, sections = read_ofp(body, known_id)
+            if sections is None:
+                return entry
+            return {
+                "ofp_id": current_id,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "sections": sections
+            }
+
+    def _load_cache(self):
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if cached.get("url") != self.url or not isinstance(cached.get("users"), dict):
+            return {}
+        return cached["users"]
+
+    def _save_cache(self):
+        if not self.cache_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            tmp_path = self.cache_path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"url": self.url, "users": self._entries}, f, separators=(',', ':'))
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass
+
+
+def _error_status(body):
+    # SimBrief reports a bad user ID or a missing plan as JSON in an error response
+    try:
+        fetch = read_json_members(body, ("fetch",)).get("fetch") or {}
+    except ValueError:
+        return None
+    return fetch.get("status") or None
+
+
+def get_simbrief_client(url=SIMBRIEF_FETCH_URL, timeout=15):
+    """Return the shared SimbriefClient for url; only the default endpoint is cached on disk."""
+    with _clients_lock:
+        client = _clients.get(url)
+        if client is None:
+            cache_path = SIMBRIEF_CACHE_FILE if url == SIMBRIEF_FETCH_URL else None
+            client = SimbriefClient(url, cache_path=cache_path, timeout=timeout)
+            _clients[url] = client
+        return client
+
+
+def fetch_latest_ofp(user_id, url=SIMBRIEF_FETCH_URL, timeout=15):
+    return get_simbrief_client(url, timeout).latest_ofp(user_id)
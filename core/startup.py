@@ -0,0 +1,100 @@
+import os
+import sys
+
+# Cold start budgets: process start to first GUI frame, or to the first CLI prompt
+STARTUP_BUDGETS_MS = {'gui': 1500, 'cli': 1000}
+STARTUP_CHECK_ENV = 'MSFS_STARTUP_CHECK'
+STARTUP_RESULT_PREFIX = 'startup_ms='
+# The modules each mode imports before it can show anything
+STARTUP_MODULES = {'gui': 'gui.main_window', 'cli': 'core.cli, InquirerPy'}
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def startup_check_enabled():
+    return os.environ.get(STARTUP_CHECK_ENV) == '1'
+
+
+def parse_importtime(text):
+    """Parse `python -X importtime` output into (self_us, cumulative_us, module) rows."""
+    rows = []
+    for line in text.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue  # the header line
+        rows.append((self_us, cumulative_us, parts[2].strip()))
+    return rows
+
+
+def import_report(module, top=15):
+    """Import module in a fresh interpreter and return its slowest imports by cumulative time."""
+    import subprocess
+
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=_ROOT, env=_child_env(), capture_output=True, text=True
+    )
+    rows = parse_importtime(result.stderr)
+    rows.sort(key=lambda row: row[1], reverse=True)
+    return rows[:top]
+
+
+def measure_cold_start(mode, timeout=60):
+    """Run main.py in a fresh process and return milliseconds until its first frame or prompt."""
+    import subprocess
+
+    args = [sys.executable, os.path.join(_ROOT, 'main.py')]
+    if mode == 'cli':
+        args.append('-cli')
+    env = _child_env()
+    env[STARTUP_CHECK_ENV] = '1'
+
+    result = subprocess.run(args, cwd=_ROOT, env=env, capture_output=True, text=True,
+                            stdin=subprocess.DEVNULL, timeout=timeout)
+    for line in result.stdout.splitlines():
+        if line.startswith(STARTUP_RESULT_PREFIX):
+            return float(line[len(STARTUP_RESULT_PREFIX):])
+    raise RuntimeError(f"{mode} startup did not report a time (exit code {result.returncode}):\n{result.stderr[-2000:]}")
+
+
+def _child_env():
+    env = dict(os.environ)
+    # Don't flash a window when timing the GUI
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    return env
+
+
+def run_startup_report(argv=None):
+    """Print the slowest startup imports and cold start times; exit code 1 if over budget."""
+    modes = argv or list(STARTUP_BUDGETS_MS)
+    over_budget = False
+
+    for mode in modes:
+        if mode not in STARTUP_BUDGETS_MS:
+            print(f"Unknown mode {mode!r}, expected one of {', '.join(STARTUP_BUDGETS_MS)}", file=sys.stderr)
+            return 2
+
+        print(f"\n{mode.upper()} startup ({STARTUP_MODULES[mode]})")
+        print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+        for self_us, cumulative_us, module in import_report(STARTUP_MODULES[mode]):
+            print(f"{cumulative_us / 1000:>14.1f} {self_us / 1000:>9.1f}  {module}")
+
+        try:
+            elapsed_ms = measure_cold_start(mode)
+        except Exception as e:
+            print(f"Could not measure {mode} startup: {e}")
+            over_budget = True
+            continue
+
+        budget = STARTUP_BUDGETS_MS[mode]
+        status = "OK" if elapsed_ms <= budget else "OVER BUDGET"
+        over_budget = over_budget or elapsed_ms > budget
+        print(f"Cold start: {elapsed_ms:.0f} ms (budget {budget} ms) {status}")
+
+    return 1 if over_budget else 0
@@ -0,0 +1,229 @@
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime
+from core.json_stream import read_json_members, ChunkReader
+
+VATSIM_DATA_URL = "https://data.vatsim.net/v3/vatsim-data.json"
+# The v3 feed is regenerated every 15 seconds; fetching more often only returns the same data
+VATSIM_REFRESH_SECONDS = 15
+# Lower bound between fetches when the feed's own timestamp says an update is overdue
+VATSIM_MIN_REFRESH_SECONDS = 5
+FEED_SECTIONS = ("general", "controllers")
+FEED_CHUNK_SIZE = 64 * 1024
+VATSIM_SNAPSHOT_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'vatsim_snapshot.json')
+
+_FACILITY = re.compile(r'(DEL|GND|TWR|APP|DEP|CTR)', re.IGNORECASE)
+
+_feeds = {}
+_feeds_lock = threading.Lock()
+
+
+def _parse_update_timestamp(value):
+    if not value:
+        return None
+    try:
+        # Seven fractional digits and a trailing Z, e.g. 2025-01-01T12:00:00.0000000Z
+        seconds, _, fraction = value.rstrip('Z').partition('.')
+        parsed = datetime.fromisoformat(seconds + '+00:00')
+        return parsed.timestamp() + (float('0.' + fraction) if fraction.isdigit() else 0.0)
+    except ValueError:
+        return None
+
+
+def read_vatsim_feed(f, chunk_size=FEED_CHUNK_SIZE):
+    """Read just the general and controllers sections of a feed from a text file object.
+
+    Most of the feed is the pilots list, which is skipped over without being
+    decoded; reading stops once controllers has been seen.
+    """
+    return read_json_members(f, FEED_SECTIONS, chunk_size)
+
+
+def build_controller_index(controllers):
+    """Index ATC controllers by callsign prefix (the airport code before the first "_").
+
+    Only positions with a DEL/GND/TWR/APP/DEP/CTR facility are kept, matching
+    what the flight summary lists. Each entry is (feed position, controller) so
+    merged lookups can keep the feed's order.
+    """
+    index = {}
+    for position, controller in enumerate(controllers):
+        callsign = controller.get("callsign", "")
+        prefix, sep, rest = callsign.partition('_')
+        if not sep or not _FACILITY.search(rest):
+            continue
+        index.setdefault(prefix.upper(), []).append((position, controller))
+    return index
+
+
+class VatsimSnapshot:
+    """One version of the VATSIM feed's controller list, indexed by airport code."""
+
+    def __init__(self, controllers, update_timestamp=None, fetched_at=None):
+        self.controllers = controllers
+        self.update_timestamp = update_timestamp
+        self.fetched_at = fetched_at
+        self.index = build_controller_index(controllers)
+
+    @classmethod
+    def from_feed(cls, data, fetched_at=None):
+        general = data.get("general") or {}
+        return cls(data.get("controllers") or [], general.get("update_timestamp"), fetched_at)
+
+    def controllers_at(self, *codes):
+        """Controllers whose callsign starts with any of the given ICAO/IATA codes, in feed order."""
+        entries = []
+        seen = set()
+        for code in codes:
+            code = (code or '').strip().upper()
+            if code and code not in seen:
+                seen.add(code)
+                entries.extend(self.index.get(code, ()))
+        entries.sort(key=lambda entry: entry[0])
+        return [controller for _, controller in entries]
+
+    def to_dict(self):
+        return {
+            "update_timestamp": self.update_timestamp,
+            "fetched_at": self.fetched_at,
+            "controllers": self.controllers
+        }
+
+
+class VatsimFeed:
+    """Shared, TTL-cached access to the VATSIM data feed.
+
+    The feed is fetched at most once per refresh interval, counted from the
+    feed's own update_timestamp when it has one, and concurrent callers share
+    a single download. The last snapshot is written to cache_path so a new
+    session can reuse it while it is still fresh. A failed refresh keeps
+    serving the previous snapshot.
+    """
+
+    def __init__(self, url=VATSIM_DATA_URL, ttl=VATSIM_REFRESH_SECONDS, cache_path=None,
+                 timeout=10, clock=time.time):
+        self.url = url
+        self.ttl = ttl
+        self.cache_path = cache_path
+        self.timeout = timeout
+        self.clock = clock
+        self._snapshot = None
+        self._expires_at = 0
+        self._session = None
+        self._lock = threading.Lock()
+
+    def snapshot(self):
+        with self._lock:
+            now = self.clock()
+            if self._snapshot is None:
+                self._load_cache(now)
+            if self._snapshot is None or now >= self._expires_at:
+                self._refresh(now)
+            return self._snapshot
+
+    def seconds_until_refresh(self):
+        """Time until snapshot() will fetch again; 0 if nothing has been fetched yet."""
+        with self._lock:
+            if self._snapshot is None:
+                return 0
+            return max(0, self._expires_at - self.clock())
+
+    def _refresh(self, now):
+        try:
+            data = self._fetch()
+        except Exception:
+            if self._snapshot is None:
+                raise
+            # Keep the stale snapshot and try again after a short pause
+            self._expires_at = now + VATSIM_MIN_REFRESH_SECONDS
+            return
+
+        snapshot = VatsimSnapshot.from_feed(data, fetched_at=now)
+        unchanged = (self._snapshot is not None and snapshot.update_timestamp is not None
+                     and snapshot.update_timestamp == self._snapshot.update_timestamp)
+        if not unchanged:
+            self._snapshot = snapshot
+            self._save_cache()
+        else:
+            self._snapshot.fetched_at = now
+        self._expires_at = self._next_refresh(self._snapshot, now)
+
+    def _next_refresh(self, snapshot, now):
+        updated = _parse_update_timestamp(snapshot.update_timestamp)
+        if updated is None:
+            return now + self.ttl
+        # A feed generated 10s ago will be replaced in about 5s, not a full interval from now
+        wait = updated + self.ttl - now
+        return now + min(self.ttl, max(VATSIM_MIN_REFRESH_SECONDS, wait))
+
+    def _fetch(self):
+        import requests
+
+        if self._session is None:
+            self._session = requests.Session()
+        with self._session.get(self.url, timeout=self.timeout, stream=True) as response:
+            response.raise_for_status()
+            return read_vatsim_feed(ChunkReader(response.iter_content(FEED_CHUNK_SIZE)))
+
+    def _load_cache(self, now):
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return
+        if cached.get("url") != self.url or not isinstance(cached.get("fetched_at"), (int, float)):
+            return
+
+        snapshot = VatsimSnapshot(cached.get("controllers") or [], cached.get("update_timestamp"), cached["fetched_at"])
+        self._snapshot = snapshot
+        # A stale file still seeds the timestamp check, it just doesn't skip the fetch
+        self._expires_at = self._next_refresh(snapshot, snapshot.fetched_at)
+
+    def _save_cache(self):
+        if not self.cache_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            tmp_path = self.cache_path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"url": self.url, **self._snapshot.to_dict()}, f, separators=(',', ':'))
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass
+
+
+def get_vatsim_feed(url=VATSIM_DATA_URL, timeout=10):
+    """Return the shared VatsimFeed for url; only the default feed is cached on disk."""
+    with _feeds_lock:
+        feed = _feeds.get(url)
+        if feed is None:
+            cache_path = VATSIM_SNAPSHOT_FILE if url == VATSIM_DATA_URL else None
+            feed = VatsimFeed(url, cache_path=cache_path, timeout=timeout)
+            _feeds[url] = feed
+        return feed
+
+
+def format_controller(controller):
+    return f"{controller.get('callsign', ''):<20} {controller.get('frequency', 'N/A')}"
+
+
+def fetch_vatsim_controllers(departure_icao, departure_iata, arrival_icao, arrival_iata,
+                             url=VATSIM_DATA_URL, timeout=10):
+    try:
+        snapshot = get_vatsim_feed(url, timeout).snapshot()
+    except Exception as e:
+        return [], []
+
+    departure = snapshot.controllers_at(departure_icao, departure_iata)
+    # A position matching both airports is listed under the departure only
+    listed = {id(controller) for controller in departure}
+    arrival = [
+        controller for controller in snapshot.controllers_at(arrival_icao, arrival_iata)
+        if id(controller) not in listed
+    ]
+    return [format_controller(c) for c in departure], [format_controller(c) for c in arrival]
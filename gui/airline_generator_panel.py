@@ -1,15 +1,21 @@
-from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                               QLineEdit, QComboBox, QPushButton, QTextEdit, QCompleter)
-from PySide6.QtCore import Qt, Signal, QStringListModel
-from core.route_loader import get_all_aircraft, get_airline_files, load_routes
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QLabel, 
+                               QLineEdit, QComboBox, QPushButton, QTextEdit)
+from core.route_loader import get_all_aircraft
+from core.lookups import get_airport_catalog
+from core.route_index import find_airlines_for_pair
+from core.airport_search import AirportSearchIndex
+from gui.airport_completer import AirportCompleter
+from gui.workers import run_in_background
 
 
 class AirlineGeneratorPanel(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.all_airports = set()
+        self.airports_loaded = False
+        self.airports_worker = None
+        self.search_worker = None
         self.init_ui()
-        self.load_all_airports()
         self.load_aircraft_list()
     
     def init_ui(self):
@@ -35,10 +41,7 @@ class AirlineGeneratorPanel(QWidget):
         self.departure_input = QLineEdit()
         self.departure_input.setPlaceholderText("Type ICAO code to search...")
         
-        self.departure_completer = QCompleter()
-        self.departure_completer.setCaseSensitivity(Qt.CaseInsensitive)
-        self.departure_completer.setFilterMode(Qt.MatchContains)
-        self.departure_input.setCompleter(self.departure_completer)
+        self.departure_completer = AirportCompleter(self.departure_input)
         
         main_layout.addWidget(departure_label)
         main_layout.addWidget(self.departure_input)
@@ -48,10 +51,7 @@ class AirlineGeneratorPanel(QWidget):
         self.arrival_input = QLineEdit()
         self.arrival_input.setPlaceholderText("Type ICAO code to search...")
         
-        self.arrival_completer = QCompleter()
-        self.arrival_completer.setCaseSensitivity(Qt.CaseInsensitive)
-        self.arrival_completer.setFilterMode(Qt.MatchContains)
-        self.arrival_input.setCompleter(self.arrival_completer)
+        self.arrival_completer = AirportCompleter(self.arrival_input)
         
         main_layout.addWidget(arrival_label)
         main_layout.addWidget(self.arrival_input)
@@ -87,27 +87,44 @@ class AirlineGeneratorPanel(QWidget):
         
         self.setLayout(main_layout)
     
+    def showEvent(self, event):
+        super().showEvent(event)
+        # The airport list is only needed once the tab is opened, so keep it off the startup path
+        if not self.airports_loaded:
+            self.load_all_airports()
+    
     def load_all_airports(self):
-        try:
-            airline_files = get_airline_files()
-            for airline_name in airline_files.keys():
-                try:
-                    routes = load_routes(airline_name)
-                    for route in routes:
-                        if route.get('from_icao'):
-                            self.all_airports.add(route['from_icao'])
-                        if route.get('to_icao'):
-                            self.all_airports.add(route['to_icao'])
-                except Exception:
-                    continue
-            
-            airport_list = sorted(list(self.all_airports))
-            model = QStringListModel(airport_list)
-            self.departure_completer.setModel(model)
-            self.arrival_completer.setModel(model)
-            
-        except Exception as e:
-            print(f"Error loading airports: {e}")
+        if self.airports_worker is not None:
+            return
+        self.airports_loaded = True
+        self.departure_input.setPlaceholderText("Loading airports...")
+        self.arrival_input.setPlaceholderText("Loading airports...")
+        self.airports_worker = run_in_background(
+            self.collect_airports,
+            on_result=self.on_airports_loaded,
+            on_error=self.on_airports_failed
+        )
+    
+    def collect_airports(self):
+        # Building the search index is the slow part, so it happens on the worker too
+        catalog = get_airport_catalog()
+        return set(catalog.keys()), AirportSearchIndex.from_catalog(catalog)
+    
+    def on_airports_loaded(self, result):
+        self.airports_worker = None
+        self.all_airports, index = result
+        self.departure_input.setPlaceholderText("Type ICAO code to search...")
+        self.arrival_input.setPlaceholderText("Type ICAO code to search...")
+        
+        self.departure_completer.airport_model.set_index(index)
+        self.arrival_completer.airport_model.set_index(index)
+    
+    def on_airports_failed(self, error):
+        self.airports_worker = None
+        self.airports_loaded = False
+        self.departure_input.setPlaceholderText("Type ICAO code to search...")
+        self.arrival_input.setPlaceholderText("Type ICAO code to search...")
+        print(f"Error loading airports: {error}")
     
     def load_aircraft_list(self):
         try:
@@ -135,7 +152,22 @@ class AirlineGeneratorPanel(QWidget):
             return
         
         self.results_text.setHtml("<p>Searching...</p>")
-        matching_airlines = self.find_matching_airlines(aircraft, departure, arrival)
+        self.search_button.setEnabled(False)
+        
+        if self.search_worker is not None:
+            self.search_worker.cancel()
+        self.search_worker = run_in_background(
+            self.run_search,
+            aircraft, departure, arrival,
+            on_result=self.display_results
+        )
+    
+    def run_search(self, aircraft, departure, arrival):
+        return aircraft, departure, arrival, self.find_matching_airlines(aircraft, departure, arrival)
+    
+    def display_results(self, result):
+        aircraft, departure, arrival, matching_airlines = result
+        self.search_button.setEnabled(True)
         
         if matching_airlines:
             result_html = f"<h3 style='color: green;'>✅ Found {len(matching_airlines)} airline(s)</h3>"
@@ -170,31 +202,8 @@ class AirlineGeneratorPanel(QWidget):
             self.results_text.setHtml(result_html)
     
     def find_matching_airlines(self, aircraft_code, departure_icao, arrival_icao):
-        matching_airlines = []
-        
         try:
-            airline_files = get_airline_files()
-            aircraft_field = f"supports_{aircraft_code.lower()}"
-            
-            for airline_name in airline_files.keys():
-                try:
-                    routes = load_routes(airline_name)
-                    
-                    for route in routes:
-                        if (route.get('from_icao') == departure_icao and 
-                            route.get('to_icao') == arrival_icao):
-
-                            if route.get(aircraft_field, False):
-                                matching_airlines.append({
-                                    'airline': airline_name,
-                                    'route_details': route
-                                })
-                                break
-                
-                except Exception as e:
-                    continue
-            
+            return find_airlines_for_pair(departure_icao, arrival_icao, aircraft_code)
         except Exception as e:
             print(f"Error searching airlines: {e}")
-        
-        return matching_airlines
+            return []
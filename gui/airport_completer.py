@@ -0,0 +1,85 @@
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex
+from PySide6.QtWidgets import QCompleter
+from core.airport_search import AirportSearchIndex
+
+# Rows handed to the popup at a time; more are fetched as it scrolls
+FETCH_BATCH_SIZE = 50
+
+
+class AirportCompleterModel(QAbstractListModel):
+    """List model holding the ranked matches for the text typed in one airport field.
+
+    Matching is done by an AirportSearchIndex rather than by QCompleter's
+    contains filter, so a keystroke only touches the airports that share the
+    query's n-grams. Rows are exposed in batches through canFetchMore/fetchMore.
+    The same model is kept for the life of the field; switching airline only
+    swaps its index.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.search_index = AirportSearchIndex([])
+        self.query = ''
+        self.matches = []
+        self.visible = 0
+
+    def set_index(self, index):
+        self.beginResetModel()
+        self.search_index = index
+        self._match()
+        self.endResetModel()
+
+    def set_choices(self, choices):
+        self.set_index(AirportSearchIndex.from_choices(choices))
+
+    def set_query(self, text):
+        if text == self.query:
+            return
+        self.beginResetModel()
+        self.query = text
+        self._match()
+        self.endResetModel()
+
+    def _match(self):
+        self.matches = self.search_index.search(self.query)
+        self.visible = min(FETCH_BATCH_SIZE, len(self.matches))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.visible
+
+    def canFetchMore(self, parent):
+        return not parent.isValid() and self.visible < len(self.matches)
+
+    def fetchMore(self, parent):
+        if parent.isValid():
+            return
+        count = min(FETCH_BATCH_SIZE, len(self.matches) - self.visible)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self.visible, self.visible + count - 1)
+        self.visible += count
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < self.visible:
+            return None
+        entry = self.matches[index.row()]
+        if role == Qt.DisplayRole:
+            return self.search_index.display(entry)
+        if role == Qt.EditRole:
+            return self.search_index.value(entry)
+        return None
+
+
+class AirportCompleter(QCompleter):
+    """Completer for an airport QLineEdit that shows its model's ranked matches unfiltered."""
+
+    def __init__(self, line_edit, model=None):
+        super().__init__(line_edit)
+        self.airport_model = model or AirportCompleterModel(self)
+        self.setModel(self.airport_model)
+        self.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.setCaseSensitivity(Qt.CaseInsensitive)
+        # textEdited is delivered before the line edit asks the completer to show its popup
+        line_edit.textEdited.connect(self.airport_model.set_query)
+        line_edit.setCompleter(self)
@@ -32,3 +32,6 @@ class BottomRightPanel(QWidget):
     
     def enable_simbrief(self, enabled=True):
         self.simbrief_btn.setEnabled(enabled)
+    
+    def enable_generate(self, enabled=True):
+        self.generate_btn.setEnabled(enabled)
@@ -1,18 +1,100 @@
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                               QPushButton, QFrame, QLineEdit, QStackedWidget, QMessageBox, QTextEdit)
-from PySide6.QtCore import Qt, Signal, QThread
-from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
-from PySide6.QtCore import QUrl
+                               QPushButton, QFrame, QLineEdit, QStackedWidget, QMessageBox, QTextEdit,
+                               QListWidget, QListWidgetItem)
+from PySide6.QtCore import Qt, Signal
 import json
 import os
-import re
+from core.lookups import get_airline_for_icao, get_iata_for_airport
+from core.simbrief import fetch_latest_ofp
+from gui.vatsim_poller import VatsimPoller
+from gui.workers import run_in_background
+
+
+class ControllerList(QWidget):
+    """Controllers online at one airport, one row per position.
+
+    Rows are added and removed individually as the poller reports changes,
+    so a poll that changes one position touches one row.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(2)
+
+        self.title = QLabel("")
+        self.title.setStyleSheet("font-family: 'Courier New', monospace; font-size: 14px;")
+        layout.addWidget(self.title)
+
+        self.list = QListWidget()
+        self.list.setSortingEnabled(True)
+        self.list.setStyleSheet("""
+            QListWidget {
+                background-color: transparent;
+                border: none;
+                font-size: 14px;
+                font-family: 'Courier New', monospace;
+            }
+        """)
+        layout.addWidget(self.list)
+
+        self.status = QLabel("")
+        self.status.setStyleSheet("font-family: 'Courier New', monospace; font-size: 14px; color: gray;")
+        layout.addWidget(self.status)
+
+        self.setLayout(layout)
+        self.rows = {}
+        self.loaded = False
+
+    def reset(self, icao):
+        self.title.setText(f"Active Controllers at {icao}:")
+        self.list.clear()
+        self.rows = {}
+        self.loaded = False
+        self.status.setText("Fetching controllers...")
+        self.status.show()
+
+    def apply_change(self, added, removed):
+        """Apply a change reported for this airport."""
+        self.loaded = True
+        self.remove(removed)
+        self.add(added)
+
+    def add(self, controllers):
+        for controller in controllers:
+            if controller not in self.rows:
+                item = QListWidgetItem(controller)
+                self.list.addItem(item)
+                self.rows[controller] = item
+        self._update_status()
+
+    def remove(self, controllers):
+        for controller in controllers:
+            item = self.rows.pop(controller, None)
+            if item is not None:
+                self.list.takeItem(self.list.row(item))
+        self._update_status()
+
+    def controllers(self):
+        return [self.list.item(row).text() for row in range(self.list.count())]
+
+    def _update_status(self):
+        if self.loaded:
+            self.status.setText("No active controllers")
+        self.status.setVisible(not self.rows)
 
 
 class FlightSummaryPanel(QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.network_manager = QNetworkAccessManager()
+        # userData.json is only needed once the tab is used
+        self.user_id_loaded = False
+        self.summary_flight_data = None
+        self.controllers_worker = None
+        self.controller_subscriptions = []
+        self.simbrief_worker = None
         self.init_ui()
     
     def init_ui(self):
@@ -34,7 +116,6 @@ class FlightSummaryPanel(QWidget):
         main_layout.addWidget(self.stacked_widget)
         self.setLayout(main_layout)
         
-        self.load_user_id()
     
     def _create_empty_view(self):
         widget = QWidget()
@@ -133,7 +214,20 @@ class FlightSummaryPanel(QWidget):
                 font-family: 'Courier New', monospace;
             }
         """)
-        layout.addWidget(self.flight_details_text)
+        layout.addWidget(self.flight_details_text, stretch=2)
+
+        controllers_layout = QHBoxLayout()
+        self.departure_controllers = ControllerList()
+        self.arrival_controllers = ControllerList()
+        controllers_layout.addWidget(self.departure_controllers)
+        controllers_layout.addWidget(self.arrival_controllers)
+        layout.addLayout(controllers_layout, stretch=1)
+
+        note = QLabel("Note: VATSIM controller data may be inaccurate. Please verify "
+                      "on vatsim-radar for the most up-to-date information.")
+        note.setWordWrap(True)
+        note.setStyleSheet("font-size: 12px; color: gray;")
+        layout.addWidget(note)
         
         self.clear_button = QPushButton("Clear Flight Plan")
         self.clear_button.setStyleSheet("""
@@ -159,6 +253,12 @@ class FlightSummaryPanel(QWidget):
         widget.setMinimumSize(300, 200)
         return widget
     
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self.user_id_loaded:
+            self.user_id_loaded = True
+            self.load_user_id()
+    
     def load_user_id(self):
         config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config', 'userData.json')
         if os.path.exists(config_path):
@@ -195,32 +295,34 @@ class FlightSummaryPanel(QWidget):
         self.fetch_button.setEnabled(False)
         self.fetch_button.setText("Fetching...")
         
-        url = f"https://www.simbrief.com/api/xml.fetcher.php?userid={user_id}&json=1"
-        request = QNetworkRequest(QUrl(url))
-        reply = self.network_manager.get(request)
-        reply.finished.connect(lambda: self.on_fetch_finished(reply))
+        if self.simbrief_worker is not None:
+            self.simbrief_worker.cancel()
+        self.simbrief_worker = run_in_background(
+            self.fetch_simbrief_plan,
+            user_id,
+            on_result=self.on_simbrief_parsed,
+            on_error=self.on_simbrief_fetch_failed
+        )
+    
+    def fetch_simbrief_plan(self, user_id):
+        # Runs on a worker thread; an OFP that hasn't changed since the last fetch comes from the cache
+        return self.parse_simbrief_data(fetch_latest_ofp(user_id))
     
-    def on_fetch_finished(self, reply):
+    def on_simbrief_parsed(self, flight_data):
+        self.simbrief_worker = None
         self.fetch_button.setEnabled(True)
         self.fetch_button.setText("Fetch Flight Plan")
         
-        if reply.error() != QNetworkReply.NoError:
-            QMessageBox.critical(self, "Error", f"Failed to fetch from SimBrief: {reply.errorString()}")
-            reply.deleteLater()
-            return
-        
-        try:
-            data = json.loads(reply.readAll().data().decode())
-            reply.deleteLater()
-            
-            flight_data = self.parse_simbrief_data(data)
-            if flight_data:
-                self.update_flight_summary(flight_data, from_simbrief=True)
-            else:
-                QMessageBox.warning(self, "No Data", "No flight plan found in SimBrief")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to parse SimBrief data: {str(e)}")
-            reply.deleteLater()
+        if flight_data:
+            self.update_flight_summary(flight_data, from_simbrief=True)
+        else:
+            QMessageBox.warning(self, "No Data", "No flight plan found in SimBrief")
+    
+    def on_simbrief_fetch_failed(self, error):
+        self.simbrief_worker = None
+        self.fetch_button.setEnabled(True)
+        self.fetch_button.setText("Fetch Flight Plan")
+        QMessageBox.critical(self, "Error", f"Failed to fetch from SimBrief: {error}")
     
     def parse_simbrief_data(self, data):
         try:
@@ -277,129 +379,96 @@ class FlightSummaryPanel(QWidget):
             return None
     
     def get_callsign_for_airline(self, airline_icao):
-        if not airline_icao:
-            return ''
-        
         try:
-            from core.route_loader import get_airline_files, load_airline_data
-            
-            airline_files = get_airline_files()
-            for airline_name in airline_files.keys():
-                try:
-                    airline_data = load_airline_data(airline_name)
-                    if airline_data.get('icao', '').upper() == airline_icao.upper():
-                        return airline_data.get('callsign', '')
-                except:
-                    continue
+            airline = get_airline_for_icao(airline_icao)
         except Exception as e:
             print(f"Error getting callsign: {e}")
-        
-        return ''
+            return ''
+        return airline['callsign'] if airline else ''
     
     def get_airline_name_for_icao(self, airline_icao):
-        if not airline_icao:
-            return ''
-        
         try:
-            from core.route_loader import get_airline_files, load_airline_data
-            
-            airline_files = get_airline_files()
-            for airline_name in airline_files.keys():
-                try:
-                    airline_data = load_airline_data(airline_name)
-                    if airline_data.get('icao', '').upper() == airline_icao.upper():
-                        return airline_name
-                except:
-                    continue
+            airline = get_airline_for_icao(airline_icao)
         except Exception as e:
             print(f"Error getting airline name: {e}")
-        
-        return ''
-    
-    def fetch_vatsim_controllers(self, departure_icao, departure_iata, arrival_icao, arrival_iata):
-        try:
-            import requests
-            VATSIM_DATA_URL = "https://data.vatsim.net/v3/vatsim-data.json"
-            
-            response = requests.get(VATSIM_DATA_URL, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-
-            dep_pattern = re.compile(
-                rf"^({departure_icao}|{departure_iata})_.*?(DEL|GND|TWR|APP|DEP|CTR)",
-                re.IGNORECASE
-            )
-            arr_pattern = re.compile(
-                rf"^({arrival_icao}|{arrival_iata})_.*?(DEL|GND|TWR|APP|DEP|CTR)",
-                re.IGNORECASE
-            )
-            
-            dep_controllers = []
-            arr_controllers = []
-            
-            for controller in data.get("controllers", []):
-                callsign = controller.get("callsign", "")
-                frequency = controller.get("frequency", "N/A")
-                
-                if dep_pattern.search(callsign):
-                    dep_controllers.append(f"{callsign:<20} {frequency}")
-                elif arr_pattern.search(callsign):
-                    arr_controllers.append(f"{callsign:<20} {frequency}")
-            
-            return dep_controllers, arr_controllers
-            
-        except Exception as e:
-            return [], []
+            return ''
+        return airline['name'] if airline else ''
     
     def get_iata_for_icao(self, icao_code, airline_name=None):
-        """Get IATA code for an ICAO code by looking up routes"""
+        """Get IATA code for an ICAO code from the airport catalog"""
         if not icao_code:
             return icao_code
         
         try:
-            from core.route_loader import get_airline_files, load_airline_data
-            
-            airlines_to_search = []
-            if airline_name:
-                airlines_to_search.append(airline_name)
-
-            airline_files = get_airline_files()
-            airlines_to_search.extend([name for name in airline_files.keys() if name != airline_name])
-            
-            for airline in airlines_to_search:
-                try:
-                    airline_data = load_airline_data(airline)
-                    routes = airline_data.get('routes', [])
-                    
-                    for route in routes:
-                        if route.get('from_icao', '').upper() == icao_code.upper():
-                            return route.get('from', icao_code)
-                        elif route.get('to_icao', '').upper() == icao_code.upper():
-                            return route.get('to', icao_code)
-                except:
-                    continue
-        except Exception as e:
-            pass
-        
-        return icao_code
+            return get_iata_for_airport(icao_code) or icao_code
+        except Exception:
+            return icao_code
     
     def update_flight_summary(self, flight_data, from_simbrief=False):
-        callsign = flight_data.get('callsign', '')
-        flight_num_only = flight_data.get('flight_number', '').split()[-1] if flight_data.get('flight_number') else ''
-        spoken_callsign = f"{callsign} {flight_num_only}" if callsign and flight_num_only else "N/A"
+        self.summary_flight_data = flight_data
+        self.render_flight_summary(flight_data)
+        self.departure_controllers.reset(flight_data.get('departure_icao', ''))
+        self.arrival_controllers.reset(flight_data.get('arrival_icao', ''))
         
+        if from_simbrief:
+            self.subtitle.setText("Flight plan fetched from SimBrief")
+        else:
+            self.subtitle.setText("Your flight plan has been sent to SimBrief")
+        
+        self.stacked_widget.setCurrentIndex(1)
+        
+        self.stop_watching_controllers()
+        self.controllers_worker = run_in_background(
+            self.resolve_airport_codes,
+            flight_data,
+            on_result=self.on_airport_codes_resolved
+        )
+    
+    def resolve_airport_codes(self, flight_data):
+        # Runs on a worker thread: IATA lookups may read config files
         airline_name = flight_data.get('airline', '')
         departure_icao = flight_data.get('departure_icao', '')
         arrival_icao = flight_data.get('arrival_icao', '')
         departure_iata = flight_data.get('departure_iata', '') or self.get_iata_for_icao(departure_icao, airline_name)
         arrival_iata = flight_data.get('arrival_iata', '') or self.get_iata_for_icao(arrival_icao, airline_name)
-        
-        dep_controllers, arr_controllers = self.fetch_vatsim_controllers(
-            departure_icao, departure_iata, arrival_icao, arrival_iata
-        )
-        
-        dep_controllers_text = "\n  ".join(dep_controllers) if dep_controllers else "  No active controllers"
-        arr_controllers_text = "\n  ".join(arr_controllers) if arr_controllers else "  No active controllers"
+        return flight_data, (departure_icao, departure_iata), (arrival_icao, arrival_iata)
+    
+    def on_airport_codes_resolved(self, result):
+        flight_data, departure_codes, arrival_codes = result
+        self.controllers_worker = None
+        if flight_data is not self.summary_flight_data:
+            return
+        # The shared poller keeps these lists current for as long as the summary is shown
+        poller = VatsimPoller.instance()
+        self.controller_subscriptions = [poller.subscribe(*departure_codes), poller.subscribe(*arrival_codes)]
+        for subscription in self.controller_subscriptions:
+            subscription.updated.connect(self.on_controllers_updated)
+    
+    def on_controllers_updated(self, added, removed):
+        if self.summary_flight_data is None or len(self.controller_subscriptions) != 2:
+            return
+        departure, arrival = self.controller_subscriptions
+        # A position matching both airports is listed under the departure only
+        if self.sender() is departure:
+            self.departure_controllers.apply_change(added, removed)
+            self.arrival_controllers.remove(added)
+            self.arrival_controllers.add([c for c in removed if c in arrival.controllers])
+        elif self.sender() is arrival:
+            self.arrival_controllers.apply_change([c for c in added if c not in departure.controllers], removed)
+    
+    def stop_watching_controllers(self):
+        if self.controllers_worker is not None:
+            self.controllers_worker.cancel()
+            self.controllers_worker = None
+        for subscription in self.controller_subscriptions:
+            subscription.updated.disconnect(self.on_controllers_updated)
+            subscription.cancel()
+        self.controller_subscriptions = []
+    
+    def render_flight_summary(self, flight_data):
+        callsign = flight_data.get('callsign', '')
+        flight_num_only = flight_data.get('flight_number', '').split()[-1] if flight_data.get('flight_number') else ''
+        spoken_callsign = f"{callsign} {flight_num_only}" if callsign and flight_num_only else "N/A"
         
         details_text = f"""
 ╔══════════════════════════════════════════════════════════════╗
@@ -425,27 +494,13 @@ class FlightSummaryPanel(QWidget):
 ╚══════════════════════════════════════════════════════════════╝
 
   Spoken Callsign:   {spoken_callsign}
-
-  Active Controllers at {departure_icao}:
-  {dep_controllers_text}
-
-  Active Controllers at {arrival_icao}:
-  {arr_controllers_text}
-
-  Note: VATSIM controller data may be inaccurate. Please verify
-        on vatsim-radar for the most up-to-date information.
 """
         
         self.flight_details_text.setPlainText(details_text)
-        
-        if from_simbrief:
-            self.subtitle.setText("Flight plan fetched from SimBrief")
-        else:
-            self.subtitle.setText("Your flight plan has been sent to SimBrief")
-        
-        self.stacked_widget.setCurrentIndex(1)
     
     def clear_flight_plan(self):
+        self.summary_flight_data = None
+        self.stop_watching_controllers()
         self.stacked_widget.setCurrentIndex(0)
     
     def show_empty_state(self):
@@ -1,7 +1,6 @@
 from PySide6.QtWidgets import (QMainWindow, QWidget, QHBoxLayout, 
                                QVBoxLayout, QMessageBox, QTabWidget)
 from PySide6.QtCore import Qt
-import webbrowser
 
 from gui.top_left_panel import TopLeftPanel
 from gui.top_right_panel import TopRightPanel
@@ -12,6 +11,9 @@ from gui.airline_generator_panel import AirlineGeneratorPanel
 from gui.flight_summary_panel import FlightSummaryPanel
 from core.route_loader import load_routes, load_airline_data, build_airport_index, get_airport_choices, extract_iata, get_airline_files
 from core.logic import generate_random_route, build_simbrief_url, format_route_details, verify_route, genFlightNum
+from core.route_table import RouteTable
+from core.airport_search import AirportSearchIndex
+from gui.workers import run_in_background
 
 
 class MainWindow(QMainWindow):
@@ -21,7 +23,10 @@ class MainWindow(QMainWindow):
         self.current_airline = None
         self.current_aircraft = None
         self.current_airline_data = None
-        self.routes = []
+        self.routes = RouteTable([])
+        self.airline_worker = None
+        self.verify_worker = None
+        self.verification_airline_worker = None
         self.init_ui()
         self.load_initial_data()
     
@@ -89,23 +94,58 @@ class MainWindow(QMainWindow):
         if not airline_name or airline_name.startswith("--"):
             return
         
-        try:
-            self.current_airline_data = load_airline_data(airline_name)
-            self.routes = self.current_airline_data["routes"]
-            airport_index = build_airport_index(self.routes)
-            airport_choices = get_airport_choices(airport_index)
-            self.top_left.set_airport_choices(airport_choices)
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Error",
-                f"Failed to load airline data: {str(e)}"
-            )
+        if self.airline_worker is not None:
+            self.airline_worker.cancel()
+        
+        self.bottom_right.enable_generate(False)
+        self.airline_worker = run_in_background(
+            self.read_airline_data,
+            airline_name,
+            on_result=self.on_airline_data_loaded,
+            on_error=self.on_airline_data_failed
+        )
+    
+    def read_airline_data(self, airline_name):
+        airline_data = load_airline_data(airline_name)
+        routes = airline_data["routes"]
+        # Build the origin index here rather than on the first Generate click
+        routes.build_origin_index()
+        airport_index = build_airport_index(routes)
+        airport_choices = get_airport_choices(airport_index)
+        return airline_data, airport_choices, AirportSearchIndex.from_choices(airport_choices)
+    
+    def is_current_worker(self, worker):
+        # cancel() can't recall a result that is already queued, so check which worker it came from
+        return worker is not None and self.sender() is worker.signals
+    
+    def on_airline_data_loaded(self, result):
+        if not self.is_current_worker(self.airline_worker):
+            return
+        self.airline_worker = None
+        self.current_airline_data, airport_choices, search_index = result
+        self.routes = self.current_airline_data["routes"]
+        self.top_left.set_airport_choices(airport_choices, search_index)
+        self.bottom_right.enable_generate(True)
+    
+    def on_airline_data_failed(self, error):
+        if not self.is_current_worker(self.airline_worker):
+            return
+        self.airline_worker = None
+        self.bottom_right.enable_generate(True)
+        QMessageBox.critical(
+            self,
+            "Error",
+            f"Failed to load airline data: {error}"
+        )
     
     def on_airline_changed(self, airline_name):
         if not airline_name or airline_name.startswith("--"):
-            self.routes = []
+            if self.airline_worker is not None:
+                self.airline_worker.cancel()
+                self.airline_worker = None
+            self.routes = RouteTable([])
             self.top_left.set_airport_choices([])
+            self.bottom_right.enable_generate(True)
             return
         
         self.load_airline_data(airline_name)
@@ -127,11 +167,7 @@ class MainWindow(QMainWindow):
 
         if not departure_text:
             import random
-            support_key = f"supports_{aircraft.lower()}"
-            valid_departures = list(set(
-                r['from'] for r in self.routes 
-                if r.get(support_key, False)
-            ))
+            valid_departures = self.routes.departures(aircraft)
             
             if not valid_departures:
                 QMessageBox.warning(
@@ -211,52 +247,88 @@ class MainWindow(QMainWindow):
             self.current_aircraft,
             self.current_route
         )
+        import webbrowser
         webbrowser.open(url)
     
     def on_verify_route(self, airline, aircraft, departure, arrival):
         try:
-            routes = load_routes(airline)
-            
-            try:
-                departure_iata = extract_iata(departure)
-            except:
-                QMessageBox.warning(
-                    self,
-                    "Invalid Input",
-                    "Please select a valid departure airport from the list"
-                )
-                return
-            
-            try:
-                arrival_iata = extract_iata(arrival)
-            except:
-                QMessageBox.warning(
-                    self,
-                    "Invalid Input",
-                    "Please select a valid arrival airport from the list"
-                )
-                return
-            
-            result = verify_route(routes, departure_iata, arrival_iata, aircraft, airline)
-            
-            self.verification_panel.display_result(result)
-            
-        except Exception as e:
-            QMessageBox.critical(
+            departure_iata = extract_iata(departure)
+        except:
+            QMessageBox.warning(
                 self,
-                "Verification Error",
-                f"Failed to verify route: {str(e)}"
+                "Invalid Input",
+                "Please select a valid departure airport from the list"
             )
+            return
+        
+        try:
+            arrival_iata = extract_iata(arrival)
+        except:
+            QMessageBox.warning(
+                self,
+                "Invalid Input",
+                "Please select a valid arrival airport from the list"
+            )
+            return
+        
+        if self.verify_worker is not None:
+            self.verify_worker.cancel()
+        self.verify_worker = run_in_background(
+            self.run_verification,
+            airline, aircraft, departure_iata, arrival_iata,
+            on_result=self.on_verification_done,
+            on_error=self.on_verification_failed
+        )
+    
+    def run_verification(self, airline, aircraft, departure_iata, arrival_iata):
+        routes = load_routes(airline)
+        return verify_route(routes, departure_iata, arrival_iata, aircraft, airline)
+    
+    def on_verification_done(self, result):
+        if not self.is_current_worker(self.verify_worker):
+            return
+        self.verify_worker = None
+        self.verification_panel.display_result(result)
+    
+    def on_verification_failed(self, error):
+        if not self.is_current_worker(self.verify_worker):
+            return
+        self.verify_worker = None
+        QMessageBox.critical(
+            self,
+            "Verification Error",
+            f"Failed to verify route: {error}"
+        )
     
     def on_verification_airline_changed(self):
         airline_text = self.verification_panel.airline_input.text().strip()
         
         airline_files = get_airline_files()
         if airline_text in airline_files:
-            try:
-                routes = load_routes(airline_text)
-                airport_index = build_airport_index(routes)
-                airport_choices = get_airport_choices(airport_index)
-                self.verification_panel.set_airport_choices(airport_choices)
-            except Exception as e:
-                self.verification_panel.set_airport_choices([])
+            if self.verification_airline_worker is not None:
+                self.verification_airline_worker.cancel()
+            self.verification_airline_worker = run_in_background(
+                self.read_airport_choices,
+                airline_text,
+                on_result=self.on_verification_airports_loaded,
+                on_error=self.on_verification_airports_failed
+            )
+    
+    def read_airport_choices(self, airline_name):
+        routes = load_routes(airline_name)
+        airport_index = build_airport_index(routes)
+        airport_choices = get_airport_choices(airport_index)
+        # The search index takes longer to build than the choices, so it is made here too
+        return airport_choices, AirportSearchIndex.from_choices(airport_choices)
+    
+    def on_verification_airports_loaded(self, result):
+        if not self.is_current_worker(self.verification_airline_worker):
+            return
+        self.verification_airline_worker = None
+        self.verification_panel.set_airport_choices(*result)
+    
+    def on_verification_airports_failed(self, error):
+        if not self.is_current_worker(self.verification_airline_worker):
+            return
+        self.verification_airline_worker = None
+        self.verification_panel.set_airport_choices([])
@@ -1,7 +1,9 @@
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QLabel, 
                                QComboBox, QLineEdit, QCompleter)
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer, QStringListModel
 from core.route_loader import get_airline_files, get_all_aircraft, get_airline_aircraft
+from core.airport_search import AirportSearchIndex
+from gui.airport_completer import AirportCompleter
 
 
 class TopLeftPanel(QWidget):
@@ -10,6 +12,7 @@ class TopLeftPanel(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.airport_choices = []
+        self.airlines_loaded = False
         self.init_ui()
     
     def init_ui(self):
@@ -35,10 +38,6 @@ class TopLeftPanel(QWidget):
         self.airline_completer.activated.connect(self.airline_changed.emit)
         self.airline_completer.activated.connect(self.update_aircraft_list)
         
-        from PySide6.QtCore import QStringListModel
-        airline_model = QStringListModel(list(get_airline_files().keys()))
-        self.airline_completer.setModel(airline_model)
-        
         layout.addWidget(airline_label)
         layout.addWidget(self.airline_input)
         
@@ -47,10 +46,7 @@ class TopLeftPanel(QWidget):
         self.departure_input = QLineEdit()
         self.departure_input.setPlaceholderText("Type to search (or leave blank for random)...")
         
-        self.completer = QCompleter()
-        self.completer.setCaseSensitivity(Qt.CaseInsensitive)
-        self.completer.setFilterMode(Qt.MatchContains)
-        self.departure_input.setCompleter(self.completer)
+        self.completer = AirportCompleter(self.departure_input)
         
         layout.addWidget(departure_label)
         layout.addWidget(self.departure_input)
@@ -65,12 +61,21 @@ class TopLeftPanel(QWidget):
         layout.addStretch()
         self.setLayout(layout)
     
-    def set_airport_choices(self, choices):
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Fill the airline list after the first frame so reading configs doesn't delay the window
+        if not self.airlines_loaded:
+            self.airlines_loaded = True
+            QTimer.singleShot(0, self.load_airlines)
+    
+    def load_airlines(self):
+        self.airline_completer.setModel(QStringListModel(list(get_airline_files().keys())))
+    
+    def set_airport_choices(self, choices, search_index=None):
         self.airport_choices = choices
-        self.completer.setModel(None)
-        from PySide6.QtCore import QStringListModel
-        model = QStringListModel(choices)
-        self.completer.setModel(model)
+        if search_index is None:
+            search_index = AirportSearchIndex.from_choices(choices)
+        self.completer.airport_model.set_index(search_index)
     
     def update_aircraft_list(self, airline_name=None):
         if airline_name is None:
@@ -0,0 +1,117 @@
+from PySide6.QtCore import QObject, QTimer, Signal
+from core.vatsim import get_vatsim_feed, format_controller, VATSIM_MIN_REFRESH_SECONDS
+from gui.workers import run_in_background
+
+
+class ControllerSubscription(QObject):
+    """Live controller list for one airport, kept current by the shared VatsimPoller.
+
+    updated(added, removed) fires after the first poll and then only when the
+    list changes; controllers always holds the full current list.
+    """
+    updated = Signal(list, list)
+
+    def __init__(self, poller, codes):
+        super().__init__()
+        self.poller = poller
+        self.codes = codes
+        self.controllers = []
+        self.loaded = False
+
+    def cancel(self):
+        self.poller.unsubscribe(self)
+
+    def apply(self, controllers):
+        if self.loaded and controllers == self.controllers:
+            return
+        previous = set(self.controllers)
+        current = set(controllers)
+        added = [c for c in controllers if c not in previous]
+        removed = [c for c in self.controllers if c not in current]
+        self.controllers = controllers
+        self.loaded = True
+        self.updated.emit(added, removed)
+
+
+class VatsimPoller(QObject):
+    """One poll loop over the VATSIM feed shared by every panel and window.
+
+    Polls run on the thread pool and are timed to the feed's refresh cadence.
+    Airports watched by several subscribers are looked up once per poll, and
+    the timer stops when nobody is subscribed.
+    """
+    _instance = None
+
+    def __init__(self, feed=None):
+        super().__init__()
+        self.feed = feed or get_vatsim_feed()
+        self.subscriptions = []
+        self.worker = None
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.poll_now)
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def subscribe(self, *codes):
+        """Watch the controllers whose callsigns start with any of codes (ICAO and/or IATA)."""
+        codes = tuple(sorted({code.strip().upper() for code in codes if code and code.strip()}))
+        subscription = ControllerSubscription(self, codes)
+        self.subscriptions.append(subscription)
+        # New airports shouldn't wait for the next scheduled poll
+        self.poll_now()
+        return subscription
+
+    def unsubscribe(self, subscription):
+        if subscription in self.subscriptions:
+            self.subscriptions.remove(subscription)
+        if not self.subscriptions:
+            self.timer.stop()
+
+    def poll_now(self):
+        if self.worker is not None or not self.subscriptions:
+            return
+        self.timer.stop()
+        watched = {subscription.codes for subscription in self.subscriptions}
+        self.worker = run_in_background(
+            self.lookup,
+            watched,
+            on_result=self.on_polled,
+            on_error=self.on_poll_failed
+        )
+
+    def lookup(self, watched):
+        # Runs on a worker thread; snapshot() only hits the network once the feed is due
+        snapshot = self.feed.snapshot()
+        return {
+            codes: [format_controller(c) for c in snapshot.controllers_at(*codes)]
+            for codes in watched
+        }
+
+    def on_polled(self, results):
+        self.worker = None
+        for subscription in list(self.subscriptions):
+            controllers = results.get(subscription.codes)
+            if controllers is None:
+                # Subscribed while this poll was running
+                self.poll_now()
+                continue
+            subscription.apply(controllers)
+        self.schedule(self.feed.seconds_until_refresh())
+
+    def on_poll_failed(self, error):
+        self.worker = None
+        print(f"Error polling VATSIM: {error}")
+        # Show "no controllers" rather than a spinner forever; later polls fill the lists in
+        for subscription in list(self.subscriptions):
+            if not subscription.loaded:
+                subscription.apply([])
+        self.schedule(VATSIM_MIN_REFRESH_SECONDS)
+
+    def schedule(self, seconds):
+        if self.subscriptions and self.worker is None:
+            self.timer.start(int(max(1, seconds) * 1000))
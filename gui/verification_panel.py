@@ -3,6 +3,8 @@ from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                                QCompleter, QGroupBox)
 from PySide6.QtCore import Qt, Signal, QStringListModel
 from core.route_loader import get_airline_files, get_all_aircraft, get_airline_aircraft
+from core.airport_search import AirportSearchIndex
+from gui.airport_completer import AirportCompleter
 
 
 class VerificationPanel(QWidget):
@@ -11,6 +13,7 @@ class VerificationPanel(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.airport_choices = []
+        self.airlines_loaded = False
         self.init_ui()
     
     def init_ui(self):
@@ -30,9 +33,6 @@ class VerificationPanel(QWidget):
         self.airline_input.setCompleter(self.airline_completer)
         self.airline_completer.activated.connect(self.update_aircraft_list)
         
-        airline_model = QStringListModel(list(get_airline_files().keys()))
-        self.airline_completer.setModel(airline_model)
-        
         input_layout.addWidget(airline_label)
         input_layout.addWidget(self.airline_input)
         
@@ -50,10 +50,7 @@ class VerificationPanel(QWidget):
         self.departure_input = QLineEdit()
         self.departure_input.setPlaceholderText("Type to search airports...")
         
-        self.departure_completer = QCompleter()
-        self.departure_completer.setCaseSensitivity(Qt.CaseInsensitive)
-        self.departure_completer.setFilterMode(Qt.MatchContains)
-        self.departure_input.setCompleter(self.departure_completer)
+        self.departure_completer = AirportCompleter(self.departure_input)
         
         input_layout.addWidget(departure_label)
         input_layout.addWidget(self.departure_input)
@@ -63,10 +60,7 @@ class VerificationPanel(QWidget):
         self.arrival_input = QLineEdit()
         self.arrival_input.setPlaceholderText("Type to search airports...")
         
-        self.arrival_completer = QCompleter()
-        self.arrival_completer.setCaseSensitivity(Qt.CaseInsensitive)
-        self.arrival_completer.setFilterMode(Qt.MatchContains)
-        self.arrival_input.setCompleter(self.arrival_completer)
+        self.arrival_completer = AirportCompleter(self.arrival_input)
         
         input_layout.addWidget(arrival_label)
         input_layout.addWidget(self.arrival_input)
@@ -105,6 +99,13 @@ class VerificationPanel(QWidget):
         
         self.setLayout(main_layout)
     
+    def showEvent(self, event):
+        super().showEvent(event)
+        # airline_files.json is read the first time the tab is opened rather than at startup
+        if not self.airlines_loaded:
+            self.airlines_loaded = True
+            self.airline_completer.setModel(QStringListModel(list(get_airline_files().keys())))
+    
     def update_aircraft_list(self, airline_name=None):
         if airline_name is None:
             airline_name = self.airline_input.text().strip()
@@ -124,16 +125,14 @@ class VerificationPanel(QWidget):
         
         self.aircraft_combo.setCurrentIndex(0)
     
-    def set_airport_choices(self, choices):
+    def set_airport_choices(self, choices, search_index=None):
         self.airport_choices = choices
         
-        self.departure_completer.setModel(None)
-        departure_model = QStringListModel(choices)
-        self.departure_completer.setModel(departure_model)
-
-        self.arrival_completer.setModel(None)
-        arrival_model = QStringListModel(choices)
-        self.arrival_completer.setModel(arrival_model)
+        # Both fields search the same airports, so they share one index
+        if search_index is None:
+            search_index = AirportSearchIndex.from_choices(choices)
+        self.departure_completer.airport_model.set_index(search_index)
+        self.arrival_completer.airport_model.set_index(search_index)
     
     def on_verify_clicked(self):
         airline = self.airline_input.text().strip()
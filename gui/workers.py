@@ -0,0 +1,71 @@
+import threading
+import traceback
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+
+class WorkerSignals(QObject):
+    result = Signal(object)
+    error = Signal(str)
+    progress = Signal(int, int)
+    finished = Signal()
+
+
+class Worker(QRunnable):
+    """Runs fn(*args, **kwargs) on the shared QThreadPool.
+
+    With pass_worker=True the worker is passed as the first argument so the
+    function can call report_progress() and check is_cancelled(). Once
+    cancelled, a worker never emits result or error.
+    """
+
+    def __init__(self, fn, *args, pass_worker=False, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.pass_worker = pass_worker
+        self.signals = WorkerSignals()
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def is_cancelled(self):
+        return self._cancelled.is_set()
+
+    def report_progress(self, done, total):
+        if not self.is_cancelled():
+            self.signals.progress.emit(done, total)
+
+    def run(self):
+        try:
+            if self.pass_worker:
+                result = self.fn(self, *self.args, **self.kwargs)
+            else:
+                result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            if not self.is_cancelled():
+                traceback.print_exc()
+                self.signals.error.emit(str(e))
+        else:
+            if not self.is_cancelled():
+                self.signals.result.emit(result)
+        finally:
+            self.signals.finished.emit()
+
+
+def run_in_background(fn, *args, on_result=None, on_error=None, on_progress=None, pass_worker=False, **kwargs):
+    """Start fn on the global thread pool and return its Worker.
+
+    Callbacks should be methods of a QObject (usually the calling panel) so
+    Qt delivers them on that object's thread, i.e. the UI thread.
+    """
+    worker = Worker(fn, *args, pass_worker=pass_worker, **kwargs)
+    if on_result is not None:
+        worker.signals.result.connect(on_result)
+    if on_error is not None:
+        worker.signals.error.connect(on_error)
+    if on_progress is not None:
+        worker.signals.progress.connect(on_progress)
+    QThreadPool.globalInstance().start(worker)
+    return worker
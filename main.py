@@ -1,7 +1,12 @@
 import sys
 import os
+import time
 import logging
 
+PROCESS_STARTED = time.perf_counter()
+
+from core.startup import STARTUP_BUDGETS_MS, STARTUP_RESULT_PREFIX, startup_check_enabled
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -10,12 +15,45 @@ logging.basicConfig(
     ]
 )
 
+logger = logging.getLogger(__name__)
+
+
+def report_startup_time(mode='gui'):
+    elapsed_ms = (time.perf_counter() - PROCESS_STARTED) * 1000
+    budget = STARTUP_BUDGETS_MS[mode]
+    if startup_check_enabled():
+        print(f"{STARTUP_RESULT_PREFIX}{elapsed_ms:.1f}", flush=True)
+    elif elapsed_ms > budget:
+        logger.warning(f"Startup took {elapsed_ms:.0f} ms, over the {budget} ms budget")
+    else:
+        logger.info(f"Startup took {elapsed_ms:.0f} ms (budget {budget} ms)")
+
+
 def main():    
     if len(sys.argv) > 1 and sys.argv[1] == '-cli':
         from core.cli import run_cli
-        run_cli()
+        on_ready = None
+        if startup_check_enabled():
+            # Stop at the first prompt; there is no terminal to answer it
+            def on_ready():
+                report_startup_time('cli')
+                sys.exit(0)
+        run_cli(on_ready)
+    elif len(sys.argv) > 1 and sys.argv[1] == '-schedule':
+        from core.schedule import run_schedule_cli
+        run_schedule_cli(sys.argv[2:])
+    elif len(sys.argv) > 1 and sys.argv[1] == '-batch':
+        from core.batch import run_batch_cli
+        sys.exit(run_batch_cli(sys.argv[2:]))
+    elif len(sys.argv) > 1 and sys.argv[1] == '-serve':
+        from core.api_server import run_api_cli
+        run_api_cli(sys.argv[2:])
+    elif len(sys.argv) > 1 and sys.argv[1] == '-startup-report':
+        from core.startup import run_startup_report
+        sys.exit(run_startup_report(sys.argv[2:]))
     else:
         from PySide6.QtWidgets import QApplication
+        from PySide6.QtCore import QTimer
         from gui.main_window import MainWindow
         
         app = QApplication(sys.argv)
@@ -23,6 +61,14 @@ def main():
         
         window = MainWindow()
         window.show()
+
+        def on_first_frame():
+            report_startup_time('gui')
+            if startup_check_enabled():
+                app.quit()
+
+        # Fires once the event loop is running, i.e. after the first frame is queued
+        QTimer.singleShot(0, on_first_frame)
         
         sys.exit(app.exec())
 
@@ -0,0 +1,51 @@
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubResponse:
+    def __init__(self, body=b"", status=200, headers=None):
+        self.body = body.encode("utf-8") if isinstance(body, str) else body
+        self.status = status
+        self.headers = headers or {}
+
+
+@contextmanager
+def serve(routes):
+    """Serve canned responses on 127.0.0.1 for the duration of the block.
+
+    routes maps a request path to a StubResponse, or to a callable taking the
+    request handler and returning one. Every request is recorded in
+    server.requests as (path, headers).
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            path = self.path.split("?")[0]
+            server.requests.append((self.path, dict(self.headers)))
+            response = routes.get(path)
+            if callable(response):
+                response = response(self)
+            if response is None:
+                response = StubResponse(b"not found", status=404)
+
+            self.send_response(response.status)
+            for name, value in response.headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(response.body)))
+            self.end_headers()
+            self.wfile.write(response.body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.requests = []
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,87 @@
+import sys
+import os
+import json
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pytest
+
+from core import lookups
+from test_route_table import make_route
+
+ROUTES_BY_AIRLINE = {
+    "Test Air": [make_route("LHR", "JFK", 420, ["A388"]), make_route("LHR", "DUB", 70, ["A320"])],
+    "Other Air": [make_route("DUB", "CDG", 90, ["A320"])],
+}
+
+# Runs in a subprocess: widgets need a QApplication, and other tests already made a QCoreApplication
+PANEL_CHECK = """
+import json, sys, time
+from PySide6.QtWidgets import QApplication
+from core import lookups, route_loader
+from gui.airline_generator_panel import AirlineGeneratorPanel
+
+airline_files, config_dir = json.loads(sys.argv[1])
+route_loader._airline_files = airline_files
+lookups._config_path = lambda filename: config_dir + "/" + filename
+
+app = QApplication([])
+panel = AirlineGeneratorPanel()
+# Give an eager load time to finish before checking that none happened
+deadline = time.monotonic() + 0.3
+while time.monotonic() < deadline:
+    app.processEvents()
+    time.sleep(0.01)
+loaded_before_show = lookups._airport_catalog is not None
+
+panel.show()
+deadline = time.monotonic() + 10
+while panel.airports_worker is not None and time.monotonic() < deadline:
+    app.processEvents()
+    time.sleep(0.01)
+
+# The airports the panel collected before the catalog existed: every ICAO code in every route file
+eager = set()
+for airline_name in airline_files:
+    for route in route_loader.load_routes(airline_name, use_cache=False):
+        eager.update(code for code in (route.get("from_icao"), route.get("to_icao")) if code)
+
+model = panel.departure_completer.airport_model
+print(json.dumps({
+    "loaded_before_show": loaded_before_show,
+    "lazy": sorted(panel.all_airports),
+    "eager": sorted(eager),
+    "choices": [model.search_index.value(i) for i in model.matches]
+}))
+"""
+
+
+def run_panel(tmp_path):
+    airline_files = {}
+    for airline_name, routes in ROUTES_BY_AIRLINE.items():
+        route_file = tmp_path / f"{airline_name.lower().replace(' ', '_')}_routes.json"
+        route_file.write_text(json.dumps({"airline": airline_name, "routes": routes}), encoding="utf-8")
+        airline_files[airline_name] = str(route_file)
+
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    result = subprocess.run(
+        [sys.executable, "-c", PANEL_CHECK, json.dumps([airline_files, str(tmp_path)])],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True, timeout=60
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("catalog_saved", [True, False])
+def test_airport_catalog_loads_on_first_show(tmp_path, monkeypatch, catalog_saved):
+    pytest.importorskip("PySide6.QtWidgets")
+    if catalog_saved:
+        monkeypatch.setattr(lookups, "_config_path", lambda filename: str(tmp_path / filename))
+        lookups.save_lookup(lookups.build_airport_catalog(ROUTES_BY_AIRLINE), "airport_catalog.json")
+
+    # Without a saved catalog the panel falls back to scanning the route files
+    result = run_panel(tmp_path)
+    assert not result["loaded_before_show"]
+    assert result["lazy"] == result["eager"] == ["XCDG", "XDUB", "XJFK", "XLHR"]
+    assert sorted(result["choices"]) == result["eager"]
@@ -0,0 +1,91 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from core.airport_search import AirportSearchIndex, parse_airport_choice
+from core.route_loader import build_airport_index, get_airport_choices
+from test_route_table import make_route
+
+CHOICES = [
+    "LHR — London Heathrow (EGLL)",
+    "LGW — London Gatwick (EGKK)",
+    "LCY — London City (EGLC)",
+    "EDI — Edinburgh (EGPH)",
+    "DEL — Indira Gandhi International (VIDP)",
+    "LIS — Lisbon Humberto Delgado (LPPT)",
+    "OLB — Olbia Costa Smeralda (LIEO)",
+]
+
+
+def values(index, query):
+    return [index.value(i) for i in index.search(query)]
+
+
+def test_parse_airport_choice():
+    choices = get_airport_choices(build_airport_index([make_route("LHR", "CDG", 60, ["A320"])]))
+    assert parse_airport_choice(choices[1]) == ("LHR", "XLHR", "LHR Airport")
+    assert parse_airport_choice("XYZ") == ("XYZ", "", "")
+
+
+@pytest.mark.parametrize("query", ["lo", "LON", "don h", "gat", "(eg", "el", "on c", "zzz"])
+def test_search_matches_contains_filter(query):
+    index = AirportSearchIndex.from_choices(CHOICES)
+    expected = {choice for choice in CHOICES if query.lower() in choice.lower()}
+    assert set(values(index, query)) == expected
+
+
+def test_search_ranks_codes_before_names():
+    index = AirportSearchIndex.from_choices(CHOICES)
+    # Exact IATA, then the ICAO prefix, then the name word, then mid-word hits
+    assert values(index, "del") == [
+        "DEL — Indira Gandhi International (VIDP)",
+        "LIS — Lisbon Humberto Delgado (LPPT)",
+    ]
+    assert values(index, "eg")[:4] == [
+        "EDI — Edinburgh (EGPH)",
+        "LCY — London City (EGLC)",
+        "LGW — London Gatwick (EGKK)",
+        "LHR — London Heathrow (EGLL)",
+    ]
+    # A single character matches the start of a code or word
+    assert values(index, "l")[:3] == ["LCY — London City (EGLC)", "LGW — London Gatwick (EGKK)",
+                                      "LHR — London Heathrow (EGLL)"]
+    assert "EDI — Edinburgh (EGPH)" not in values(index, "l")
+    assert len(index.search("")) == len(CHOICES)
+
+
+def test_catalog_index_completes_icao_codes():
+    index = AirportSearchIndex.from_catalog({
+        "EGLL": {"iata": "LHR", "name": "London Heathrow"},
+        "LPPT": {"iata": "LIS", "name": "Lisbon"},
+    })
+    assert values(index, "heath") == ["EGLL"]
+    assert values(index, "lis") == ["LPPT"]
+    assert index.display(index.search("lppt")[0]) == "LPPT — Lisbon (LIS)"
+
+
+def test_completer_model_pages_ranked_matches():
+    pytest.importorskip("PySide6")
+    from PySide6.QtCore import QCoreApplication, QModelIndex, Qt
+    from gui.airport_completer import AirportCompleterModel, FETCH_BATCH_SIZE
+
+    QCoreApplication.instance() or QCoreApplication([])
+    choices = [f"A{i:02d} — Airport {i} (ZA{i:02d})" for i in range(FETCH_BATCH_SIZE + 20)]
+    model = AirportCompleterModel()
+    model.set_choices(choices)
+    assert model.rowCount() == FETCH_BATCH_SIZE
+    assert model.canFetchMore(QModelIndex())
+    model.fetchMore(QModelIndex())
+    assert model.rowCount() == len(choices)
+
+    model.set_query("a07")
+    assert model.rowCount() == 1
+    assert model.data(model.index(0), Qt.EditRole) == choices[7]
+
+    # Switching airline keeps the model and the typed query
+    model.set_choices(CHOICES)
+    model.set_query("heathrow")
+    assert model.data(model.index(0), Qt.DisplayRole) == CHOICES[0]
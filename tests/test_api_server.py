@@ -0,0 +1,80 @@
+import sys
+import os
+import json
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import api_server, logic
+from core.route_table import RouteTable
+from test_route_table import make_route
+
+ROUTES = RouteTable([
+    make_route("LHR", "DUB", 70, ["A320"]),
+    make_route("LHR", "CDG", 65, ["A320"]),
+    make_route("LHR", "JFK", 420, ["A388"]),
+])
+
+
+@pytest.fixture
+def server(monkeypatch):
+    monkeypatch.setattr(logic, "_flight_number_config",
+                        {"test air": {"prefix": "TST", "icao_ranges": {}, "default_range": [100, 199]}})
+    monkeypatch.setattr(logic, "_flight_number_tables", None)
+    monkeypatch.setattr(api_server, "get_airline_files", lambda: {"Test Air": "data/test_air_routes.json"})
+    monkeypatch.setattr(api_server, "load_routes", lambda airline: ROUTES)
+
+    server = api_server.make_api_server(port=0)
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def get(server, path):
+    try:
+        with urllib.request.urlopen(server.url + path) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_route_and_lookup_endpoints(server):
+    status, route = get(server, "/route?airline=Test%20Air&aircraft=A320&origin=lhr&max_time=66")
+    assert status == 200
+    assert route["to_code"] == "CDG" and route["estimated_time_min"] == 65
+    assert "orig=XLHR&dest=XCDG" in route["simbrief_url"]
+
+    status, result = get(server, "/verify?airline=Test%20Air&from=LHR&to=JFK&aircraft=A388")
+    assert status == 200 and result["valid"]
+
+    status, result = get(server, "/airports?airline=Test%20Air")
+    assert result["airports"][0] == "CDG — CDG Airport (XCDG)"
+
+    status, result = get(server, "/simbrief-url?airline=Test%20Air&aircraft=A320&from=egll&to=eidw")
+    prefix, number = result["flight_number"].split()
+    assert f"airline=TST&fltnum={number}&type=A320&orig=EGLL&dest=EIDW" in result["url"]
+
+
+def test_errors_are_json(server):
+    assert get(server, "/route?airline=Nobody&aircraft=A320") == (404, {"error": "Unknown airline: Nobody"})
+    assert get(server, "/route?airline=Test%20Air") == (400, {"error": "Missing parameter: aircraft"})
+    assert get(server, "/route?airline=Test%20Air&aircraft=A320&max_time=soon")[0] == 400
+    assert get(server, "/route?airline=Test%20Air&aircraft=A388&max_time=60")[0] == 404
+    assert get(server, "/missing")[0] == 404
+
+
+def test_concurrent_clients_share_airport_index(server):
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(lambda _: get(server, "/airports?airline=Test%20Air"), range(40)))
+
+    assert all(status == 200 and len(body["airports"]) == 4 for status, body in results)
+    assert len(server.api._airport_indexes) == 1
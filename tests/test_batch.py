@@ -0,0 +1,62 @@
+import sys
+import os
+import json
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from core import batch, logic
+from core.route_table import RouteTable
+from test_route_table import make_route
+
+
+def make_saved_route(origin, dest, minutes, aircraft):
+    # Route files carry the split time for routes of an hour or more
+    route = make_route(origin, dest, minutes, aircraft)
+    if minutes >= 60:
+        route["estimated_time"] = {"hours": minutes // 60, "minutes": minutes % 60}
+    return route
+
+
+ROUTES = RouteTable([
+    make_saved_route("LHR", "DUB", 70, ["A320"]),
+    make_saved_route("LHR", "CDG", 65, ["A320"]),
+    make_saved_route("LHR", "JFK", 420, ["A388"]),
+])
+
+
+def use_airline(monkeypatch):
+    monkeypatch.setattr(logic, "_flight_number_config",
+                        {"test air": {"prefix": "TST", "icao_ranges": {}, "default_range": [100, 199]}})
+    monkeypatch.setattr(logic, "_flight_number_tables", None)
+    monkeypatch.setattr(batch, "get_airline_files", lambda: {"Test Air": "data/test_air_routes.json"})
+    monkeypatch.setattr(batch, "load_routes", lambda airline: ROUTES)
+
+
+def test_batch_prints_json_lines(monkeypatch, capsys):
+    use_airline(monkeypatch)
+    assert batch.run_batch_cli(["--airline", "Test Air", "--aircraft", "A320", "--origin", "XLHR",
+                                "--max-time", "66", "--count", "3", "--seed", "1"]) == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 3
+    for line in lines:
+        record = json.loads(line)
+        assert record["to_code"] == "CDG"
+        assert record["time"] == "1h 5m"
+        assert record["estimated_time_min"] == 65
+        prefix, number = record["flight_number"].split()
+        assert f"airline={prefix}&fltnum={number}&type=A320&orig=XLHR&dest=XCDG" in record["simbrief_url"]
+
+
+def test_batch_reports_no_routes(monkeypatch, capsys):
+    use_airline(monkeypatch)
+    assert batch.run_batch_cli(["--airline", "Test Air", "--aircraft", "A388", "--max-time", "60"]) == 1
+    assert capsys.readouterr().out == ""
+
+
+def test_batch_skips_interactive_and_gui_imports():
+    code = "import sys, core.batch; print(sorted(m for m in ('InquirerPy', 'PySide6', 'requests') if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,30 @@
+import sys
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+import bench_core
+from core import route_index, route_loader
+
+
+def test_benchmarks_run_on_synthetic_data():
+    airline_files = route_loader._airline_files
+    report = bench_core.run_benchmarks([200], repeat=1)
+
+    assert report["sizes"] == [200]
+    for name in ("load_routes.json", "load_routes.binary", "build_airport_index", "get_airport_choices",
+                 "filter_routes", "verify_route", "genFlightNum", "find_matching_airlines"):
+        assert report["results"][f"{name}[200]"]["min_s"] > 0
+    # Module state used by the rest of the app is put back
+    assert route_loader._airline_files is airline_files
+    assert route_index._route_index_path is not None and route_index._route_index_path().endswith("route_index.json")
+
+
+def test_compare_reports_flags_slowdowns():
+    baseline = {"results": {"a[1]": {"min_s": 1.0}, "b[1]": {"min_s": 1.0}, "gone[1]": {"min_s": 1.0}}}
+    report = {"results": {"a[1]": {"min_s": 1.1}, "b[1]": {"min_s": 2.0}, "new[1]": {"min_s": 1.0}}}
+
+    rows = bench_core.compare_reports(report, baseline, threshold=1.25)
+    assert [(name, regressed) for name, _, _, _, regressed in rows] == [("a[1]", False), ("b[1]", True)]
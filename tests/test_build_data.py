@@ -0,0 +1,244 @@
+import sys
+import os
+import json
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import buildData
+
+
+def test_routed_files_match_json_dump(tmp_path):
+    context = {
+        "iata_to_icao": {"LHR": "EGLL", "JFK": "KJFK"},
+        "airport_names": {"LHR": "London Heathrow", "JFK": "John F Kennedy"},
+        "iata_to_airline_name": {"BA": "British Airways"},
+        "support_rules": buildData.build_support_rules(["A320", "A388"], {"A320": 0, "A388": 1})
+    }
+    buildData.init_routing_worker(context)
+    routed = buildData.route_origin_batch([
+        ("LHR", {"name": "London Heathrow", "routes": [
+            {"iata": "JFK", "km": 5555, "carriers": [{"iata": "BA"}, {"iata": "XX"}]},
+            {"iata": "CDG", "km": 340, "carriers": [{"iata": "AF"}]}
+        ]}),
+        ("JFK", {"name": "John F Kennedy", "routes": [
+            {"iata": "LHR", "km": 5555, "carriers": [{"iata": "BA"}]}
+        ]})
+    ])
+    assert [airline for airline, _ in routed] == ["British Airways", "British Airways"]
+
+    output_file = str(tmp_path / "british_airways_routes.json")
+    writer = buildData.AirlineRouteWriter(output_file, "British Airways", "BA", "BAW", "SPEEDBIRD", flush_every=1)
+    for _, route_text in routed:
+        writer.write(route_text)
+    assert writer.close()
+
+    with open(output_file, "r", encoding="utf-8") as f:
+        text = f.read()
+    saved = json.loads(text)
+    assert text == json.dumps(saved, indent=2)
+    assert saved["routes"][0]["to_name"] == "John F Kennedy"
+    assert saved["routes"][0]["support_mask"] == 0b11
+    assert saved["routes"][0]["estimated_time"] == {"hours": 6, "minutes": 23}
+
+    assert not buildData.AirlineRouteWriter(str(tmp_path / "none.json"), "X", "X", "XXX", "").close()
+
+
+def test_unchanged_route_file_is_not_rewritten(tmp_path):
+    output_file = str(tmp_path / "test_routes.json")
+
+    def write(routes, previous_hash=None):
+        writer = buildData.AirlineRouteWriter(output_file, "Test", "TT", "TST", "")
+        for route_text in routes:
+            writer.write(route_text)
+        return writer.close(previous_hash), writer.changed
+
+    first_hash, changed = write(['{"from": "LHR"}', '{"from": "JFK"}'])
+    assert changed
+    mtime = os.stat(output_file).st_mtime_ns
+
+    same_hash, changed = write(['{"from": "LHR"}', '{"from": "JFK"}'], first_hash)
+    assert same_hash == first_hash and not changed
+    assert os.stat(output_file).st_mtime_ns == mtime
+    assert not os.path.exists(output_file + ".tmp")
+
+    new_hash, changed = write(['{"from": "LHR"}'], first_hash)
+    assert new_hash != first_hash and changed
+    assert len(json.load(open(output_file))["routes"]) == 1
+
+
+def test_only_airlines_with_changed_inputs_are_rerouted(tmp_path):
+    raw = {
+        "LHR": {"name": "London Heathrow", "routes": [
+            {"iata": "JFK", "km": 5555, "carriers": [{"iata": "BA"}, {"iata": "AA"}]},
+            {"iata": "CDG", "km": 340, "carriers": [{"iata": "AF"}]}
+        ]},
+        "JFK": {"name": "John F Kennedy", "routes": [{"iata": "LHR", "km": 5555, "carriers": [{"iata": "BA"}]}]}
+    }
+    input_file = tmp_path / "airline_routes.json"
+    carriers = {"BA": "British Airways", "AA": "American Airlines", "AF": "Air France"}
+    airline_routes = {name: {"iata": iata, "icao": iata + "X", "callsign": ""} for iata, name in carriers.items()}
+    names = {"LHR": "London Heathrow", "JFK": "John F Kennedy"}
+
+    def hashes(shared="shared"):
+        input_file.write_text(json.dumps(raw), encoding="utf-8")
+        return buildData.hash_airline_inputs(str(input_file), names, carriers, airline_routes, shared)
+
+    first = hashes()
+    assert sorted(first) == ["Air France", "American Airlines", "British Airways"]
+    previous = {}
+    for airline_name, input_hash in first.items():
+        route_file = tmp_path / f"{airline_name}.json"
+        route_file.write_text("{}", encoding="utf-8")
+        previous[airline_name] = {"file": str(route_file), "inputs": input_hash}
+    assert buildData.airlines_to_route(previous, first) == set()
+
+    # A new Air France route leaves the other airlines' slices alone
+    raw["JFK"]["routes"].append({"iata": "CDG", "km": 5830, "carriers": [{"iata": "AF"}]})
+    assert buildData.airlines_to_route(previous, hashes()) == {"Air France"}
+
+    os.remove(previous["American Airlines"]["file"])
+    assert buildData.airlines_to_route(previous, hashes()) == {"Air France", "American Airlines"}
+    assert buildData.airlines_to_route(previous, hashes("new aircraft tables")) == set(carriers.values())
+
+
+def test_airline_matching_mode_is_a_build_input(tmp_path):
+    exact = {"British Airways": {"iata": "BA", "icao": "BAW", "callsign": "SPEEDBIRD"}}
+    # --fuzzy-airlines resolves more names from the same input files
+    fuzzy = dict(exact, **{"Virgin Atlantic Airways": {"iata": "VS", "icao": "VIR", "callsign": "VIRGIN"}})
+    manifest = {"inputs": buildData.hash_build_inputs(exact)}
+    assert buildData.changed_build_inputs(manifest, buildData.hash_build_inputs(exact)) == []
+    assert buildData.changed_build_inputs(manifest, buildData.hash_build_inputs(fuzzy)) == ["airline_matches"]
+
+    previous = {
+        name: {"file": str(tmp_path / f"{name}.json"), "hash": "h", "inputs": "i"}
+        for name in fuzzy
+    }
+    # Turning fuzzy matching off again drops the airline it had matched
+    route_files, airline_hashes = buildData.reuse_airline_outputs(previous, exact)
+    assert list(route_files) == ["British Airways"]
+    assert list(airline_hashes) == ["British Airways"]
+
+
+def test_missing_shared_outputs_are_rebuilt(tmp_path, monkeypatch):
+    outputs = [str(tmp_path / name) for name in ("route_index.json", "airline_lookup.json", "airport_catalog.json")]
+    monkeypatch.setattr(buildData, "SHARED_OUTPUTS", tuple(outputs))
+    for path in outputs:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("{}")
+    manifest = {"shared_outputs": buildData.hash_shared_outputs()}
+    assert buildData.shared_outputs_current(manifest)
+
+    with open(outputs[0], "w", encoding="utf-8") as f:
+        f.write("{")
+    assert not buildData.shared_outputs_current(manifest)
+    manifest = {"shared_outputs": buildData.hash_shared_outputs()}
+    os.remove(outputs[2])
+    assert not buildData.shared_outputs_current(manifest)
+    assert not buildData.outputs_present(manifest, write_binary=False)
+
+
+def test_config_accumulator_writes_once(tmp_path):
+    path = str(tmp_path / "airline_files.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"Old Air": "data/old_air_routes.json"}, f)
+
+    config = buildData.ConfigAccumulator(path)
+    config.set("British Airways", "data/british_airways_routes.json")
+    config.set("easyJet", "data/easyjet_routes.json")
+    with open(path, "r", encoding="utf-8") as f:
+        assert json.load(f) == {"Old Air": "data/old_air_routes.json"}
+
+    config.commit()
+    with open(path, "r", encoding="utf-8") as f:
+        assert json.load(f) == {
+            "Old Air": "data/old_air_routes.json",
+            "British Airways": "data/british_airways_routes.json",
+            "easyJet": "data/easyjet_routes.json"
+        }
+    assert os.listdir(tmp_path) == ["airline_files.json"]
+
+
+def test_logo_downloader_retries_and_revalidates(tmp_path):
+    from tests.http_stub import serve, StubResponse
+
+    png = b"\x89PNG\r\n\x1a\nfake"
+    attempts = {"BAW": 0}
+
+    def baw_logo(handler):
+        attempts["BAW"] += 1
+        if attempts["BAW"] == 1:
+            return StubResponse(b"busy", status=503)
+        if handler.headers.get("If-None-Match") == '"v1"':
+            return StubResponse(status=304)
+        return StubResponse(png, headers={"ETag": '"v1"', "Content-Type": "image/png"})
+
+    routes = {
+        "/BAW.png": baw_logo,
+        "/EZY.png": StubResponse(png, headers={"Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"})
+    }
+    assets_dir = str(tmp_path / "assets")
+    validators_file = str(tmp_path / "assets" / "logo_validators.json")
+
+    with serve(routes) as server:
+        def downloader():
+            return buildData.LogoDownloader(
+                url_template=server.url + "/{icao}.png",
+                assets_dir=assets_dir,
+                validators_file=validators_file,
+                max_workers=4,
+                backoff=0.01
+            )
+
+        first = downloader()
+        logos = first.download_all([("British Airways", "BAW"), ("easyJet", "EZY"), ("Nobody", "NOB"), ("Private", "N/A")])
+        first.close()
+        assert logos == {"British Airways": "British Airways.png", "easyJet": "easyJet.png"}
+        assert first.stats["downloaded"] == 2 and first.stats["failed"] == 1
+        with open(os.path.join(assets_dir, "British Airways.png"), "rb") as f:
+            assert f.read() == png
+
+        second = downloader()
+        assert second.has_validators("British Airways")
+        logos = second.download_all([("British Airways", "BAW"), ("easyJet", "EZY")])
+        second.close()
+
+    assert logos == {"British Airways": "British Airways.png", "easyJet": "easyJet.png"}
+    assert second.stats["not_modified"] == 1 and second.stats["downloaded"] == 1
+    ezy_headers = [headers for path, headers in server.requests if path == "/EZY.png"][-1]
+    assert ezy_headers["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+
+
+def test_airline_name_index_resolution():
+    index = buildData.AirlineNameIndex([
+        {"name": "L", "iata": "", "icao": "LAU", "active": False},
+        {"name": "Iberia Airlines", "iata": "IB", "icao": "IBE", "active": True},
+        {"name": "Iberia Express", "iata": "I2", "icao": "IBS", "active": True},
+        {"name": "Vueling Airlines", "iata": "VY", "icao": "VLG", "active": True},
+        {"name": "Aeroflot Russian Airlines", "iata": "SU", "icao": "AFL", "active": True},
+        {"name": "Aeroflot-Don", "iata": "D9", "icao": "DNV", "active": True},
+        {"name": "Thai AirAsia", "iata": "FD", "icao": "AIQ", "active": True},
+        {"name": "AirAsia", "iata": "AK", "icao": "AXM", "active": True},
+        {"name": "Sky Express", "iata": "G3", "icao": "SEH", "active": True},
+        {"name": "Sky Express", "iata": "XW", "icao": "SXR", "active": True},
+        {"name": "Cubana de Aviación", "iata": "CU", "icao": "CUB", "active": True},
+        {"name": "Nouvel Air Tunisie", "iata": "BJ", "icao": "LBT", "active": True},
+        {"name": "Real Tonga", "iata": "", "icao": "N/A", "active": True},
+    ])
+
+    def resolved(name, **kwargs):
+        airline, method = index.resolve(name, **kwargs)
+        return (airline["icao"] if airline else None), method
+
+    assert resolved("Cubana de Aviacion") == ("CUB", "exact")
+    assert resolved("Sky Express") == ("SXR", "exact")
+    assert resolved("Vueling") == ("VLG", "suffix")
+    assert resolved("Iberia") == ("IBE", "suffix")
+    assert resolved("Aeroflot") == ("AFL", "containing")
+    assert resolved("Thai AirAsia X") == ("AIQ", "contained")
+    assert resolved("Real Tonga") == ("N/A", "exact")
+    assert resolved("Loganair") == (None, None)
+    assert resolved("Nouvelair Tunisie") == (None, None)
+    assert resolved("Nouvelair Tunisie", fuzzy=True) == ("LBT", "fuzzy")
+
+    matches = index.resolve_all(["Iberia", " Iberia\r", "Loganair"])
+    assert matches["Iberia"]["icao"] == "IBE" and matches["Loganair"] is None
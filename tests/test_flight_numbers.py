@@ -0,0 +1,55 @@
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import logic
+
+CONFIG = {
+    "test air": {
+        "prefix": "TST",
+        "icao_ranges": {
+            "EGLL": [[1, 9], [100, 199]],
+            "EGKK": [500, 599]
+        },
+        "default_range": [1000, 9999]
+    }
+}
+
+
+def use_config(monkeypatch):
+    monkeypatch.setattr(logic, "_flight_number_config", CONFIG)
+    monkeypatch.setattr(logic, "_flight_number_tables", None)
+
+
+def test_flight_numbers_stay_in_configured_ranges(monkeypatch):
+    use_config(monkeypatch)
+
+    prefix, flight_no = logic.genFlightNum(" Test Air ", "egll")
+    assert prefix == "TST" and (1 <= flight_no <= 9 or 100 <= flight_no <= 199)
+    assert logic.genFlightNum("Nobody", "EGLL") == "Unknown Airline"
+
+    legs = ["EGLL", "EGKK", "KJFK"] * 200
+    numbers = logic.genFlightNums("Test Air", legs)
+    assert len(numbers) == len(legs)
+    for icao, (prefix, flight_no) in zip(legs, numbers):
+        assert prefix == "TST"
+        if icao == "EGLL":
+            assert 1 <= flight_no <= 9 or 100 <= flight_no <= 199
+        elif icao == "EGKK":
+            assert 500 <= flight_no <= 599
+        else:
+            assert 1000 <= flight_no <= 9999
+
+
+def test_bulk_draws_are_seeded_and_pick_ranges_evenly(monkeypatch):
+    use_config(monkeypatch)
+
+    first = logic.genFlightNums("Test Air", "EGLL", 2000, rng=random.Random(7))
+    second = logic.genFlightNums("Test Air", "EGLL", 2000, rng=random.Random(7))
+    assert first == second and len(first) == 2000
+
+    # Each range is picked equally often regardless of its size, as before
+    low_range = sum(1 for _, flight_no in first if flight_no <= 9)
+    assert 850 < low_range < 1150
@@ -0,0 +1,55 @@
+import sys
+import os
+import io
+import json
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.json_stream import iter_json_object, read_json_members, ChunkReader, write_json_atomic
+
+
+def test_iter_json_object_matches_json_load(tmp_path):
+    data = {
+        "LHR": {"name": "London Heathrow Airport", "routes": [{"iata": "JFK", "km": 5555}]},
+        "ZRH": {"name": "Zürich Airport", "routes": []},
+        "N": 12345,
+        "S": "a \"quoted\" {string}",
+        "E": {}
+    }
+    path = tmp_path / "routes.json"
+    path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    # Tiny chunks force values and numbers to straddle chunk boundaries
+    for chunk_size in (1, 3, 7, 1024):
+        assert dict(iter_json_object(str(path), chunk_size=chunk_size)) == data
+
+    empty = tmp_path / "empty.json"
+    empty.write_text(" { } ", encoding="utf-8")
+    assert list(iter_json_object(str(empty))) == []
+
+
+def test_read_json_members_skips_other_values():
+    data = {
+        "general": {"update_timestamp": "2025-01-01T12:00:00Z", "ratio": 1.25e-3},
+        "pilots": [{"callsign": "BAW1", "remarks": "x [{\"y\"}] \\", "alt": -1.5}, [], {}],
+        "controllers": [{"callsign": "EGLL_TWR", "frequency": "118.500"}],
+        "atis": "never read"
+    }
+    text = json.dumps(data, ensure_ascii=False)
+
+    for chunk_size in (1, 2, 5, 4096):
+        found = read_json_members(io.StringIO(text), ["controllers", "general"], chunk_size=chunk_size)
+        assert found == {"general": data["general"], "controllers": data["controllers"]}
+
+    body = text.encode("utf-8")
+    chunks = [body[i:i + 3] for i in range(0, len(body), 3)]
+    assert read_json_members(ChunkReader(chunks), ["atis", "missing"]) == {"atis": "never read"}
+
+
+def test_write_json_atomic_replaces_whole_file(tmp_path):
+    path = str(tmp_path / "config" / "route_index.json")
+    write_json_atomic(path, {"pairs": {"EGLL": {}}}, indent=None, separators=(',', ':'))
+    write_json_atomic(path, {"pairs": {}})
+    with open(path, "r", encoding="utf-8") as f:
+        assert json.load(f) == {"pairs": {}}
+    assert os.listdir(tmp_path / "config") == ["route_index.json"]
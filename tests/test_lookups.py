@@ -0,0 +1,81 @@
+import sys
+import os
+import json
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from core import lookups, route_loader
+from test_route_table import make_route
+
+AIRLINES = {
+    "Test Air": {"iata": "TA", "icao": "TST", "callsign": "TESTER",
+                 "routes": [make_route("LHR", "JFK", 420, ["A388"]), make_route("LHR", "DUB", 70, ["A320"])]},
+    "Other Air": {"iata": "OA", "icao": "OTH", "callsign": "",
+                  "routes": [make_route("DUB", "LHR", 70, ["A320"])]},
+}
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    (tmp_path / "data").mkdir()
+    (tmp_path / "config").mkdir()
+    airline_files = {}
+    for airline_name, airline_data in AIRLINES.items():
+        route_file = tmp_path / "data" / f"{airline_name.lower().replace(' ', '_')}_routes.json"
+        route_file.write_text(json.dumps(dict(airline_data, airline=airline_name)), encoding="utf-8")
+        airline_files[airline_name] = str(route_file)
+
+    monkeypatch.setattr(route_loader, "_airline_files", airline_files)
+    monkeypatch.setattr(lookups, "get_airline_files", lambda: airline_files)
+    monkeypatch.setattr(lookups, "_config_path", lambda filename: str(tmp_path / "config" / filename))
+    monkeypatch.setattr(lookups, "_airline_lookup", None)
+    monkeypatch.setattr(lookups, "_airport_catalog", None)
+    return tmp_path
+
+
+def build_tables():
+    airlines, routes_by_airline = lookups._scan_airline_files()
+    lookups.save_lookup(lookups.build_airline_lookup(airlines), "airline_lookup.json")
+    lookups.save_lookup(lookups.build_airport_catalog(routes_by_airline), "airport_catalog.json")
+
+
+def check_lookups():
+    assert lookups.get_airline_for_icao("tst") == {"name": "Test Air", "callsign": "TESTER"}
+    assert lookups.get_airline_for_icao("OTH") == {"name": "Other Air", "callsign": ""}
+    assert lookups.get_airline_for_icao("XXX") is None
+    assert lookups.get_airline_for_icao("") is None
+    assert lookups.get_iata_for_airport("xjfk") == "JFK"
+    assert lookups.get_iata_for_airport("XDUB") == "DUB"
+    assert lookups.get_iata_for_airport("XCDG") is None
+    assert list(lookups.get_airport_catalog()) == ["XDUB", "XJFK", "XLHR"]
+    assert lookups.get_airport_catalog()["XLHR"] == {"iata": "LHR", "name": "LHR Airport"}
+
+
+def test_lookups_read_the_saved_tables(data_dir, monkeypatch):
+    build_tables()
+    with open(data_dir / "config" / "airline_lookup.json", encoding="utf-8") as f:
+        assert list(json.load(f)) == ["TST", "OTH"]
+
+    def no_scan():
+        raise AssertionError("route files scanned although the tables exist")
+
+    monkeypatch.setattr(lookups, "_scan_airline_files", no_scan)
+    check_lookups()
+
+
+@pytest.mark.parametrize("missing", ["airline_lookup.json", "airport_catalog.json"])
+def test_missing_table_falls_back_to_route_files(data_dir, missing):
+    build_tables()
+    os.remove(data_dir / "config" / missing)
+    check_lookups()
+
+
+def test_airline_lookup_keeps_first_name_per_icao():
+    lookup = lookups.build_airline_lookup([
+        ("Test Air", "tst", None),
+        ("Test Air Cargo", "TST", "CARGO"),
+        ("No Code", "", "X"),
+    ])
+    assert lookup == {"TST": {"name": "Test Air", "callsign": ""}}
@@ -0,0 +1,58 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from core.rotation import RouteGraph, plan_rotation
+from core.route_table import RouteTable
+from test_route_table import make_route
+
+ROUTES = RouteTable([
+    make_route("LHR", "DUB", 70, ["A320"]),
+    make_route("DUB", "LHR", 75, ["A320"]),
+    make_route("LHR", "CDG", 65, ["A320"]),
+    make_route("CDG", "LHR", 60, ["A320"]),
+    make_route("CDG", "DUB", 90, ["A320"]),
+    make_route("DUB", "CDG", 95, ["A320"]),
+    make_route("LHR", "JFK", 420, ["A388"]),
+    make_route("JFK", "LHR", 400, ["A388"]),
+    make_route("DUB", "ORK", 40, ["A320"]),
+])
+
+
+def check_rotation(rotation, hub, max_duty, turnaround=0):
+    legs = rotation["legs"]
+    assert legs[0]["from"] == hub and legs[-1]["to"] == hub
+    for prev, leg in zip(legs, legs[1:]):
+        assert leg["from"] == prev["to"]
+    flight_time = sum(leg["estimated_time_min"] for leg in legs)
+    assert rotation["flight_time_min"] == flight_time
+    assert rotation["duty_time_min"] == flight_time + turnaround * (len(legs) - 1) <= max_duty
+
+
+def test_return_times_use_shortest_path():
+    graph = RouteGraph(ROUTES, "A320")
+    assert graph.return_times("LHR") == {"LHR": 0, "DUB": 75, "CDG": 60}
+    assert "JFK" not in graph.adjacency
+
+
+def test_rotation_fits_duty_and_aircraft():
+    for seed in range(20):
+        rotation = plan_rotation(ROUTES, "lhr", "A320", 300, min_legs=3, turnaround_min=30, seed=seed)
+        check_rotation(rotation, "LHR", 300, turnaround=30)
+        assert len(rotation["legs"]) == 3
+
+
+def test_no_rotation_when_duty_too_short():
+    assert plan_rotation(ROUTES, "LHR", "A320", 120) is None
+    assert plan_rotation(ROUTES, "LHR", "A388", 800) is None
+    assert plan_rotation(ROUTES, "ORK", "A320", 1000) is None
+    check_rotation(plan_rotation(ROUTES, "LHR", "A388", 820), "LHR", 820)
+
+
+def test_prebuilt_graph_must_match_aircraft():
+    graph = RouteGraph(ROUTES, "A320")
+    check_rotation(plan_rotation(graph, "LHR", "A320", 300, seed=1), "LHR", 300)
+    with pytest.raises(ValueError):
+        plan_rotation(graph, "LHR", "A388", 820)
@@ -0,0 +1,82 @@
+import sys
+import os
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.route_cache import RouteCache
+
+
+def write(path, text):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def test_hits_misses_and_mtime_invalidation():
+    cache = RouteCache(max_entries=4)
+    loads = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "a_routes.json")
+        write(path, "one")
+
+        def loader():
+            loads.append(path)
+            with open(path, 'r', encoding='utf-8') as f:
+                return f.read()
+
+        assert cache.get("A", (path,), loader) == "one"
+        assert cache.get("A", (path,), loader) == "one"
+        assert len(loads) == 1
+
+        write(path, "two!")
+        os.utime(path, ns=(1, 1))
+        assert cache.get("A", (path,), loader) == "two!"
+        assert len(loads) == 2
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["entries"] == 1
+
+
+def test_entry_and_byte_budgets():
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {}
+        for name in "ABC":
+            paths[name] = os.path.join(tmp, f"{name}.json")
+            write(paths[name], "x" * 100)
+
+        cache = RouteCache(max_entries=2, max_bytes=None)
+        for name in "ABC":
+            cache.get(name, (paths[name],), lambda: name)
+        assert cache.stats()["entries"] == 2
+        assert cache.stats()["evictions"] == 1
+
+        cache = RouteCache(max_entries=None, max_bytes=250)
+        cache.get("A", (paths["A"],), lambda: "A")
+        cache.get("B", (paths["B"],), lambda: "B")
+        cache.get("A", (paths["A"],), lambda: "A")
+        cache.get("C", (paths["C"],), lambda: "C")
+        # B was least recently used
+        assert cache.stats()["bytes"] == 200
+        misses = cache.stats()["misses"]
+        cache.get("A", (paths["A"],), lambda: "A")
+        assert cache.stats()["misses"] == misses
+
+
+def test_evicted_and_cleared_values_are_released():
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {}
+        for name in "ABC":
+            paths[name] = os.path.join(tmp, f"{name}.json")
+            write(paths[name], "x" * 100)
+
+        released = []
+        cache = RouteCache(max_entries=2, max_bytes=None, on_evict=released.append)
+        for name in "ABC":
+            cache.get(name, (paths[name],), lambda: name)
+        assert released == ["A"]
+
+        cache.clear()
+        assert sorted(released) == ["A", "B", "C"]
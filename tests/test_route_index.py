@@ -0,0 +1,83 @@
+import sys
+import os
+import json
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from core import route_index
+from core.route_index import build_route_index, save_route_index, find_airlines_for_pair
+from test_route_table import make_route
+
+ROUTES_BY_AIRLINE = {
+    "Test Air": [
+        make_route("LHR", "JFK", 420, ["A388"]),
+        # A second LHR-JFK route for the same airline, flown by a smaller type
+        make_route("LHR", "JFK", 430, ["B78X"]),
+        make_route("LHR", "DUB", 70, ["A320"]),
+    ],
+    "Other Air": [
+        make_route("LHR", "JFK", 425, ["B78X"]),
+    ],
+    "No Codes Air": [
+        dict(make_route("LHR", "JFK", 420, ["A388"]), from_icao=""),
+    ],
+}
+
+
+@pytest.fixture
+def index_file(tmp_path, monkeypatch):
+    path = tmp_path / "route_index.json"
+    monkeypatch.setattr(route_index, "_route_index_path", lambda: str(path))
+    monkeypatch.setattr(route_index, "_route_index", None)
+    monkeypatch.setattr(route_index, "get_airline_files", lambda: dict.fromkeys(ROUTES_BY_AIRLINE))
+    monkeypatch.setattr(route_index, "load_routes", lambda airline, use_cache=True: ROUTES_BY_AIRLINE[airline])
+    return path
+
+
+def airlines(results):
+    return [result["airline"] for result in results]
+
+
+def test_index_lists_each_airline_once_per_pair(index_file):
+    index = build_route_index(ROUTES_BY_AIRLINE)
+    # Routes without both ICAO codes can't be looked up, so their airline isn't listed
+    assert index["airlines"] == ["Test Air", "Other Air"]
+    assert len(index["pairs"]["XLHR"]["XJFK"]) == 3
+    save_route_index(index)
+
+    results = find_airlines_for_pair(" xlhr", "XJFK ")
+    assert airlines(results) == ["Test Air", "Other Air"]
+    assert results[0]["route_details"] == {
+        "from_icao": "XLHR", "from_name": "LHR Airport",
+        "to_icao": "XJFK", "to_name": "JFK Airport",
+        "distance_km": 420 * 14, "estimated_time_min": 420
+    }
+    assert find_airlines_for_pair("XJFK", "XLHR") == []
+
+
+def test_index_filters_by_aircraft_bit(index_file):
+    save_route_index(build_route_index(ROUTES_BY_AIRLINE))
+
+    assert airlines(find_airlines_for_pair("XLHR", "XJFK", "A388")) == ["Test Air"]
+    # Test Air's A388 entry is skipped, so its B78X entry supplies the details
+    results = find_airlines_for_pair("XLHR", "XJFK", "b78x")
+    assert airlines(results) == ["Test Air", "Other Air"]
+    assert results[0]["route_details"]["estimated_time_min"] == 430
+    assert find_airlines_for_pair("XLHR", "XJFK", "A320") == []
+    assert find_airlines_for_pair("XLHR", "XJFK", "ZZZZ") == []
+
+
+@pytest.mark.parametrize("stale", [False, True])
+def test_scan_fallback_without_a_current_index(index_file, stale):
+    if stale:
+        index = build_route_index({})
+        index["version"] = route_index.ROUTE_INDEX_VERSION - 1
+        index_file.write_text(json.dumps(index), encoding="utf-8")
+
+    results = find_airlines_for_pair("XLHR", "XJFK", "B78X")
+    assert airlines(results) == ["Test Air", "Other Air"]
+    assert results[0]["route_details"] is ROUTES_BY_AIRLINE["Test Air"][1]
+    assert airlines(find_airlines_for_pair("XLHR", "XJFK")) == ["Test Air", "Other Air"]
+    assert find_airlines_for_pair("XLHR", "XDUB", "A388") == []
@@ -0,0 +1,169 @@
+import sys
+import os
+import tempfile
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.route_store import write_route_store, RouteStore
+
+
+def make_route(origin, dest, distance_km, minutes, support_mask):
+    route = {
+        "from": origin[0],
+        "from_name": origin[1],
+        "from_icao": origin[2],
+        "to": dest[0],
+        "to_name": dest[1],
+        "to_icao": dest[2],
+        "distance_km": distance_km,
+        "estimated_time_min": minutes
+    }
+    if minutes >= 60:
+        route["estimated_time"] = {"hours": minutes // 60, "minutes": minutes % 60}
+    route["support_mask"] = support_mask
+    return route
+
+
+def test_round_trip_matches_json_routes():
+    lhr = ("LHR", "London Heathrow Airport", "EGLL")
+    jfk = ("JFK", "John F Kennedy International Airport", "KJFK")
+    zrh = ("ZRH", "Zürich Airport", "LSZH")
+    routes = [
+        make_route(lhr, jfk, 5540, 382, 0b100000000000),
+        make_route(jfk, lhr, 5540, 382, 0b100000000000),
+        make_route(lhr, zrh, 788, 55, 0b100000),
+    ]
+    airline_data = {"airline": "Test Air", "iata": "TA", "icao": "TST", "callsign": "TESTER", "routes": routes}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "test_air_routes.bin")
+        write_route_store(path, airline_data)
+        store = RouteStore(path)
+        try:
+            assert len(store) == 3
+            assert list(store) == routes
+            assert store[-1] == routes[-1]
+            assert store[0:2] == routes[0:2]
+            loaded = store.airline_data()
+            assert loaded["callsign"] == "TESTER"
+            assert loaded["icao"] == "TST"
+        finally:
+            store.close()
+
+
+def test_filtering_from_store_columns():
+    from core.logic import filter_routes
+    from core.route_table import RouteTable, get_aircraft_bits
+
+    lhr = ("LHR", "London Heathrow Airport", "EGLL")
+    jfk = ("JFK", "John F Kennedy International Airport", "KJFK")
+    zrh = ("ZRH", "Zürich Airport", "LSZH")
+    a388 = 1 << get_aircraft_bits()["A388"]
+    a320 = 1 << get_aircraft_bits()["A320"]
+    routes = [
+        make_route(lhr, jfk, 5540, 382, a388),
+        make_route(lhr, zrh, 788, 55, a320 | a388),
+        make_route(jfk, lhr, 5540, 382, a388),
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "test_air_routes.bin")
+        write_route_store(path, {"airline": "Test Air", "routes": routes})
+        store = RouteStore(path)
+        try:
+            table = RouteTable(store)
+            assert filter_routes(table, "LHR", "A388", "Test Air") == routes[0:2]
+            assert filter_routes(table, "LHR", "A320", "Test Air") == [routes[1]]
+            assert filter_routes(table, "LHR", "A388", "Test Air", max_time=60) == [routes[1]]
+            assert filter_routes(table, "JFK", "A320", "Test Air") == []
+        finally:
+            store.close()
+
+
+def test_legacy_route_without_support_keys_stays_supported():
+    from core.route_table import route_supports
+
+    lhr = ("LHR", "London Heathrow Airport", "EGLL")
+    zrh = ("ZRH", "Zürich Airport", "LSZH")
+    legacy = make_route(lhr, zrh, 788, 55, None)
+    del legacy["support_mask"]
+    legacy["supports_a388"] = False
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "test_air_routes.bin")
+        write_route_store(path, {"airline": "Test Air", "routes": [legacy]})
+        store = RouteStore(path)
+        try:
+            # Same answers as route_supports gives for the JSON route
+            for code in ("A320", "A388"):
+                assert route_supports(store[0], code) == route_supports(legacy, code)
+        finally:
+            store.close()
+
+
+def test_closed_store_maps_the_file_again_on_use():
+    lhr = ("LHR", "London Heathrow Airport", "EGLL")
+    zrh = ("ZRH", "Zürich Airport", "LSZH")
+    route = make_route(lhr, zrh, 788, 55, 0b100000)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "test_air_routes.bin")
+        write_route_store(path, {"airline": "Test Air", "routes": [route]})
+        store = RouteStore(path)
+        mapping = store._mapped.mmap
+        store.close()
+        assert store.closed and mapping.closed
+        assert store[0] == route
+        store.close()
+
+        write_route_store(path, {"airline": "Test Air", "routes": [route, route]})
+        with pytest.raises(ValueError):
+            store[0]
+        assert store.closed
+
+
+def test_store_evicted_while_another_thread_reads():
+    import threading
+    from core.route_cache import RouteCache
+
+    # Distinct names, so reads keep going to the string table rather than the string cache
+    routes = [
+        make_route((f"A{i}", f"Airport {i}", f"EA{i}"), (f"B{i}", f"Airport {i}b", f"EB{i}"), 788, 55 + i, 0b100000)
+        for i in range(200)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "test_air_routes.bin")
+        write_route_store(path, {"airline": "Test Air", "routes": routes})
+        store = RouteStore(path)
+        cache = RouteCache(max_entries=1, max_bytes=None, on_evict=lambda value: value.close())
+        errors = []
+
+        def read():
+            try:
+                for _ in range(20):
+                    store._strings.clear()
+                    assert list(store) == routes
+            except Exception as e:
+                errors.append(e)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        switch_interval = sys.getswitchinterval()
+        # Switch threads often so a close lands in the middle of a read
+        sys.setswitchinterval(1e-6)
+        for reader in readers:
+            reader.start()
+        try:
+            # Every get evicts and closes the store while the readers are using it
+            while any(reader.is_alive() for reader in readers):
+                cache.get("store", (path,), lambda: store)
+                cache.get("other", (path,), lambda: store)
+        finally:
+            for reader in readers:
+                reader.join()
+            sys.setswitchinterval(switch_interval)
+        assert errors == []
+        assert cache.stats()["evictions"] > 0
+        store.close()
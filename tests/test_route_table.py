@@ -0,0 +1,69 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.logic import filter_routes, verify_route
+from core.route_table import RouteTable, get_aircraft_bits
+
+
+def make_route(origin, dest, minutes, aircraft):
+    support_mask = 0
+    for code in aircraft:
+        support_mask |= 1 << get_aircraft_bits()[code]
+    return {
+        "from": origin,
+        "from_name": f"{origin} Airport",
+        "from_icao": f"X{origin}",
+        "to": dest,
+        "to_name": f"{dest} Airport",
+        "to_icao": f"X{dest}",
+        "distance_km": minutes * 14,
+        "estimated_time_min": minutes,
+        "support_mask": support_mask
+    }
+
+
+ROUTES = [
+    make_route("LHR", "JFK", 420, ["A388", "B78X"]),
+    make_route("LHR", "DUB", 70, ["A320"]),
+    make_route("JFK", "LHR", 400, ["A388"]),
+    make_route("DUB", "LHR", 70, ["A320"]),
+    make_route("LHR", "CDG", 65, ["A320"]),
+]
+
+
+def test_indexes():
+    table = RouteTable(ROUTES)
+    assert table.by_origin["LHR"] == [0, 1, 4]
+    assert table.by_destination["LHR"] == [2, 3]
+    assert table.by_pair[("LHR", "JFK")] == [0]
+    assert table.routes_between("DUB", "LHR") == [ROUTES[3]]
+    assert table.routes_to("JFK") == [ROUTES[0]]
+
+
+def test_departures_for_aircraft():
+    table = RouteTable(ROUTES)
+    assert sorted(table.departures("A388")) == ["JFK", "LHR"]
+    assert sorted(table.departures("A320")) == ["DUB", "LHR"]
+
+
+def test_filter_and_plain_lists_agree():
+    table = RouteTable(ROUTES)
+    assert filter_routes(table, "LHR", "A320", "Test Air") == [ROUTES[1], ROUTES[4]]
+    assert filter_routes(ROUTES, "LHR", "A320", "Test Air", max_time=66) == [ROUTES[4]]
+
+
+def test_verify_route():
+    table = RouteTable(ROUTES)
+    result = verify_route(table, "lhr", "jfk", "A320", "Test Air")
+    assert result["valid"]
+    assert result["route_info"]["to_icao"] == "XJFK"
+    assert "aircraft_notes" in result
+
+    result = verify_route(table, "DUB", "JFK", "A320", "Test Air")
+    assert not result["valid"]
+    assert result["suggestions"] == ["Possible destinations from XDUB: XLHR (~70min)"]
+
+    result = verify_route(table, "CDG", "MAD", "A320", "Test Air")
+    assert len(result["suggestions"]) == 2
@@ -0,0 +1,75 @@
+import sys
+import os
+import io
+import csv
+import json
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import logic
+from core.schedule import generate_schedule, resolve_origin, write_schedule_csv, write_schedule_json
+from core.route_table import RouteTable
+from test_route_table import make_route
+
+ROUTES = RouteTable([
+    make_route("LHR", "DUB", 70, ["A320"]),
+    make_route("DUB", "LHR", 70, ["A320"]),
+    make_route("LHR", "CDG", 65, ["A320"]),
+    make_route("CDG", "LHR", 65, ["A320"]),
+    make_route("CDG", "DUB", 90, ["A320"]),
+    make_route("DUB", "CDG", 90, ["A320"]),
+    make_route("LHR", "JFK", 420, ["A388"]),
+])
+
+CONFIG = {"test air": {"prefix": "TST", "icao_ranges": {}, "default_range": [100, 199]}}
+
+
+def use_config(monkeypatch):
+    monkeypatch.setattr(logic, "_flight_number_config", CONFIG)
+    monkeypatch.setattr(logic, "_flight_number_tables", None)
+
+
+def test_chained_legs_follow_filters(monkeypatch):
+    use_config(monkeypatch)
+    schedule = generate_schedule(ROUTES, "Test Air", "A320", 200, origin_iata="LHR", max_time=80, seed=1)
+
+    assert len(schedule) == 200
+    assert schedule[0]["from"] == "LHR"
+    for prev, leg in zip(schedule, schedule[1:]):
+        assert leg["from"] == prev["to"]
+    for leg in schedule:
+        assert leg["estimated_time_min"] <= 80
+        assert leg["to"] != "JFK"
+        prefix, number = leg["flight_number"].split()
+        assert prefix == "TST" and 100 <= int(number) <= 199
+
+
+def test_seed_is_reproducible(monkeypatch):
+    use_config(monkeypatch)
+    first = generate_schedule(ROUTES, "Test Air", "A320", 50, seed=3)
+    assert first == generate_schedule(ROUTES, "Test Air", "A320", 50, seed=3)
+
+
+def test_unique_destinations_stop_at_dead_end(monkeypatch):
+    use_config(monkeypatch)
+    schedule = generate_schedule(ROUTES, "Test Air", "A320", 10, origin_iata="LHR", unique_destinations=True, seed=2)
+
+    destinations = [leg["to"] for leg in schedule]
+    assert len(destinations) == len(set(destinations)) == 3
+
+
+def test_unchained_legs_and_output(monkeypatch):
+    use_config(monkeypatch)
+    schedule = generate_schedule(ROUTES, "Test Air", "A388", 5, chain=False, seed=4)
+    assert [leg["from"] + leg["to"] for leg in schedule] == ["LHRJFK"] * 5
+    assert resolve_origin(ROUTES, "xlhr") == "LHR"
+    assert resolve_origin(ROUTES, "ZZZ") is None
+
+    out = io.StringIO()
+    write_schedule_csv(schedule, out)
+    rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+    assert [row["leg"] for row in rows] == ["1", "2", "3", "4", "5"]
+
+    out = io.StringIO()
+    write_schedule_json(schedule, out)
+    assert json.loads(out.getvalue()) == schedule
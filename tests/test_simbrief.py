@@ -0,0 +1,94 @@
+import sys
+import os
+import io
+import json
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+pytest.importorskip("requests")
+
+from core.simbrief import SimbriefClient, SimbriefError, read_ofp, OFP_SECTIONS
+from tests.http_stub import serve, StubResponse
+
+
+def saved_ofp(request_id="165000001", flight_number="1234"):
+    # Same member order as a real xml.fetcher.php?json=1 response, with the bulky sections cut down
+    return {
+        "fetch": {"userid": "123456", "static_id": {}, "status": "Success", "time": "0.0123"},
+        "params": {"request_id": request_id, "sequence_id": "a1b2c3", "user_id": "123456", "units": "kgs"},
+        "general": {"icao_airline": "BAW", "flight_number": flight_number, "gc_distance": "1176"},
+        "origin": {"icao_code": "EGLL", "iata_code": "LHR", "name": "London Heathrow"},
+        "destination": {"icao_code": "LPPT", "iata_code": "LIS", "name": "Lisbon"},
+        "navlog": {"fix": [{"ident": f"WPT{i}", "altitude_feet": "36000", "wind_spd": 42.5} for i in range(400)]},
+        "atc": {"callsign": f"BAW{flight_number}", "route": "DET L6 DVR"},
+        "aircraft": {"icao_code": "A320", "reg": "G-EUUA"},
+        "times": {"est_time_enroute": "9300"},
+        "text": {"plan_html": "<div>" + "OFP " * 5000 + "</div>"},
+        "links": {"skyvector": "https://skyvector.com/"}
+    }
+
+
+def test_read_ofp_decodes_only_summary_sections():
+    body = json.dumps(saved_ofp())
+    current_id, sections = read_ofp(io.StringIO(body), chunk_size=97)
+
+    assert current_id == "165000001:a1b2c3"
+    assert sorted(sections) == sorted(OFP_SECTIONS)
+    assert sections["origin"]["icao_code"] == "EGLL"
+    assert sections["times"]["est_time_enroute"] == "9300"
+
+    # The same OFP again stops at params
+    assert read_ofp(io.StringIO(body), known_id=current_id) == (current_id, None)
+
+
+def test_unchanged_ofp_is_served_from_cache(tmp_path):
+    ofps = [saved_ofp()]
+    served = []
+
+    def latest(handler):
+        etag = f'"v{len(ofps)}"'
+        served.append(handler.headers.get("If-None-Match"))
+        if handler.headers.get("If-None-Match") == etag:
+            return StubResponse(status=304)
+        return StubResponse(json.dumps(ofps[-1]), headers={"ETag": etag})
+
+    cache_path = str(tmp_path / "ofp_cache.json")
+    with serve({"/api/xml.fetcher.php": latest}) as server:
+        client = SimbriefClient(f"{server.url}/api/xml.fetcher.php", cache_path=cache_path)
+        first = client.latest_ofp("123456")
+        assert first["general"]["flight_number"] == "1234"
+        assert client.latest_ofp("123456") is first
+        assert served == [None, '"v1"']
+        assert "userid=123456" in server.requests[0][0]
+
+        # A new session picks the validators up from disk
+        reloaded = SimbriefClient(f"{server.url}/api/xml.fetcher.php", cache_path=cache_path)
+        assert reloaded.latest_ofp("123456") == first
+        assert served[-1] == '"v1"'
+
+        ofps.append(saved_ofp(request_id="165000002", flight_number="88"))
+        assert reloaded.latest_ofp("123456")["atc"]["callsign"] == "BAW88"
+
+
+def test_same_ofp_without_validators_is_not_parsed_again():
+    ofps = [saved_ofp()]
+
+    with serve({"/fetcher": lambda handler: StubResponse(json.dumps(ofps[-1]))}) as server:
+        client = SimbriefClient(f"{server.url}/fetcher")
+        first = client.latest_ofp("123456")
+        assert client.latest_ofp("123456") is first
+
+        ofps.append(saved_ofp(request_id="165000002"))
+        assert client.latest_ofp("123456") is not first
+        # Entries are per user
+        assert client.latest_ofp("654321") is not first
+
+
+def test_simbrief_error_status_is_raised():
+    error = {"fetch": {"userid": "0", "status": "Error: Unknown UserID"}}
+
+    with serve({"/fetcher": StubResponse(json.dumps(error), status=400)}) as server:
+        with pytest.raises(SimbriefError, match="Unknown UserID"):
+            SimbriefClient(f"{server.url}/fetcher").latest_ofp("0")
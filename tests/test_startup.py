@@ -0,0 +1,50 @@
+import sys
+import os
+import subprocess
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from core.startup import STARTUP_BUDGETS_MS, measure_cold_start, parse_importtime
+
+# Cold start timings depend on the machine, so the budget checks only run when asked for
+BUDGET_CHECK_ENV = "MSFS_STARTUP_BUDGETS"
+budget_check = pytest.mark.skipif(
+    os.environ.get(BUDGET_CHECK_ENV) != "1",
+    reason=f"set {BUDGET_CHECK_ENV}=1 to check cold start budgets"
+)
+
+IMPORTTIME_SAMPLE = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      2500 |       4100 | core.route_loader
+"""
+
+
+def loaded_modules(module, candidates):
+    code = f"import sys, {module}; print(sorted(m for m in {candidates!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+def test_parse_importtime():
+    assert parse_importtime(IMPORTTIME_SAMPLE) == [(120, 120, "_io"), (2500, 4100, "core.route_loader")]
+
+
+def test_startup_skips_heavy_imports():
+    pytest.importorskip("PySide6.QtWidgets")
+    # Network, browser and prompt libraries are imported when first used, not before the first frame
+    assert loaded_modules("gui.main_window", ("InquirerPy", "PySide6.QtNetwork", "requests", "webbrowser")) == "[]"
+    assert loaded_modules("core.cli", ("InquirerPy", "PySide6", "requests", "webbrowser")) == "[]"
+
+
+@budget_check
+def test_gui_first_frame_within_budget():
+    pytest.importorskip("PySide6.QtWidgets")
+    assert measure_cold_start("gui") <= STARTUP_BUDGETS_MS["gui"]
+
+
+@budget_check
+def test_cli_first_prompt_within_budget():
+    pytest.importorskip("InquirerPy")
+    assert measure_cold_start("cli") <= STARTUP_BUDGETS_MS["cli"]
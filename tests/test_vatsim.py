@@ -0,0 +1,137 @@
+import sys
+import os
+import json
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+pytest.importorskip("requests")
+
+from core import vatsim
+from core.vatsim import fetch_vatsim_controllers, VatsimFeed, VatsimSnapshot
+from tests.http_stub import serve, StubResponse
+
+FEED = {
+    "general": {"update_timestamp": "2025-01-01T12:00:00.0000000Z"},
+    "pilots": [{"callsign": "BAW1", "latitude": 51.4, "longitude": -0.4}],
+    "controllers": [
+        {"callsign": "EGLL_TWR", "frequency": "118.500"},
+        {"callsign": "LHR_N_GND", "frequency": "121.900"},
+        {"callsign": "KJFK_APP", "frequency": "127.400"},
+        {"callsign": "EGKK_TWR", "frequency": "124.225"},
+        {"callsign": "EGLL_ATIS", "frequency": "128.075"},
+    ]
+}
+
+
+@pytest.fixture(autouse=True)
+def fresh_feeds(monkeypatch):
+    # Stub servers can reuse a port, so don't let a feed cached by one test answer the next
+    monkeypatch.setattr(vatsim, "_feeds", {})
+
+
+class Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_fetch_controllers_from_stub():
+    with serve({"/v3/vatsim-data.json": StubResponse(json.dumps(FEED))}) as server:
+        dep, arr = fetch_vatsim_controllers(
+            "EGLL", "LHR", "KJFK", "JFK",
+            url=f"{server.url}/v3/vatsim-data.json"
+        )
+
+    assert [line.split()[0] for line in dep] == ["EGLL_TWR", "LHR_N_GND"]
+    assert [line.split()[0] for line in arr] == ["KJFK_APP"]
+
+
+def test_fetch_controllers_handles_server_errors():
+    with serve({}) as server:
+        assert fetch_vatsim_controllers(
+            "EGLL", "LHR", "KJFK", "JFK",
+            url=f"{server.url}/v3/vatsim-data.json"
+        ) == ([], [])
+
+
+def test_worker_delivers_result_off_the_ui_thread():
+    pytest.importorskip("PySide6")
+    from PySide6.QtCore import QCoreApplication, QEventLoop, QTimer, QThread
+    from gui.workers import run_in_background
+
+    app = QCoreApplication.instance() or QCoreApplication([])
+    results = []
+    threads = []
+    loop = QEventLoop()
+
+    def fetch(url):
+        threads.append(QThread.currentThread())
+        return fetch_vatsim_controllers("EGLL", "LHR", "KJFK", "JFK", url=url)
+
+    with serve({"/v3/vatsim-data.json": StubResponse(json.dumps(FEED))}) as server:
+        worker = run_in_background(fetch, f"{server.url}/v3/vatsim-data.json")
+        worker.signals.result.connect(results.append)
+        worker.signals.finished.connect(loop.quit)
+        QTimer.singleShot(5000, loop.quit)
+        loop.exec()
+
+    assert threads and threads[0] is not app.thread()
+    assert len(results) == 1
+    assert len(results[0][0]) == 2
+
+
+def test_feed_reads_gzipped_response():
+    import gzip
+    body = gzip.compress(json.dumps(FEED).encode("utf-8"))
+    with serve({"/feed.json": StubResponse(body, headers={"Content-Encoding": "gzip"})}) as server:
+        snapshot = VatsimFeed(f"{server.url}/feed.json").snapshot()
+
+    assert snapshot.update_timestamp == FEED["general"]["update_timestamp"]
+    assert snapshot.controllers == FEED["controllers"]
+
+
+def test_snapshot_index_matches_callsign_prefixes():
+    snapshot = VatsimSnapshot.from_feed(FEED)
+    assert [c["callsign"] for c in snapshot.controllers_at("egll", "LHR", "EGLL")] == ["EGLL_TWR", "LHR_N_GND"]
+    assert snapshot.controllers_at("KJFK", None) == [FEED["controllers"][2]]
+    assert snapshot.controllers_at("ZZZZ") == []
+
+
+def test_feed_is_fetched_once_per_update(tmp_path):
+    # Feed generated at 12:00:00; the next version is due 15s later
+    clock = Clock(_timestamp("2025-01-01T12:00:05"))
+    with serve({"/feed.json": StubResponse(json.dumps(FEED))}) as server:
+        feed = VatsimFeed(f"{server.url}/feed.json", cache_path=str(tmp_path / "snapshot.json"), clock=clock)
+        first = feed.snapshot()
+        clock.now += 9
+        assert feed.snapshot() is first
+        assert len(server.requests) == 1
+
+        # A new session reuses the snapshot on disk while it is fresh
+        restarted = VatsimFeed(f"{server.url}/feed.json", cache_path=str(tmp_path / "snapshot.json"), clock=clock)
+        assert [c["callsign"] for c in restarted.snapshot().controllers_at("KJFK")] == ["KJFK_APP"]
+        assert len(server.requests) == 1
+
+        clock.now += 1
+        assert feed.snapshot() is first  # same update_timestamp, so the index is reused
+        assert len(server.requests) == 2
+
+
+def test_feed_keeps_stale_snapshot_when_refresh_fails():
+    clock = Clock(_timestamp("2025-01-01T12:00:00"))
+    responses = [StubResponse(json.dumps(FEED)), StubResponse(b"down", status=503)]
+    with serve({"/feed.json": lambda handler: responses.pop(0) if len(responses) > 1 else responses[0]}) as server:
+        feed = VatsimFeed(f"{server.url}/feed.json", clock=clock)
+        first = feed.snapshot()
+        clock.now += 60
+        assert feed.snapshot() is first
+        assert len(server.requests) == 2
+
+
+def _timestamp(value):
+    from datetime import datetime, timezone
+    return datetime.fromisoformat(value).replace(tzinfo=timezone.utc).timestamp()
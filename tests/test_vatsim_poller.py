@@ -0,0 +1,64 @@
+import sys
+import os
+import json
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("PySide6")
+
+from PySide6.QtCore import QCoreApplication, QEventLoop, QTimer
+from core.vatsim import VatsimFeed
+from gui.vatsim_poller import VatsimPoller
+from tests.http_stub import serve, StubResponse
+
+
+def feed_body(timestamp, callsigns):
+    return json.dumps({
+        "general": {"update_timestamp": timestamp},
+        "pilots": [],
+        "controllers": [{"callsign": callsign, "frequency": "118.500"} for callsign in callsigns]
+    })
+
+
+def wait_for(signal, timeout_ms=5000):
+    loop = QEventLoop()
+    received = []
+
+    def on_signal(*args):
+        received.append(args)
+        loop.quit()
+
+    signal.connect(on_signal)
+    QTimer.singleShot(timeout_ms, loop.quit)
+    loop.exec()
+    signal.disconnect(on_signal)
+    return received[0] if received else None
+
+
+def test_poller_shares_one_feed_and_pushes_changes():
+    QCoreApplication.instance() or QCoreApplication([])
+    bodies = [feed_body("2025-01-01T12:00:00.0000000Z", ["EGLL_TWR", "LHR_GND", "KJFK_APP"])]
+
+    with serve({"/feed.json": lambda handler: StubResponse(bodies[-1])}) as server:
+        poller = VatsimPoller(VatsimFeed(f"{server.url}/feed.json", ttl=0))
+        departure = poller.subscribe("EGLL", "LHR")
+        assert wait_for(departure.updated) == (["EGLL_TWR             118.500", "LHR_GND              118.500"], [])
+
+        # A second window watching the same airport joins the same poll loop
+        again = poller.subscribe("lhr", "egll")
+        assert again.codes == departure.codes
+        wait_for(again.updated)
+        assert again.controllers == departure.controllers
+
+        bodies.append(feed_body("2025-01-01T12:00:15.0000000Z", ["EGLL_TWR", "EGLL_N_APP", "KJFK_APP"]))
+        poller.poll_now()
+        added, removed = wait_for(departure.updated)
+        assert added == ["EGLL_N_APP           118.500"]
+        assert removed == ["LHR_GND              118.500"]
+
+        departure.cancel()
+        again.cancel()
+        assert not poller.subscriptions and not poller.timer.isActive()